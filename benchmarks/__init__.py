@@ -0,0 +1 @@
+"""Discord/Bedrock 없이 봇을 실행하는 오프라인 부하 테스트 도구"""
@@ -0,0 +1,90 @@
+import io
+import json
+import random
+import threading
+import time
+
+# 피드백 본문 (평가 이모지는 parse_grade가 읽을 수 있도록 맨 앞에 둠)
+FEEDBACK_TEMPLATES = [
+    "✅ 좋은 답변입니다! 핵심 개념을 정확히 짚었어요.\n\n"
+    "실무에서는 모니터링 지표와 함께 확인해 보세요.",
+    "⚠️ 부분적으로 맞아요. 장점은 잘 설명했지만 단점도 함께 생각해 보세요.\n\n"
+    "관련 공식 문서를 한 번 더 읽어 보면 좋아요.",
+    "❌ 다시 생각해 보세요. 질문의 핵심과 조금 다른 방향이에요.\n\n"
+    "기본 개념부터 차근차근 정리해 보세요.",
+]
+
+
+class FakeBedrockError(Exception):
+    """가짜 Bedrock이 일부러 발생시키는 오류 (스로틀링 등)"""
+
+
+class FakeEventStream:
+    """invoke_model_with_response_stream의 응답 본문 흉내 (조각마다 지연)"""
+
+    def __init__(self, chunks, delay):
+        self.chunks = chunks
+        self.delay = delay
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if self.closed:
+                return
+            time.sleep(self.delay)
+            payload = json.dumps({"completion": chunk}).encode()
+            yield {"chunk": {"bytes": payload}}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBedrockClient:
+    """boto3 bedrock-runtime 클라이언트 대신 쓰는 가짜 클라이언트
+
+    호출마다 latency초를 중심으로 jitter 비율만큼 흔들린 시간 동안 (워커 스레드를)
+    잠들고, error_rate 확률로 FakeBedrockError를 발생시킵니다.
+    실제 모델처럼 응답 토큰 한도에 비례해 지연이 늘어납니다 (latency는 500토큰 기준).
+    """
+
+    def __init__(self, latency=0.5, jitter=0.3, error_rate=0.0, chunks=8, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.chunks = chunks
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def _next_call(self, body):
+        """이번 호출의 지연 시간과 오류 여부 결정"""
+        scale = json.loads(body).get("max_tokens_to_sample", 500) / 500
+        with self._lock:
+            self.calls += 1
+            latency = self.latency * scale
+            delay = max(0.0, self.random.gauss(latency, latency * self.jitter))
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            text = self.random.choice(FEEDBACK_TEMPLATES)
+        return delay, failed, text
+
+    def invoke_model(self, body, modelId, accept, contentType):
+        delay, failed, text = self._next_call(body)
+        time.sleep(delay)
+        if failed:
+            raise FakeBedrockError("ThrottlingException: Rate exceeded")
+        payload = json.dumps({"completion": text}).encode()
+        return {"body": io.BytesIO(payload)}
+
+    def invoke_model_with_response_stream(self, body, modelId, accept, contentType):
+        delay, failed, text = self._next_call(body)
+        if failed:
+            time.sleep(delay)
+            raise FakeBedrockError("ThrottlingException: Rate exceeded")
+
+        # 첫 조각까지의 지연을 포함해 전체 시간이 delay가 되도록 나눠서 전송
+        size = max(1, len(text) // self.chunks)
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        return {"body": FakeEventStream(chunks, delay / len(chunks))}
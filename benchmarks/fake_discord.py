@@ -0,0 +1,335 @@
+import asyncio
+import itertools
+from collections import Counter
+from datetime import datetime, timezone
+
+import discord
+
+FEEDBACK_TITLE = "📝 피드백"
+STREAMING_CURSOR = "▌"
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def user_payload(user_id, name, bot=False):
+    return {
+        "id": str(user_id),
+        "username": name,
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+        "bot": bot,
+    }
+
+
+class FakeHTTP:
+    """discord.http.HTTPClient 대신 쓰는 가짜 REST 클라이언트
+
+    실제 요청 대신 rest_latency초를 기다린 뒤 Discord가 돌려줄 법한 payload를 만들고,
+    봇이 보낸 메시지를 FakeDiscord에 알려 응답 대기 중인 시뮬레이션 사용자를 깨웁니다.
+    """
+
+    def __init__(self, discord_, rest_latency=0.0):
+        self.discord = discord_
+        self.rest_latency = rest_latency
+        self.calls = Counter()
+
+    async def _request(self, name):
+        self.calls[name] += 1
+        if self.rest_latency:
+            await asyncio.sleep(self.rest_latency)
+
+    def _bot_message(self, channel_id, message_id, payload):
+        return {
+            "id": str(message_id),
+            "channel_id": str(channel_id),
+            "guild_id": str(self.discord.guild.id),
+            "author": self.discord.bot_user_payload,
+            "content": payload.get("content") or "",
+            "embeds": payload.get("embeds") or [],
+            "attachments": [],
+            "mentions": [],
+            "mention_roles": [],
+            "mention_everyone": False,
+            "pinned": False,
+            "tts": False,
+            "type": 0,
+            "flags": 0,
+            "timestamp": now_iso(),
+            "edited_timestamp": None,
+        }
+
+    async def send_message(self, channel_id, *, params):
+        await self._request("send_message")
+        data = self._bot_message(channel_id, self.discord.next_id(), params.payload)
+        reference = params.payload.get("message_reference") or {}
+        reply_to = reference.get("message_id")
+        self.discord.on_bot_message(
+            int(channel_id), data, int(reply_to) if reply_to else None
+        )
+        return data
+
+    async def edit_message(self, channel_id, message_id, *, params):
+        await self._request("edit_message")
+        data = self._bot_message(channel_id, message_id, params.payload)
+        data["edited_timestamp"] = data["timestamp"]
+        self.discord.on_bot_message(int(channel_id), data)
+        return data
+
+    async def delete_message(self, channel_id, message_id, *, reason=None):
+        await self._request("delete_message")
+
+    async def add_reaction(self, channel_id, message_id, emoji):
+        await self._request("add_reaction")
+
+    async def start_thread_with_message(
+        self,
+        channel_id,
+        message_id,
+        *,
+        name,
+        auto_archive_duration,
+        rate_limit_per_user,
+        reason=None,
+    ):
+        await self._request("start_thread_with_message")
+        return self.discord.create_thread(
+            int(channel_id), int(message_id), name, auto_archive_duration
+        )
+
+    async def close(self):
+        pass
+
+    def __getattr__(self, name):
+        # 흉내 내지 않은 API를 호출하면 어떤 경로인지 바로 알 수 있도록 실패시킴
+        async def unsupported(*args, **kwargs):
+            self.calls[f"unsupported:{name}"] += 1
+            raise NotImplementedError(f"FakeHTTP.{name}은(는) 지원하지 않습니다")
+
+        return unsupported
+
+
+class FakeDiscord:
+    """봇의 ConnectionState를 가짜 서버/채널/스레드/사용자로 채우는 Discord 대역
+
+    게이트웨이 대신 dispatch()로 on_message 이벤트를 발생시키고,
+    봇 응답은 FakeHTTP를 통해 받아 채널/스레드별 대기 Future를 완료시킵니다.
+    """
+
+    BOT_ID = 100000000000000001
+    OWNER_ID = 100000000000000002
+
+    def __init__(self, bot, rest_latency=0.0):
+        self.bot = bot
+        self.state = bot._connection
+        self._ids = itertools.count(discord.utils.time_snowflake(datetime.now()))
+
+        self.http = FakeHTTP(self, rest_latency)
+        bot.http = self.http
+        self.state.http = self.http
+
+        self.bot_user_payload = user_payload(self.BOT_ID, "GaeChwiPpo", bot=True)
+        self.state.user = discord.ClientUser(
+            state=self.state, data=self.bot_user_payload
+        )
+
+        self._message_waiters = {}  # 채널 ID -> 다음 봇 메시지를 기다리는 Future
+        self._thread_waiters = {}  # 부모 채널 ID -> 새 스레드를 기다리는 Future
+        self._new_threads = {}  # 스레드 ID -> (Future, 스레드), 첫 메시지 대기 중
+        self.thread_listeners = []  # 새 스레드가 답변을 받을 준비가 되면 호출할 함수
+        self._feedback_waiters = {}  # 사용자 메시지 ID -> 최종 피드백을 기다리는 Future
+        self._replies = {}  # 봇 메시지 ID -> 답장 대상 사용자 메시지 ID
+
+        self.guild = self._create_guild()
+        self.owner = self.add_member(self.OWNER_ID, "owner")
+
+    def next_id(self):
+        return next(self._ids)
+
+    def _create_guild(self):
+        guild_id = self.next_id()
+        data = {
+            "id": str(guild_id),
+            "name": "benchmark",
+            "owner_id": str(self.OWNER_ID),
+            "roles": [
+                {
+                    "id": str(guild_id),
+                    "name": "@everyone",
+                    "permissions": "0",
+                    "position": 0,
+                    "color": 0,
+                    "hoist": False,
+                    "managed": False,
+                    "mentionable": False,
+                }
+            ],
+            "channels": [],
+            "members": [],
+            "member_count": 0,
+            "emojis": [],
+            "stickers": [],
+            "features": [],
+        }
+        guild = discord.Guild(data=data, state=self.state)
+        self.state._add_guild(guild)
+        return guild
+
+    def add_member(self, user_id, name):
+        data = {
+            "user": user_payload(user_id, name),
+            "roles": [],
+            "joined_at": now_iso(),
+            "deaf": False,
+            "mute": False,
+            "flags": 0,
+        }
+        member = discord.Member(data=data, guild=self.guild, state=self.state)
+        self.guild._add_member(member)
+        return member
+
+    def add_text_channel(self, name):
+        data = {
+            "id": str(self.next_id()),
+            "type": 0,
+            "name": name,
+            "position": len(self.guild.channels),
+            "guild_id": str(self.guild.id),
+            "permission_overwrites": [],
+            "nsfw": False,
+            "parent_id": None,
+            "topic": None,
+            "last_message_id": None,
+            "rate_limit_per_user": 0,
+        }
+        channel = discord.TextChannel(state=self.state, guild=self.guild, data=data)
+        self.guild._add_channel(channel)
+        return channel
+
+    def create_thread(self, parent_id, message_id, name, auto_archive_duration):
+        """메시지에서 시작한 스레드 payload 생성 (게이트웨이 THREAD_CREATE처럼 캐시에 등록)"""
+        data = {
+            "id": str(message_id),
+            "guild_id": str(self.guild.id),
+            "parent_id": str(parent_id),
+            "owner_id": str(self.BOT_ID),
+            "name": name,
+            "type": 11,
+            "message_count": 0,
+            "member_count": 0,
+            "rate_limit_per_user": 0,
+            "thread_metadata": {
+                "archived": False,
+                "auto_archive_duration": auto_archive_duration,
+                "archive_timestamp": now_iso(),
+                "locked": False,
+            },
+        }
+        thread = discord.Thread(guild=self.guild, state=self.state, data=data)
+        self.guild._add_thread(thread)
+
+        self.bot.dispatch("thread_create", thread)
+
+        # 봇이 스레드에 첫 메시지를 올린 뒤(활성 질문 등록 후)에 대기 중인 사용자에게 전달
+        future = self._thread_waiters.pop(parent_id, None)
+        self._new_threads[thread.id] = (future, thread)
+        return data
+
+    def message(self, channel, member, content):
+        """사용자가 channel에 보낸 메시지 객체 생성"""
+        data = {
+            "id": str(self.next_id()),
+            "channel_id": str(channel.id),
+            "guild_id": str(self.guild.id),
+            "author": user_payload(member.id, member.name),
+            "member": {
+                "roles": [],
+                "joined_at": now_iso(),
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+            },
+            "content": content,
+            "embeds": [],
+            "attachments": [],
+            "mentions": [],
+            "mention_roles": [],
+            "mention_everyone": False,
+            "pinned": False,
+            "tts": False,
+            "type": 0,
+            "timestamp": now_iso(),
+            "edited_timestamp": None,
+        }
+        return self.state.create_message(channel=channel, data=data)
+
+    def dispatch(self, channel, member, content):
+        """게이트웨이 MESSAGE_CREATE처럼 on_message 이벤트 발생"""
+        message = self.message(channel, member, content)
+        self.bot.dispatch("message", message)
+        return message
+
+    # --- 봇 응답 대기 ---
+
+    def _wait(self, waiters, key):
+        future = asyncio.get_running_loop().create_future()
+        waiters[key] = future
+        return future
+
+    def _resolve(self, waiters, key, value):
+        future = waiters.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(value)
+
+    def expect_message(self, channel_id):
+        """channel에 봇이 다음으로 보낼 메시지 payload를 기다리는 Future"""
+        return self._wait(self._message_waiters, channel_id)
+
+    def expect_thread(self, channel_id):
+        """channel의 메시지에서 새로 만들어질 스레드를 기다리는 Future
+
+        실제 사용자처럼 봇이 스레드에 안내 메시지를 올린 뒤에 완료됩니다.
+        """
+        return self._wait(self._thread_waiters, channel_id)
+
+    def expect_feedback(self, message_id):
+        """사용자 메시지에 대한 최종 피드백(또는 오류 메시지)을 기다리는 Future
+
+        피드백은 답장이나 답장으로 보낸 "분석 중" 메시지를 수정하는 방식으로 오므로
+        답장 대상으로 어떤 사용자 메시지에 대한 응답인지 구분합니다.
+        결과는 "ai", "fallback"(기본 피드백 안내 문구 포함), "error" 중 하나입니다.
+        """
+        return self._wait(self._feedback_waiters, message_id)
+
+    def on_bot_message(self, channel_id, data, reply_to=None):
+        """봇이 보내거나 수정한 메시지로 대기 중인 Future 완료"""
+        if not data["edited_timestamp"]:
+            self._resolve(self._message_waiters, channel_id, data)
+            if channel_id in self._new_threads:
+                future, thread = self._new_threads.pop(channel_id)
+                if future is not None and not future.done():
+                    future.set_result(thread)
+                for listener in self.thread_listeners:
+                    listener(thread)
+
+        message_id = int(data["id"])
+        if reply_to is not None:
+            self._replies[message_id] = reply_to
+        source = self._replies.get(message_id)
+        if source not in self._feedback_waiters:
+            return
+
+        kind = None
+        for embed in data["embeds"]:
+            if embed.get("title") != FEEDBACK_TITLE:
+                continue
+            if (embed.get("description") or "").endswith(STREAMING_CURSOR):
+                return  # 스트리밍 중간 수정
+            kind = "fallback" if embed.get("footer") else "ai"
+        if kind is None and data["content"].startswith("❌"):
+            kind = "error"
+        if kind is not None:
+            self._replies.pop(message_id, None)
+            self._resolve(self._feedback_waiters, source, kind)
@@ -0,0 +1,180 @@
+import asyncio
+import importlib
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.fake_bedrock import FakeBedrockClient
+from benchmarks.fake_discord import FakeDiscord
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def percentile(values, q):
+    """값 목록의 분위수 (q: 0~1, 가장 가까운 순위 값)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def latency_summary(values):
+    return {
+        "count": len(values),
+        "p50": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": max(values) if values else 0.0,
+    }
+
+
+def histogram_by_label(name, label):
+    """메트릭 히스토그램을 label 값별로 합친 요약 (예: 피드백 경로별 지연)"""
+    from utils.metrics import Histogram, metrics
+
+    merged = {}
+    for key, histogram in metrics.histograms.get(name, {}).items():
+        value = dict(key).get(label, "unknown")
+        total = merged.setdefault(value, Histogram(histogram.buckets))
+        total.counts = [a + b for a, b in zip(total.counts, histogram.counts)]
+        total.count += histogram.count
+        total.sum += histogram.sum
+        total.max = max(total.max, histogram.max)
+
+    return {
+        value: {
+            "count": histogram.count,
+            "p50": histogram.quantile(0.5),
+            "p99": histogram.quantile(0.99),
+            "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+        }
+        for value, histogram in sorted(merged.items())
+    }
+
+
+class Harness:
+    """실제 main.py의 봇과 Cog을 가짜 Discord/Bedrock 위에서 실행
+
+    환경 변수를 설정한 뒤 main을 임포트하므로 한 프로세스에서 한 번만 만들 수 있습니다.
+    async with로 사용하면 Cog을 불러오고, 끝날 때 언로드해 DB 쓰기까지 마무리합니다.
+    """
+
+    def __init__(
+        self,
+        bedrock_latency=0.5,
+        bedrock_error_rate=0.0,
+        rest_latency=0.0,
+        streaming=False,
+        debounce=0.0,
+        trace_memory=True,
+        seed=None,
+        record_path=None,
+        env=None,
+    ):
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="bot-bench-")
+        settings = {
+            "DISCORD_BOT_TOKEN": "benchmark",
+            "ALLOWED_CHANNEL_ID": "",
+            "STUDY_DB_PATH": os.path.join(self._tmpdir.name, "study.db"),
+            "FEEDBACK_STREAMING": "true" if streaming else "false",
+            "ANSWER_DEBOUNCE_SECONDS": str(debounce),
+            "QUESTIONS_WATCH_INTERVAL": "0",
+            "METRICS_PORT": "0",
+            "SHARD_MODE": "none",
+            "RECORD_TRAFFIC_PATH": record_path or "",
+        }
+        settings.update(env or {})
+        os.environ.update(settings)
+
+        self.main = importlib.import_module("main")
+        self.bot = self.main.bot
+        self.discord = FakeDiscord(self.bot, rest_latency)
+        self.bedrock = FakeBedrockClient(
+            bedrock_latency, error_rate=bedrock_error_rate, seed=seed
+        )
+
+        # boto3 클라이언트 대신 가짜 Bedrock 사용 (FeedbackEngine의 나머지 경로는 그대로)
+        from utils.bedrock import FeedbackEngine
+
+        FeedbackEngine._create_client = lambda engine: self.bedrock
+
+        self.trace_memory = trace_memory
+        self.memory_baseline = 0
+        self._snapshot = None
+        self.started = None
+        self.study = None
+        self._lag_monitor = None
+
+    async def __aenter__(self):
+        from utils.metrics import LoopLagMonitor
+
+        await self.bot.__aenter__()
+        await self.main.load_extensions()
+        self.study = self.bot.get_cog("Study")
+
+        self._lag_monitor = LoopLagMonitor(interval=0.1)
+        self._lag_monitor.start()
+        self.main.watchdog.start()
+        if self.main.recorder:
+            self.main.recorder.attach()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._lag_monitor.stop()
+        self.main.watchdog.stop()
+        if self.main.recorder:
+            self.main.recorder.close()
+        for name in list(self.bot.extensions):
+            await self.bot.unload_extension(name)
+        await self.bot.__aexit__(*exc_info)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._tmpdir.cleanup()
+
+    def begin(self):
+        """측정 시작 (준비 단계의 메모리는 기준선으로 제외)"""
+        if self.trace_memory:
+            tracemalloc.start()
+            self.memory_baseline = tracemalloc.get_traced_memory()[0]
+            self._snapshot = tracemalloc.take_snapshot()
+        self.started = time.perf_counter()
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def memory_report(self, top=5):
+        """측정 시작 이후 늘어난 메모리와 가장 많이 늘어난 위치"""
+        report = {}
+        if resource is not None:
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            report["max_rss_mb"] = rss / 1024
+        if not (self.trace_memory and tracemalloc.is_tracing()):
+            return report
+
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        report.update(
+            {
+                "growth_mb": (current - self.memory_baseline) / 1024 / 1024,
+                "peak_mb": (peak - self.memory_baseline) / 1024 / 1024,
+                "top_growth": [
+                    f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                    f"+{stat.size_diff / 1024:.0f}KiB"
+                    for stat in stats[:top]
+                ],
+            }
+        )
+        return report
+
+    async def drain(self, timeout=60):
+        """대기열과 진행 중인 피드백 작업이 모두 끝날 때까지 대기"""
+        queue = self.study.answer_queue
+        deadline = time.monotonic() + timeout
+        while (len(queue) or queue.active) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
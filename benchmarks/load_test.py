@@ -0,0 +1,304 @@
+"""가짜 Discord/Bedrock 위에서 Study/General/Fun Cog에 부하를 거는 오프라인 벤치마크
+
+사용 예 (저장소 루트에서):
+    python -m benchmarks.load_test --users 2000 --ramp 20 --bedrock-latency 0.3
+    python -m benchmarks.load_test --users 500 --json result.json --max-p99 5
+
+시뮬레이션 사용자는 각자 채널에서 !question으로 질문을 받고, 생성된 스레드에 답변한 뒤
+피드백이 올라올 때까지 기다립니다. 일부 사용자는 같은 답변을 다시 보내(피드백 캐시)
+General/Fun 명령도 섞어서 실행합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from collections import Counter, defaultdict
+
+from benchmarks.harness import Harness, histogram_by_label, latency_summary
+
+# 질문 외에 섞어서 보내는 명령
+MISC_COMMANDS = [
+    "!ping",
+    "!hello",
+    "!info",
+    "!dice 20",
+    "!choose 짜장면 짬뽕 볶음밥",
+    "!8ball 이번 면접 붙을까요?",
+    "!server",
+    "!user",
+    "!mystats",
+    "!leaderboard",
+    "!search 트랜잭션 격리",
+]
+
+ANSWER_PHRASES = [
+    "인덱스는 조회 속도를 높이지만 쓰기 비용과 저장 공간이 늘어납니다.",
+    "캐시를 사용하면 응답 시간을 줄일 수 있지만 일관성 문제가 생길 수 있어요.",
+    "트랜잭션 격리 수준에 따라 dirty read나 phantom read가 발생합니다.",
+    "React에서는 상태를 불변으로 다뤄야 리렌더링이 올바르게 일어납니다.",
+    "HTTP는 무상태 프로토콜이라 세션이나 토큰으로 상태를 유지합니다.",
+    "잘 모르겠지만 성능과 확장성을 같이 고려해야 할 것 같아요.",
+]
+
+
+class LoadTest:
+    """시뮬레이션 사용자 실행과 결과 집계"""
+
+    def __init__(self, harness, args):
+        self.harness = harness
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.answer_latencies = []
+        self.answer_outcomes = Counter()
+        self.command_latencies = defaultdict(list)
+        self.timeouts = Counter()
+
+    def make_answer(self):
+        count = self.random.randint(1, 4)
+        return " ".join(self.random.choice(ANSWER_PHRASES) for _ in range(count))
+
+    async def wait(self, future, kind):
+        """봇 응답 대기 (시간 초과면 None)"""
+        try:
+            return await asyncio.wait_for(future, self.args.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts[kind] += 1
+            return None
+
+    async def run_command(self, member, channel, content):
+        fake = self.harness.discord
+        loop = asyncio.get_running_loop()
+        reply = fake.expect_message(channel.id)
+        started = loop.time()
+        fake.dispatch(channel, member, content)
+        if await self.wait(reply, content) is not None:
+            name = content.split()[0]
+            self.command_latencies[name].append(loop.time() - started)
+
+    async def answer(self, member, thread, content):
+        fake = self.harness.discord
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        message = fake.dispatch(thread, member, content)
+        feedback = fake.expect_feedback(message.id)
+        outcome = await self.wait(feedback, "feedback")
+        if outcome is not None:
+            self.answer_latencies.append(loop.time() - started)
+            self.answer_outcomes[outcome] += 1
+
+    async def user(self, index):
+        """사용자 한 명: 질문 받기 -> 답변(가끔 같은 답변 다시) -> 기타 명령"""
+        args = self.args
+        fake = self.harness.discord
+        member = fake.add_member(fake.next_id(), f"user{index}")
+        channel = fake.add_text_channel(f"study-{index}")
+        loop = asyncio.get_running_loop()
+
+        await asyncio.sleep(self.random.uniform(0, args.ramp))
+
+        for _ in range(args.questions):
+            thread_created = fake.expect_thread(channel.id)
+            started = loop.time()
+            fake.dispatch(channel, member, "!question")
+            thread = await self.wait(thread_created, "!question")
+            if thread is None:
+                continue
+            self.command_latencies["!question"].append(loop.time() - started)
+
+            content = self.make_answer()
+            for attempt in range(args.answers):
+                await asyncio.sleep(self.random.uniform(0, args.think))
+                if attempt and self.random.random() >= args.repeat_rate:
+                    content = self.make_answer()
+                await self.answer(member, thread, content)
+
+        if self.random.random() < args.misc_rate:
+            await self.run_command(member, channel, self.random.choice(MISC_COMMANDS))
+
+    async def run(self):
+        self.harness.begin()
+        await asyncio.gather(*(self.user(i) for i in range(self.args.users)))
+        await self.harness.drain()
+        return self.report()
+
+    def report(self):
+        from utils.metrics import metrics
+
+        elapsed = self.harness.elapsed()
+        lag = metrics.histograms.get("event_loop_lag_seconds", {}).get(())
+        routes = Counter()
+        for key, histogram in metrics.histograms.get(
+            "study_answer_seconds", {}
+        ).items():
+            routes[dict(key).get("outcome", "unknown")] += histogram.count
+
+        commands = sum(len(values) for values in self.command_latencies.values())
+        return {
+            "users": self.args.users,
+            "elapsed_s": elapsed,
+            "answers": len(self.answer_latencies),
+            "answers_per_s": len(self.answer_latencies) / elapsed,
+            "commands_per_s": commands / elapsed,
+            "answer_latency_s": latency_summary(self.answer_latencies),
+            "answer_outcomes": dict(self.answer_outcomes),
+            "answer_routes": dict(routes),
+            "feedback_routes": histogram_by_label("study_feedback_seconds", "route"),
+            "command_latency_s": {
+                name: latency_summary(values)
+                for name, values in sorted(self.command_latencies.items())
+            },
+            "timeouts": dict(self.timeouts),
+            "bedrock": {
+                "calls": self.harness.bedrock.calls,
+                "injected_errors": self.harness.bedrock.errors,
+            },
+            "rest_calls": dict(self.harness.discord.http.calls),
+            "event_loop_lag_s": {
+                "p99": lag.quantile(0.99) if lag else 0.0,
+                "max": lag.max if lag else 0.0,
+            },
+            "loop_stalls": len(self.harness.main.watchdog.reports),
+            "memory": self.harness.memory_report(),
+        }
+
+
+def print_report(result, title="📊 부하 테스트 결과"):
+    answer = result["answer_latency_s"]
+    memory = result["memory"]
+    print()
+    print(title)
+    print(f"- 사용자 {result['users']}명, {result['elapsed_s']:.1f}초")
+    print(
+        f"- 처리량: 답변 {result['answers_per_s']:.1f}건/초, "
+        f"명령 {result['commands_per_s']:.1f}건/초"
+    )
+    print(
+        f"- 답변→피드백 지연: p50 {answer['p50']:.3f}s / p90 {answer['p90']:.3f}s / "
+        f"p99 {answer['p99']:.3f}s / 최대 {answer['max']:.3f}s ({answer['count']}건)"
+    )
+    print(f"- 피드백 종류: {result['answer_outcomes']}")
+    print(f"- 처리 경로: {result['answer_routes']}")
+    for route, summary in result.get("feedback_routes", {}).items():
+        print(
+            f"- 피드백 경로 {route}: p50 {summary['p50']:.3f}s / "
+            f"p99 {summary['p99']:.3f}s ({summary['count']}건)"
+        )
+    for name, summary in result["command_latency_s"].items():
+        print(
+            f"- {name}: p50 {summary['p50'] * 1000:.0f}ms / "
+            f"p99 {summary['p99'] * 1000:.0f}ms ({summary['count']}건)"
+        )
+    if result["timeouts"]:
+        print(f"- ⚠️ 시간 초과: {result['timeouts']}")
+    print(
+        f"- Bedrock 호출 {result['bedrock']['calls']}회 "
+        f"(주입한 오류 {result['bedrock']['injected_errors']}회)"
+    )
+    print(
+        f"- 이벤트 루프 지연: p99 {result['event_loop_lag_s']['p99'] * 1000:.0f}ms / "
+        f"최대 {result['event_loop_lag_s']['max'] * 1000:.0f}ms, "
+        f"멈춤 보고서 {result['loop_stalls']}건"
+    )
+    if "growth_mb" in memory:
+        print(
+            f"- 메모리: 증가 {memory['growth_mb']:.1f}MiB / "
+            f"최대 {memory['peak_mb']:.1f}MiB (tracemalloc)"
+        )
+        for line in memory["top_growth"]:
+            print(f"    {line}")
+    if "max_rss_mb" in memory:
+        print(f"- 최대 RSS: {memory['max_rss_mb']:.0f}MiB")
+
+
+def check_limits(result, args):
+    """--max-* 기준을 넘으면 실패 메시지 목록 반환 (회귀 검사용)"""
+    failures = []
+    p99 = result["answer_latency_s"]["p99"]
+    if args.max_p99 is not None and p99 > args.max_p99:
+        failures.append(f"답변 p99 {p99:.3f}s > {args.max_p99}s")
+    growth = result["memory"].get("growth_mb")
+    if args.max_memory_mb is not None and growth is not None:
+        if growth > args.max_memory_mb:
+            failures.append(f"메모리 증가 {growth:.1f}MiB > {args.max_memory_mb}MiB")
+    if args.min_throughput is not None:
+        if result["answers_per_s"] < args.min_throughput:
+            failures.append(
+                f"처리량 {result['answers_per_s']:.1f}건/초 < {args.min_throughput}"
+            )
+    return failures
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="시뮬레이션 사용자 수")
+    parser.add_argument("--ramp", type=float, default=30, help="사용자 유입 구간(초)")
+    parser.add_argument("--questions", type=int, default=1, help="사용자당 질문 수")
+    parser.add_argument("--answers", type=int, default=2, help="질문당 답변 수")
+    parser.add_argument("--think", type=float, default=2, help="답변 전 최대 대기(초)")
+    parser.add_argument(
+        "--repeat-rate",
+        type=float,
+        default=0.3,
+        help="이전 답변을 그대로 다시 보낼 확률",
+    )
+    parser.add_argument(
+        "--misc-rate", type=float, default=0.5, help="기타 명령을 실행할 확률"
+    )
+    parser.add_argument(
+        "--bedrock-latency", type=float, default=0.5, help="가짜 Bedrock 평균 지연(초)"
+    )
+    parser.add_argument(
+        "--bedrock-error-rate", type=float, default=0.0, help="가짜 Bedrock 오류 비율"
+    )
+    parser.add_argument(
+        "--rest-latency", type=float, default=0.02, help="가짜 Discord REST 지연(초)"
+    )
+    parser.add_argument("--streaming", action="store_true", help="스트리밍 피드백 사용")
+    parser.add_argument("--timeout", type=float, default=120, help="응답 대기 한도(초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument(
+        "--no-tracemalloc", action="store_true", help="메모리 추적 끄기 (오버헤드 제거)"
+    )
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument(
+        "--record", help="시뮬레이션 트래픽을 replay용 JSONL로 기록할 경로"
+    )
+    parser.add_argument("--max-p99", type=float, help="답변 p99 지연 상한(초)")
+    parser.add_argument("--max-memory-mb", type=float, help="메모리 증가 상한(MiB)")
+    parser.add_argument("--min-throughput", type=float, help="최소 답변 처리량(건/초)")
+    return parser
+
+
+async def run(args):
+    harness = Harness(
+        bedrock_latency=args.bedrock_latency,
+        bedrock_error_rate=args.bedrock_error_rate,
+        rest_latency=args.rest_latency,
+        streaming=args.streaming,
+        trace_memory=not args.no_tracemalloc,
+        seed=args.seed,
+        record_path=args.record,
+    )
+    async with harness:
+        return await LoadTest(harness, args).run()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    result = asyncio.run(run(args))
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    failures = check_limits(result, args)
+    for failure in failures:
+        print(f"❌ 기준 초과: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
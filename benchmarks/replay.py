@@ -0,0 +1,361 @@
+"""기록한 트래픽(RECORD_TRAFFIC_PATH)을 가짜 Discord/Bedrock 위에서 다시 재생하는 벤치마크
+
+사용 예 (저장소 루트에서):
+    python -m benchmarks.replay traffic.jsonl --speed 10
+    python -m benchmarks.replay traffic.jsonl --json after.json --baseline before.json
+
+기록의 사용자/채널 번호마다 가짜 사용자/채널을 만들고, 메시지를 기록된 시각에 맞춰
+(--speed배 빠르게) 다시 보냅니다. 봇이 만든 스레드는 부모 채널별로 만들어진 순서대로
+기록의 스레드 번호와 짝지으며, 스레드 안의 답변은 짝이 정해진 뒤에 보냅니다.
+같은 기록을 코드 변경 전후에 재생해 --baseline으로 지연/처리량/메모리를 비교할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import sys
+from collections import Counter, defaultdict, deque
+from datetime import date
+
+from benchmarks.harness import Harness, histogram_by_label, latency_summary
+from benchmarks.load_test import check_limits, print_report
+
+
+def load_sessions(path):
+    """기록 파일을 "start" 줄 기준으로 나눈 세션 목록 ({"prefix", "events"})"""
+    sessions = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            if event["type"] == "start" or not sessions:
+                sessions.append({"prefix": event.get("prefix", "!"), "events": []})
+            if event["type"] != "start":
+                sessions[-1]["events"].append(event)
+    return sessions
+
+
+class Replay:
+    """세션 하나의 이벤트를 기록된 시간 간격대로 재생하고 결과 집계"""
+
+    def __init__(self, harness, session, args):
+        self.harness = harness
+        self.events = session["events"]
+        self.prefix = session["prefix"]
+        self.args = args
+        self.members = {}  # 기록의 사용자 번호 -> Member
+        self.channels = {}  # 기록의 채널 번호 -> TextChannel
+        self.threads = {}  # 기록의 스레드 번호 -> 재생 중 만들어진 스레드 Future
+        self.pending = defaultdict(deque)  # 부모 채널 ID -> 짝을 기다리는 스레드 번호
+        # (스레드 ID, 사용자 ID) -> 아직 피드백이 오지 않은 답변의 결과 Future
+        self.unanswered = defaultdict(deque)
+        self.answer_latencies = []
+        self.answer_outcomes = Counter()
+        self.skipped = Counter()
+        self.timeouts = Counter()
+
+    def member(self, alias):
+        if alias not in self.members:
+            fake = self.harness.discord
+            self.members[alias] = fake.add_member(fake.next_id(), f"user{alias}")
+        return self.members[alias]
+
+    def channel(self, alias):
+        if alias not in self.channels:
+            self.channels[alias] = self.harness.discord.add_text_channel(
+                f"replay-{alias}"
+            )
+        return self.channels[alias]
+
+    def prepare(self):
+        """기록된 스레드 생성 순서대로 부모 채널별 짝짓기 대기열 준비"""
+        loop = asyncio.get_running_loop()
+        for event in self.events:
+            if event["type"] == "thread":
+                parent = self.channel(event["parent"])
+                self.threads[event["thread"]] = loop.create_future()
+                self.pending[parent.id].append(event["thread"])
+        self.harness.discord.thread_listeners.append(self.on_thread_ready)
+
+    def on_thread_ready(self, thread):
+        queue = self.pending.get(thread.parent_id)
+        if not queue:
+            self.skipped["unmatched_thread"] += 1
+            return
+        future = self.threads[queue.popleft()]
+        if not future.done():
+            future.set_result(thread)
+
+    async def wait(self, future, kind):
+        """봇 응답 대기 (시간 초과면 None)"""
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.args.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts[kind] += 1
+            return None
+
+    async def thread(self, alias):
+        """기록의 스레드 번호에 해당하는 재생 스레드 (기록 시작 전에 만든 스레드면 None)"""
+        future = self.threads.get(alias)
+        if future is None:
+            self.skipped["unknown_thread"] += 1
+            return None
+        return await self.wait(future, "thread")
+
+    # --- 이벤트 종류별 재생 ---
+
+    async def replay_message(self, event):
+        fake = self.harness.discord
+        member = self.member(event["user"])
+        content = event["content"]
+        if not event["thread"]:
+            fake.dispatch(self.channel(event["channel"]), member, content)
+            return
+
+        thread = await self.thread(event["channel"])
+        if thread is None:
+            return
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        message = fake.dispatch(thread, member, content)
+        if content.startswith(self.prefix):
+            return
+
+        result = loop.create_future()
+        earlier = self.unanswered[(thread.id, member.id)]
+        earlier.append(result)
+
+        def on_feedback(feedback):
+            # 이 답변에 피드백이 오면 그 전에 보낸 피드백 없는 답변은 디바운서가 합친 것
+            while earlier:
+                pending = earlier.popleft()
+                if pending is result:
+                    break
+                if not pending.done():
+                    pending.set_result("merged")
+            if not result.done():
+                result.set_result(feedback.result())
+
+        fake.expect_feedback(message.id).add_done_callback(on_feedback)
+        outcome = await self.wait(result, "feedback")
+        if outcome == "merged":
+            # 지연 시간은 합쳐진 마지막 답변으로 집계
+            self.answer_outcomes[outcome] += 1
+        elif outcome is not None:
+            self.answer_latencies.append(loop.time() - started)
+            self.answer_outcomes[outcome] += 1
+
+    async def replay_daily(self, event):
+        run_date = date.fromisoformat(event["date"]) if "date" in event else None
+        await self.harness.study.post_daily_questions(
+            self.channel(event["channel"]), run_date or date.today()
+        )
+
+    async def replay_thread_archive(self, event):
+        thread = await self.thread(event["thread"])
+        if thread is None or thread.archived:
+            return
+        before = copy.copy(thread)
+        thread.archived = True
+        self.harness.bot.dispatch("thread_update", before, thread)
+
+    async def replay_thread_delete(self, event):
+        thread = await self.thread(event["thread"])
+        if thread is None:
+            return
+        self.harness.discord.guild._remove_thread(thread)
+        self.harness.bot.dispatch("thread_delete", thread)
+
+    async def run(self):
+        self.prepare()
+        self.harness.begin()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tasks = []
+        for event in self.events:
+            delay = started + event["t"] / self.args.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            handler = getattr(self, f"replay_{event['type']}", None)
+            if handler is not None:
+                # 응답을 기다리는 동안에도 다음 이벤트는 기록된 시각에 보냄
+                tasks.append(asyncio.create_task(handler(event)))
+        await asyncio.gather(*tasks)
+        await self.harness.drain()
+        return self.report()
+
+    def report(self):
+        from utils.metrics import metrics
+
+        elapsed = self.harness.elapsed()
+        lag = metrics.histograms.get("event_loop_lag_seconds", {}).get(())
+        routes = Counter()
+        for key, histogram in metrics.histograms.get(
+            "study_answer_seconds", {}
+        ).items():
+            routes[dict(key).get("outcome", "unknown")] += histogram.count
+
+        # 명령은 응답 메시지를 특정할 수 없으므로 봇 내부 처리 시간(메트릭)으로 집계
+        commands = {}
+        for key, histogram in metrics.histograms.get(
+            "discord_command_seconds", {}
+        ).items():
+            name = self.prefix + dict(key).get("command", "unknown")
+            commands[name] = {
+                "count": histogram.count,
+                "p50": histogram.quantile(0.5),
+                "p90": histogram.quantile(0.9),
+                "p99": histogram.quantile(0.99),
+                "max": histogram.max,
+            }
+        command_count = sum(summary["count"] for summary in commands.values())
+
+        return {
+            "users": len(self.members),
+            "events": len(self.events),
+            "speed": self.args.speed,
+            "elapsed_s": elapsed,
+            "answers": len(self.answer_latencies),
+            "answers_per_s": len(self.answer_latencies) / elapsed,
+            "commands_per_s": command_count / elapsed,
+            "answer_latency_s": latency_summary(self.answer_latencies),
+            "answer_outcomes": dict(self.answer_outcomes),
+            "answer_routes": dict(routes),
+            "feedback_routes": histogram_by_label("study_feedback_seconds", "route"),
+            "command_latency_s": dict(sorted(commands.items())),
+            "timeouts": dict(self.timeouts),
+            "skipped": dict(self.skipped),
+            "bedrock": {
+                "calls": self.harness.bedrock.calls,
+                "injected_errors": self.harness.bedrock.errors,
+            },
+            "rest_calls": dict(self.harness.discord.http.calls),
+            "event_loop_lag_s": {
+                "p99": lag.quantile(0.99) if lag else 0.0,
+                "max": lag.max if lag else 0.0,
+            },
+            "loop_stalls": len(self.harness.main.watchdog.reports),
+            "memory": self.harness.memory_report(),
+        }
+
+
+def compare(result, baseline):
+    """이전 결과(JSON)와 주요 지표 비교 줄 목록"""
+    rows = [
+        ("답변 p50(s)", ("answer_latency_s", "p50")),
+        ("답변 p99(s)", ("answer_latency_s", "p99")),
+        ("답변 처리량(건/초)", ("answers_per_s",)),
+        ("루프 지연 p99(s)", ("event_loop_lag_s", "p99")),
+        ("메모리 증가(MiB)", ("memory", "growth_mb")),
+    ]
+    lines = []
+    for label, path in rows:
+        before, after = baseline, result
+        for key in path:
+            before = before.get(key) if isinstance(before, dict) else None
+            after = after.get(key) if isinstance(after, dict) else None
+        if before is None or after is None:
+            continue
+        change = f" ({(after - before) / before * 100:+.0f}%)" if before else ""
+        lines.append(f"- {label}: {before:.3f} → {after:.3f}{change}")
+    return lines
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="RECORD_TRAFFIC_PATH로 기록한 JSONL 파일")
+    parser.add_argument(
+        "--session",
+        type=int,
+        default=-1,
+        help="재생할 세션 번호 (봇 재시작마다 하나, 기본: 마지막)",
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속")
+    parser.add_argument(
+        "--bedrock-latency", type=float, default=0.5, help="가짜 Bedrock 평균 지연(초)"
+    )
+    parser.add_argument(
+        "--bedrock-error-rate", type=float, default=0.0, help="가짜 Bedrock 오류 비율"
+    )
+    parser.add_argument(
+        "--rest-latency", type=float, default=0.02, help="가짜 Discord REST 지연(초)"
+    )
+    parser.add_argument("--streaming", action="store_true", help="스트리밍 피드백 사용")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.0,
+        help="연속 메시지 묶기 간격(초, 합쳐진 메시지는 피드백 종류 merged로 집계)",
+    )
+    parser.add_argument("--timeout", type=float, default=60, help="응답 대기 한도(초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument(
+        "--no-tracemalloc", action="store_true", help="메모리 추적 끄기 (오버헤드 제거)"
+    )
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--max-p99", type=float, help="답변 p99 지연 상한(초)")
+    parser.add_argument("--max-memory-mb", type=float, help="메모리 증가 상한(MiB)")
+    parser.add_argument("--min-throughput", type=float, help="최소 답변 처리량(건/초)")
+    return parser
+
+
+async def run(args, session):
+    harness = Harness(
+        bedrock_latency=args.bedrock_latency,
+        bedrock_error_rate=args.bedrock_error_rate,
+        rest_latency=args.rest_latency,
+        streaming=args.streaming,
+        debounce=args.debounce,
+        trace_memory=not args.no_tracemalloc,
+        seed=args.seed,
+        env={"COMMAND_PREFIX": session["prefix"]},
+    )
+    async with harness:
+        return await Replay(harness, session, args).run()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sessions = load_sessions(args.path)
+    if not sessions:
+        print(f"❌ 재생할 기록이 없습니다: {args.path}")
+        return 1
+    try:
+        session = sessions[args.session]
+    except IndexError:
+        print(f"❌ 세션 {args.session}이(가) 없습니다 (총 {len(sessions)}개)")
+        return 1
+
+    print(
+        f"▶️ {len(session['events'])}개 이벤트를 {args.speed}배속으로 재생합니다 "
+        f"(세션 {len(sessions)}개 중 {args.session})"
+    )
+    result = asyncio.run(run(args, session))
+    print_report(result, title="📊 트래픽 재생 결과")
+    if result["skipped"]:
+        print(f"- 건너뛴 이벤트: {result['skipped']}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        print(f"📈 이전 결과와 비교 ({args.baseline})")
+        for line in compare(result, baseline):
+            print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    failures = check_limits(result, args)
+    for failure in failures:
+        print(f"❌ 기준 초과: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,51 +1,200 @@
+import asyncio
 import json
 import os
-import random
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import boto3
 import discord
-import discord.utils
 from discord.ext import commands, tasks
 
+from utils.answer_queue import AnswerQueue, QueueFullError
+from utils.bedrock import FeedbackEngine
+from utils.database import StudyDatabase
+from utils.debounce import AnswerDebouncer
+from utils.feedback_cache import FeedbackCache
+from utils.grader import AnswerGrader, load_references
+from utils.metrics import metrics
+from utils.question_index import (
+    QuestionIndex,
+    diff_question_banks,
+    load_question_bank,
+)
+from utils.question_store import ActiveQuestionStore
+from utils.review import ReviewScheduler
+from utils.routing import ModelRouter, default_routes
+from utils.scheduler import START_DATE, DailyScheduler
+from utils.search import QuestionSearch
+from utils.stats import StudyStats, parse_grade
+
 
 class Study(commands.Cog):
     """학습 질문 및 피드백 시스템"""
 
     def __init__(self, bot):
         self.bot = bot
-        self.active_questions = {}  # 활성 질문 추적
-        self.start_date = datetime(2025, 7, 20)  # 시작 날짜 (오늘)
+        self.db = StudyDatabase()  # 질문/답변 영구 저장소
+
+        # 여러 프로세스(샤드)가 같은 DB를 공유하는지 여부
+        shared = os.getenv("STUDY_SHARED_STORE", "false").lower()
+        self.shared_store = shared in ("1", "true", "yes")
+        self.active_questions = ActiveQuestionStore(db=self.db)  # 활성 질문 추적
+        self.stats = StudyStats(self.db)  # 사용자별 학습 통계
+        self.reviews = ReviewScheduler(self.db)  # 간격 반복 복습 스케줄러
+        self.start_date = START_DATE  # 시작 날짜
         self.allowed_channel_id = (
             int(os.getenv("ALLOWED_CHANNEL_ID", "0"))
             if os.getenv("ALLOWED_CHANNEL_ID")
             else None
         )
 
-        # AWS Bedrock 클라이언트 초기화
-        self.bedrock_runtime = boto3.client(
-            service_name="bedrock-runtime",
-            region_name=os.getenv("AWS_REGION", "us-east-1"),
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        )
+        # AWS Bedrock 피드백 엔진 초기화 (이벤트 루프를 막지 않도록 스레드 풀에서 호출)
+        self.feedback_engine = FeedbackEngine()
 
-        # JSON 파일에서 질문 데이터베이스 로드
-        self.question_bank = self.load_questions()
+        # 스트리밍 피드백 설정 (메시지 수정 최소 간격, 초)
+        streaming = os.getenv("FEEDBACK_STREAMING", "true").lower()
+        self.streaming_enabled = streaming in ("1", "true", "yes")
+        self.edit_interval = float(os.getenv("FEEDBACK_EDIT_INTERVAL", "1.0"))
 
-        # 스케줄러 시작
-        self.daily_question.start()
+        # 답변 길이/카테고리/대기열 길이에 따라 모델, 응답 한도, 프롬프트 선택
+        try:
+            self.router = ModelRouter()
+        except (OSError, ValueError) as e:
+            print(f"❌ 피드백 경로 설정 오류 (기본 경로 사용):\n{e}")
+            self.router = ModelRouter(default_routes())
+
+        # 같은 질문에 대한 중복 답변 피드백 캐시 (선택적으로 DB에 저장)
+        persist = os.getenv("FEEDBACK_CACHE_PERSIST", "true").lower()
+        self.feedback_cache = FeedbackCache(
+            db=self.db if persist in ("1", "true", "yes") else None
+        )
 
-    def load_questions(self):
-        """JSON 파일에서 질문 데이터 로드"""
+        # 피드백 생성 작업 큐 (워커 수와 대기열 크기 제한)
+        self.answer_queue = AnswerQueue(self.handle_answer_job)
+
+        # 연달아 보낸 메시지를 하나의 답변으로 모으기
+        self.debouncer = AnswerDebouncer(self.process_answer_burst)
+
+        # 질문 데이터와 조회용 인덱스는 cog_load에서 워커 스레드로 생성
+        self.questions_path = Path(__file__).parent.parent / "data" / "questions.json"
+        self.questions_mtime = None
+        self.questions_digest = None
+        # 비슷한 질문은 첫 질문만 남기고 출제 순서에서 제외 (선택)
+        dedup = os.getenv("QUESTION_DEDUP", "false").lower()
+        self.dedup_threshold = (
+            float(os.getenv("QUESTION_DEDUP_THRESHOLD", "0.6"))
+            if dedup in ("1", "true", "yes")
+            else None
+        )
+        self.question_bank = self.get_default_questions()
+        self.question_index = QuestionIndex(self.question_bank)
+        self.question_search = QuestionSearch(self.question_index)  # !search 역색인
+
+        # 참고 핵심 포인트로 답변을 채점하는 로컬 채점기 (기본 피드백/사전 검사용)
+        self.references_path = self.questions_path.with_name("references.json")
+        self.references_mtime = None
+        self.grader = AnswerGrader()
+        self._reload_lock = asyncio.Lock()
+        self._warm_up_task = None
+
+        # 일일 질문 스케줄러 (벽시계/시간대 기준, 하루 한 번만 게시)
+        hour, minute = os.getenv("DAILY_QUESTION_TIME", "10:00").split(":")
+        self.daily_hour, self.daily_minute = int(hour), int(minute)
+        self.daily_tz = os.getenv("DAILY_QUESTION_TZ", "Asia/Seoul")
+        self.scheduler = DailyScheduler(
+            self.db,
+            self.run_daily_job,
+            can_run=lambda job: self.bot.get_channel(job["channel_id"]) is not None,
+        )
+        if self.allowed_channel_id:
+            self.scheduler.add_job(
+                f"daily:{self.allowed_channel_id}",
+                self.daily_hour,
+                self.daily_minute,
+                self.daily_tz,
+                channel_id=self.allowed_channel_id,
+            )
+        self.scheduler.start(wait_ready=self.bot.wait_until_ready)
+
+    async def cog_load(self):
+        """질문 데이터와 활성 질문/피드백 캐시/복습 항목을 워커 스레드에서 동시에 불러오기
+
+        Bedrock 클라이언트는 기다리지 않고 백그라운드에서 미리 생성합니다.
+        """
+        self._warm_up_task = asyncio.create_task(self.warm_up_feedback_engine())
+        self.answer_queue.start()
+
+        bank, grader, restored, cached, reviews = await asyncio.gather(
+            asyncio.to_thread(self.load_questions),
+            asyncio.to_thread(self.load_grader),
+            asyncio.to_thread(self.active_questions.restore),
+            asyncio.to_thread(self.feedback_cache.restore),
+            asyncio.to_thread(self.reviews.restore),
+        )
+        self.question_bank, self.question_index, self.question_search = bank
+        self.grader = grader
+        print(f"♻️ 활성 질문 {restored}개를 복원했습니다.")
+        print(f"♻️ 피드백 캐시 {cached}개를 불러왔습니다.")
+        print(f"♻️ 복습 항목 {reviews}개를 불러왔습니다.")
+
+        # 질문 파일 변경 감시 (0이면 비활성화)
+        watch_interval = float(os.getenv("QUESTIONS_WATCH_INTERVAL", "30"))
+        if watch_interval > 0:
+            self.watch_questions.change_interval(seconds=watch_interval)
+            self.watch_questions.start()
+
+        # 서버별 일일 질문 일정 등록
+        schedules = await asyncio.to_thread(self.db.load_guild_schedules)
+        for schedule in schedules:
+            self.add_guild_schedule(**schedule)
+        print(f"⏰ 서버별 일일 질문 일정 {len(schedules)}개를 등록했습니다.")
+
+        self.register_metrics()
+
+    def metric_collectors(self):
+        """수집 시점에 값을 읽어 오는 메트릭 목록 (이름, 종류, 값 함수)"""
+        cache = self.feedback_cache
+        return [
+            ("study_active_questions", "gauge", lambda: len(self.active_questions)),
+            ("answer_queue_depth", "gauge", lambda: len(self.answer_queue)),
+            ("answer_queue_active", "gauge", lambda: self.answer_queue.active),
+            ("feedback_cache_size", "gauge", lambda: len(cache)),
+            ("feedback_cache_hits_total", "counter", lambda: cache.hits),
+            ("feedback_cache_misses_total", "counter", lambda: cache.misses),
+            (
+                "feedback_cache_hit_ratio",
+                "gauge",
+                lambda: cache.hits / max(1, cache.hits + cache.misses),
+            ),
+            (
+                "bedrock_breaker_open",
+                "gauge",
+                lambda: int(self.feedback_engine.breaker.is_open()),
+            ),
+        ]
+
+    def register_metrics(self):
+        """대기열/캐시/활성 질문 상태를 메트릭 레지스트리에 등록"""
+        for name, kind, func in self.metric_collectors():
+            metrics.register(name, func, kind)
+
+    async def warm_up_feedback_engine(self):
+        """Bedrock 클라이언트를 미리 생성 (실패해도 첫 요청 때 다시 시도)"""
         try:
-            # 현재 파일의 디렉토리 기준으로 경로 설정
-            current_dir = Path(__file__).parent.parent
-            json_path = current_dir / "data" / "questions.json"
+            await self.feedback_engine.warm_up()
+            print("✅ Bedrock 클라이언트를 준비했습니다.")
+        except Exception as e:
+            print(f"⚠️ Bedrock 클라이언트 준비 실패: {e}")
 
-            with open(json_path, "r", encoding="utf-8") as f:
-                questions = json.load(f)
+    def load_questions(self):
+        """JSON 파일에서 질문 데이터를 읽고 (질문 데이터, 조회용 인덱스, 검색 역색인) 반환"""
+        json_path = self.questions_path
+        try:
+            self.questions_mtime = os.stat(json_path).st_mtime_ns
+            questions, index, self.questions_digest = load_question_bank(
+                json_path, self.dedup_threshold
+            )
 
             print(f"✅ {json_path}에서 질문 데이터를 로드했습니다.")
 
@@ -56,17 +205,82 @@ class Study(commands.Cog):
                     total += len(sub_cat)
             print(f"📊 총 {total}개의 질문이 로드되었습니다.")
 
-            return questions
+            return questions, index, QuestionSearch(index)
 
         except FileNotFoundError:
             print(f"❌ 질문 파일을 찾을 수 없습니다: {json_path}")
-            return self.get_default_questions()
         except json.JSONDecodeError as e:
             print(f"❌ JSON 파싱 오류: {e}")
-            return self.get_default_questions()
+        except ValueError as e:
+            print(f"❌ 질문 데이터 형식 오류:\n{e}")
         except Exception as e:
             print(f"❌ 질문 로드 중 오류: {e}")
-            return self.get_default_questions()
+
+        questions = self.get_default_questions()
+        index = QuestionIndex(questions)
+        return questions, index, QuestionSearch(index)
+
+    def load_grader(self):
+        """참고 답안 파일로 채점기 생성 (파일이 없거나 잘못되었으면 빈 채점기)"""
+        try:
+            mtime = os.stat(self.references_path).st_mtime_ns
+            grader = AnswerGrader(load_references(self.references_path))
+            self.references_mtime = mtime
+            print(f"✅ 참고 답안 {len(grader)}개로 채점기를 준비했습니다.")
+            return grader
+        except FileNotFoundError:
+            print("ℹ️ 참고 답안 파일이 없어 길이 기반 기본 피드백을 사용합니다.")
+        except (ValueError, json.JSONDecodeError) as e:
+            print(f"❌ 참고 답안 형식 오류: {e}")
+        return AnswerGrader()
+
+    async def reload_grader(self, force=False):
+        """참고 답안 파일이 바뀌었으면 워커 스레드에서 채점기를 다시 생성해 교체
+
+        파일이 잘못되었으면 기존 채점기를 유지한 채 예외가 그대로 전달되며,
+        변경 시각을 갱신하지 않으므로 다음 확인 때 다시 시도합니다.
+        """
+        try:
+            stat = await asyncio.to_thread(os.stat, self.references_path)
+        except FileNotFoundError:
+            return
+        if not force and stat.st_mtime_ns == self.references_mtime:
+            return
+
+        references = await asyncio.to_thread(load_references, self.references_path)
+        self.grader = await asyncio.to_thread(AnswerGrader, references)
+        self.references_mtime = stat.st_mtime_ns
+        print(f"🔄 참고 답안 {len(self.grader)}개로 채점기를 다시 준비했습니다.")
+
+    async def reload_questions(self, force=False):
+        """질문 파일이 바뀌었으면 워커 스레드에서 다시 읽고 인덱스를 교체
+
+        변경 내용 요약 목록을 반환하고, 바뀐 내용이 없으면 None을 반환합니다.
+        파일이 잘못되었으면 기존 질문을 유지한 채 예외가 그대로 전달됩니다.
+        """
+        async with self._reload_lock:
+            stat = await asyncio.to_thread(os.stat, self.questions_path)
+            if not force and stat.st_mtime_ns == self.questions_mtime:
+                return None
+
+            bank, index, digest = await asyncio.to_thread(
+                load_question_bank, self.questions_path, self.dedup_threshold
+            )
+            self.questions_mtime = stat.st_mtime_ns
+            if digest == self.questions_digest:
+                return None
+
+            changes = diff_question_banks(self.question_bank, bank)
+            search = await asyncio.to_thread(QuestionSearch, index)
+
+            # await 없이 한 번에 교체하므로 명령 처리 중 반쯤 바뀐 상태가 보이지 않음
+            self.question_bank = bank
+            self.question_index = index
+            self.question_search = search
+            self.questions_digest = digest
+
+            print(f"🔄 질문 데이터를 다시 로드했습니다. (총 {len(index)}개)")
+            return changes
 
     def get_default_questions(self):
         """기본 질문 데이터 (폴백용)"""
@@ -84,58 +298,50 @@ class Study(commands.Cog):
         }
 
     def get_random_question(self, category=None):
-        """랜덤 질문 선택"""
-        # 사용 가능한 카테고리 목록
-        available_categories = list(self.question_bank.keys())
-
-        if category and category in available_categories:
-            main_category = self.question_bank[category]
-        else:
-            # 랜덤 카테고리 선택
-            category = random.choice(available_categories)
-            main_category = self.question_bank[category]
-
-        # 서브 카테고리 선택
-        sub_category = random.choice(list(main_category.keys()))
-        questions = main_category[sub_category]
-
-        return {
-            "category": category,
-            "sub_category": sub_category,
-            "question": random.choice(questions),
-        }
+        """랜덤 질문 선택 (모든 질문이 같은 확률)"""
+        if category not in self.question_index.ranges:
+            category = None
+        return self.question_index.random(category)
 
     def get_question_by_index(self, index, category_type):
         """인덱스 기반으로 질문 선택 (스케줄러용)"""
         if category_type not in ["backend", "frontend", "general"]:
             return None
 
-        main_category = self.question_bank.get(category_type, {})
-        if not main_category:
-            return None
+        # 인덱스가 전체 길이를 초과하면 다시 처음부터
+        return self.question_index.by_index(category_type, index)
+
+    def has_rubric(self, question):
+        reference = self.grader.references.get(question)
+        return bool(reference and reference.get("rubric"))
+
+    def select_route(self, q_info, answer):
+        """피드백 경로 선택 (대기열 길이는 피드백을 생성하는 시점 기준)"""
+        return self.router.select(
+            answer,
+            category=q_info.get("category"),
+            queue_depth=len(self.answer_queue),
+            has_rubric=self.has_rubric(q_info["question"]),
+        )
 
-        # 모든 질문을 하나의 리스트로 평탄화
-        all_questions = []
-        for sub_category, questions in main_category.items():
-            for question in questions:
-                all_questions.append(
-                    {
-                        "category": category_type,
-                        "sub_category": sub_category,
-                        "question": question,
-                    }
-                )
+    def build_feedback_prompt(self, question, answer, template="full"):
+        """템플릿에 맞는 피드백 요청 프롬프트 생성
 
-        if not all_questions:
-            return None
+        full: 자세한 피드백 / rubric: 미리 생성한 채점 기준으로 평가 (없으면 full)
+        short: 짧은 답변이나 과부하 때 쓰는 간단한 피드백
+        """
+        if template == "rubric" and self.has_rubric(question):
+            reference = self.grader.references[question]
+            return self.build_rubric_prompt(question, answer, reference)
+        if template == "short":
+            return f"""개발 멘토로서 다음 답변을 짧게 평가해주세요.
 
-        # 인덱스가 전체 길이를 초과하면 다시 처음부터
-        actual_index = index % len(all_questions)
-        return all_questions[actual_index]
+질문: {question}
+답변: {answer}
+
+첫 줄에 평가 이모지(✅ 좋은 답변 / ⚠️ 부분적으로 맞음 / ❌ 다시 생각해보세요)를 쓰고, 보완할 점을 3문장 이내로 친근하게 작성해주세요."""
 
-    async def generate_feedback(self, question, answer):
-        """Bedrock을 사용해 답변에 대한 피드백 생성"""
-        prompt = f"""당신은 친절한 개발 멘토입니다. 다음 질문과 답변을 보고 피드백을 작성해주세요.
+        return f"""당신은 친절한 개발 멘토입니다. 다음 질문과 답변을 보고 피드백을 작성해주세요.
 
 질문: {question}
 답변: {answer}
@@ -148,34 +354,122 @@ class Study(commands.Cog):
 
 친근하고 격려하는 톤으로 작성해주세요."""
 
-        try:
-            # Claude 3 Sonnet 모델 사용
-            body = json.dumps(
-                {
-                    "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
-                    "max_tokens_to_sample": 500,
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                }
-            )
+    def build_rubric_prompt(self, question, answer, reference):
+        """미리 생성한 핵심 포인트와 채점 기준으로 평가만 요청하는 프롬프트"""
+        points = "\n".join(f"- {point}" for point in reference["key_points"])
+        rubric = reference["rubric"]
+        return f"""개발 멘토로서 아래 기준으로 답변을 평가해주세요.
+
+질문: {question}
+핵심 포인트:
+{points}
+기준: ✅ {rubric["good"]} / ⚠️ {rubric["partial"]} / ❌ {rubric["retry"]}
+답변: {answer}
+
+첫 줄에 평가 이모지를 쓰고, 잘한 점과 빠진 핵심 포인트, 실무 팁을 5문장 이내로 친근하게 작성해주세요."""
+
+    async def generate_feedback(self, question, answer, route):
+        """Bedrock을 사용해 답변에 대한 피드백 생성 (route: ModelRouter가 고른 경로)"""
+        prompt = self.build_feedback_prompt(question, answer, route["template"])
 
-            response = self.bedrock_runtime.invoke_model(
-                body=body,
-                modelId="anthropic.claude-instant-v1",
-                accept="application/json",
-                contentType="application/json",
+        with metrics.timer(
+            "study_feedback_seconds", mode="complete", route=route["name"]
+        ) as labels:
+            try:
+                completion = await self.feedback_engine.complete(
+                    prompt, model_id=route["model"], max_tokens=route["max_tokens"]
+                )
+                if not completion:
+                    labels["outcome"] = "empty"
+                    return "피드백을 생성할 수 없습니다."
+
+                labels["outcome"] = "ok"
+                if self.router.cacheable(route):
+                    self.feedback_cache.put(question, answer, completion)
+                return completion
+
+            except asyncio.TimeoutError:
+                labels["outcome"] = "timeout"
+                print(f"Bedrock 시간 초과 ({self.feedback_engine.timeout}초)")
+                return self.generate_fallback_feedback(answer, question)
+            except Exception as e:
+                labels["outcome"] = "error"
+                print(f"Bedrock 오류: {e}")
+                # 폴백 피드백
+                return self.generate_fallback_feedback(answer, question)
+
+    async def stream_feedback(self, thinking_msg, question, answer, route):
+        """스트리밍으로 피드백을 받아 thinking_msg를 점진적으로 수정
+
+        Discord 레이트 리밋을 고려해 최대 edit_interval초에 한 번만 수정하고,
+        완성된 피드백 전체를 반환합니다. 스트림이 오류나 시간 초과로 중간에 끊기면
+        받은 조각 대신 기본 피드백을 반환합니다 (잘린 피드백을 저장/채점하지 않도록).
+        """
+        prompt = self.build_feedback_prompt(question, answer, route["template"])
+        loop = asyncio.get_running_loop()
+        parts = []
+        last_edit = 0
+        completed = False
+
+        with metrics.timer(
+            "study_feedback_seconds", mode="stream", route=route["name"]
+        ) as labels:
+            stream = self.feedback_engine.stream(
+                prompt, model_id=route["model"], max_tokens=route["max_tokens"]
             )
+            try:
+                try:
+                    async for chunk in stream:
+                        parts.append(chunk)
+                        now = loop.time()
+                        if now - last_edit >= self.edit_interval:
+                            last_edit = now
+                            embed = self.build_feedback_embed("".join(parts) + " ▌")
+                            await thinking_msg.edit(content=None, embed=embed)
+                finally:
+                    # 수정 실패 등으로 멈춰도 세마포어와 스트림을 바로 반환
+                    await stream.aclose()
+
+                # 끝까지 받은 피드백만 캐시
+                completed = True
+                labels["outcome"] = "ok" if parts else "empty"
+                if parts and self.router.cacheable(route):
+                    self.feedback_cache.put(question, answer, "".join(parts))
+
+            except asyncio.TimeoutError:
+                labels["outcome"] = "timeout"
+                print(f"Bedrock 스트리밍 시간 초과 ({self.feedback_engine.timeout}초)")
+            except Exception as e:
+                labels["outcome"] = "error"
+                print(f"Bedrock 스트리밍 오류: {e}")
 
-            response_body = json.loads(response.get("body").read())
-            return response_body.get("completion", "피드백을 생성할 수 없습니다.")
+        # 중간에 끊겼거나 받은 내용이 전혀 없으면 폴백 피드백
+        if completed and parts:
+            return "".join(parts)
+        return self.generate_fallback_feedback(answer, question)
 
-        except Exception as e:
-            print(f"Bedrock 오류: {e}")
-            # 폴백 피드백
-            return self.generate_fallback_feedback(answer)
+    def build_feedback_embed(self, feedback):
+        """피드백 임베드 생성"""
+        embed = discord.Embed(
+            title="📝 피드백",
+            description=feedback,
+            color=discord.Color.green(),
+        )
+
+        embed.add_field(
+            name="💡 다음 단계",
+            value="더 많은 질문을 원하시면 `!question` 명령어를 사용하세요!",
+            inline=False,
+        )
+        return embed
+
+    def generate_fallback_feedback(self, answer, question=None):
+        """Bedrock 사용 불가시 기본 피드백 (참고 답안이 있으면 핵심 포인트로 채점)"""
+        if question is not None:
+            feedback = self.grader.feedback(question, answer)
+            if feedback:
+                return feedback
 
-    def generate_fallback_feedback(self, answer):
-        """Bedrock 사용 불가시 기본 피드백"""
         if len(answer) < 20:
             return "❌ 답변이 너무 짧아요! 좀 더 자세히 설명해보세요."
         elif len(answer) > 200:
@@ -187,19 +481,97 @@ class Study(commands.Cog):
 
     @commands.command(name="question", aliases=["문제", "q"])
     async def ask_question(self, ctx, category: str = None):
-        """학습 질문 던지기"""
+        """학습 질문 던지기 (카테고리 대신 !search 결과의 질문 ID를 주면 그 질문)"""
         # 사용 가능한 카테고리 목록
-        available_categories = list(self.question_bank.keys())
+        available_categories = self.question_index.categories
 
-        # 카테고리 검증
+        # 카테고리가 아니면 질문 ID로 조회
         if category and category not in available_categories:
-            categories_str = ", ".join([f"'{cat}'" for cat in available_categories])
-            await ctx.send(f"❌ 카테고리는 {categories_str} 중에서 선택해주세요.")
+            q_data = self.question_index.by_key(category)
+            if q_data is None:
+                categories_str = ", ".join([f"'{cat}'" for cat in available_categories])
+                await ctx.send(
+                    f"❌ 카테고리는 {categories_str} 중에서 선택하거나 "
+                    "`!search` 결과의 질문 ID를 입력해주세요."
+                )
+                return
+            await self.send_question(
+                ctx, q_data, f"📌 {q_data['category'].upper()} 질문 #{q_data['key']}"
+            )
             return
 
         # 질문 생성
         q_data = self.get_random_question(category)
+        await self.send_question(
+            ctx, q_data, f"🔥 오늘의 {q_data['category'].upper()} 질문"
+        )
+
+    @commands.command(name="search", aliases=["검색"])
+    async def search_questions(self, ctx, *, keywords: str = None):
+        """키워드로 질문 검색 (첫 단어가 카테고리면 그 카테고리에서만)"""
+        if not keywords:
+            await ctx.send("❌ 검색어를 입력해주세요. 예: `!search 트랜잭션 격리`")
+            return
+
+        category = None
+        first, _, rest = keywords.partition(" ")
+        if first in self.question_index.categories and rest.strip():
+            category, keywords = first, rest
+
+        results = self.question_search.search(keywords, category=category)
+        if not results:
+            await ctx.send(f"🔍 '{keywords}'에 맞는 질문을 찾지 못했어요.")
+            return
 
+        lines = [
+            f"`#{q_data['key']}` [{q_data['category']}/{q_data['sub_category']}] "
+            f"{q_data['question']}"
+            for q_data in results
+        ]
+        embed = discord.Embed(
+            title=f"🔍 '{keywords}' 검색 결과",
+            description="\n".join(lines),
+            color=discord.Color.purple(),
+        )
+        embed.set_footer(text="!question <ID>로 원하는 질문을 바로 풀 수 있어요")
+        await ctx.send(embed=embed)
+
+    @commands.command(name="review", aliases=["복습"])
+    async def review_question(self, ctx):
+        """복습할 때가 된 질문 다시 풀기 (간격 반복)"""
+        if self.shared_store:
+            # 다른 샤드에서 갱신된 복습 일정 반영
+            rows = await asyncio.to_thread(self.db.load_review_items, ctx.author.id)
+            self.reviews.load_user(ctx.author.id, rows)
+
+        item = self.reviews.next_due(ctx.author.id)
+        if item is None:
+            upcoming = self.reviews.peek(ctx.author.id)
+            if upcoming is None:
+                await ctx.send(
+                    "📭 복습할 질문이 없어요. ⚠️/❌ 평가를 받은 질문이 복습 목록에 추가됩니다."
+                )
+            else:
+                due = datetime.fromtimestamp(upcoming["due"])
+                await ctx.send(
+                    f"✅ 지금 복습할 질문이 없어요. 다음 복습: {due:%Y-%m-%d %H:%M}"
+                )
+            return
+
+        remaining = self.reviews.due_count(ctx.author.id) - 1
+        q_data = {
+            "category": item["category"],
+            "sub_category": item["sub_category"],
+            "question": item["question"],
+        }
+        await self.send_question(
+            ctx,
+            q_data,
+            f"🔁 {ctx.author.display_name}님의 복습 질문 (남은 복습 {remaining}개)",
+        )
+
+    async def send_question(self, ctx, q_data, title):
+        """질문 임베드를 보내고 답변용 스레드를 만들어 활성 질문으로 등록"""
         # 카테고리별 색상 설정
         color_map = {
             "backend": discord.Color.orange(),
@@ -209,7 +581,7 @@ class Study(commands.Cog):
 
         # 임베드 생성
         embed = discord.Embed(
-            title=f"🔥 오늘의 {q_data['category'].upper()} 질문",
+            title=title,
             description=f"**Q. {q_data['question']}**",
             color=color_map.get(q_data["category"], discord.Color.purple()),
         )
@@ -273,48 +645,203 @@ class Study(commands.Cog):
         # 스레드에서의 메시지만 처리
         if isinstance(message.channel, discord.Thread):
             # 스레드 ID로 활성 질문 찾기
-            thread_id = message.channel.id
-            for q_id, q_info in self.active_questions.items():
-                if q_info.get("thread_id") == thread_id:
-                    # 모든 답변에 대해 피드백 제공
-                    await self.process_answer(message, q_id, q_info)
-                    return
-
-    async def process_answer(self, message, question_id, q_info):
+            if self.shared_store:
+                found = await self.active_questions.fetch_by_thread(message.channel.id)
+            else:
+                found = self.active_questions.get_by_thread(message.channel.id)
+            if found:
+                # 모든 답변에 대해 피드백 제공 (연속 메시지는 모아서 한 번에)
+                q_id, q_info = found
+                key = (message.channel.id, message.author.id)
+                started = self.debouncer.add(key, message, q_id, q_info)
+                if started and self.debouncer.window > 0:
+                    # 모으는 동안에도 답변을 받았다는 것을 바로 표시
+                    try:
+                        await message.add_reaction("👀")
+                    except discord.HTTPException:
+                        pass
+
+    @commands.Cog.listener()
+    async def on_thread_update(self, before, after):
+        """스레드가 보관되면 활성 질문에서 제거"""
+        if after.archived and not before.archived:
+            self.active_questions.remove_thread(after.id)
+
+    @commands.Cog.listener()
+    async def on_thread_delete(self, thread):
+        """스레드가 삭제되면 활성 질문에서 제거"""
+        self.active_questions.remove_thread(thread.id)
+
+    async def process_answer_burst(self, messages, question_id, q_info):
+        """연속으로 보낸 메시지를 합쳐 하나의 답변으로 처리"""
+        content = "\n".join(m.content for m in messages if m.content)
+        await self.process_answer(messages[-1], question_id, q_info, content)
+
+    async def process_answer(self, message, question_id, q_info, content=None):
         """답변 처리 및 피드백 생성"""
+        if content is None:
+            content = message.content
+
         # answered 플래그를 제거하여 여러 답변 허용
         # 대신 첫 답변인지 확인하여 점수 부여
         is_first_answer = not q_info.get("answered", False)
-        
+
         if is_first_answer:
             # 첫 답변일 때만 answered 플래그 설정
-            self.active_questions[question_id]["answered"] = True
+            q_info["answered"] = True
 
-        # 피드백 생성 중 메시지
-        thinking_msg = await message.reply("🤔 답변을 분석하고 있습니다...")
+        with metrics.timer("study_answer_seconds") as labels:
+            labels["outcome"] = await self.route_answer(
+                message, question_id, q_info, content, is_first_answer
+            )
 
-        try:
-            # 피드백 생성
-            feedback = await self.generate_feedback(q_info["question"], message.content)
+    async def route_answer(
+        self, message, question_id, q_info, content, is_first_answer
+    ):
+        """캐시/기본 피드백으로 바로 응답하거나 대기열에 등록하고 처리 경로 반환"""
+        # 같은 내용의 답변에 대한 피드백이 캐시되어 있으면 바로 응답
+        if self.shared_store:
+            cached = await self.feedback_cache.fetch(q_info["question"], content)
+        else:
+            cached = self.feedback_cache.get(q_info["question"], content)
+        if cached is not None:
+            await message.reply(embed=self.build_feedback_embed(cached))
+            self.save_answer(
+                question_id, q_info, message, content, cached, is_first_answer
+            )
+            return "cache"
 
-            # 피드백 임베드 생성
-            embed = discord.Embed(
-                title="📝 피드백",
-                description=feedback,
-                color=discord.Color.green(),
+        # 너무 짧은 답변은 모델 호출 없이 로컬 채점 결과로 응답
+        screened = self.grader.prescreen(q_info["question"], content)
+        if screened is not None:
+            embed = self.build_feedback_embed(screened)
+            embed.set_footer(
+                text="간단한 확인 결과예요. 내용을 보완해 다시 답변해보세요!"
+            )
+            await message.reply(embed=embed)
+            self.save_answer(
+                question_id, q_info, message, content, screened, is_first_answer
+            )
+            return "prescreen"
+
+        # Bedrock 장애(서킷 open) 중에는 기다리지 않고 기본 피드백으로 바로 응답
+        if self.feedback_engine.breaker.is_open():
+            await self.send_fallback_feedback(
+                message,
+                content,
+                question_id,
+                is_first_answer,
+                q_info,
+                "AI 피드백을 일시적으로 사용할 수 없어 기본 피드백을 드려요. 🙏",
             )
+            return "breaker_open"
 
-            embed.add_field(
-                name="💡 다음 단계",
-                value="더 많은 질문을 원하시면 `!question` 명령어를 사용하세요!",
-                inline=False,
+        # 대기열이 가득 차면 모델 호출 없이 기본 피드백으로 바로 응답
+        if self.answer_queue.full():
+            await self.send_fallback_feedback(
+                message, content, question_id, is_first_answer, q_info
             )
+            return "queue_full"
+
+        # 피드백 생성 중 메시지 (대기 중인 답변이 있으면 순서 안내)
+        waiting = len(self.answer_queue)
+        if waiting:
+            status = f"⏳ 답변 분석 대기 중입니다... (앞에 {waiting}개)"
+        else:
+            status = "🤔 답변을 분석하고 있습니다..."
+        thinking_msg = await message.reply(status)
+
+        job = {
+            "message": message,
+            "content": content,
+            "question_id": question_id,
+            "q_info": q_info,
+            "is_first_answer": is_first_answer,
+            "thinking_msg": thinking_msg,
+            "queued": bool(waiting),
+            "enqueued_at": time.monotonic(),
+        }
+        try:
+            self.answer_queue.submit(message.author.id, job, first=is_first_answer)
+        except QueueFullError:
+            await thinking_msg.delete()
+            await self.send_fallback_feedback(
+                message, content, question_id, is_first_answer, q_info
+            )
+            return "queue_full"
+        return "queued"
+
+    async def send_fallback_feedback(
+        self,
+        message,
+        content,
+        question_id,
+        is_first_answer,
+        q_info,
+        note="답변이 많아 간단한 피드백을 먼저 드려요. 🙏",
+    ):
+        """과부하나 장애 시 모델 호출 없이 기본 피드백으로 응답"""
+        feedback = self.generate_fallback_feedback(content, q_info["question"])
+        embed = self.build_feedback_embed(feedback)
+        embed.set_footer(text=note)
+        await message.reply(embed=embed)
+        self.save_answer(
+            question_id, q_info, message, content, feedback, is_first_answer
+        )
+
+    def save_answer(self, question_id, q_info, message, content, feedback, is_first):
+        """답변/피드백 저장, 통계와 복습 일정 갱신 (백그라운드에서 배치 커밋)"""
+        self.db.record_answer(question_id, message, content, feedback, is_first)
+        self.reviews.record(message.author.id, q_info, parse_grade(feedback))
+        self.stats.record(
+            message.author.id,
+            q_info.get("category"),
+            q_info.get("sub_category"),
+            feedback,
+            is_first,
+        )
+
+    async def handle_answer_job(self, job):
+        """대기열에서 꺼낸 답변의 피드백 생성 및 전송"""
+        message = job["message"]
+        content = job["content"]
+        q_info = job["q_info"]
+        thinking_msg = job["thinking_msg"]
+        metrics.observe(
+            "answer_queue_wait_seconds", time.monotonic() - job["enqueued_at"]
+        )
+
+        try:
+            if job["queued"]:
+                await thinking_msg.edit(content="🤔 답변을 분석하고 있습니다...")
+
+            # 피드백 생성 (스트리밍 모드에서는 생성 중에도 메시지를 갱신)
+            route = self.select_route(q_info, content)
+            if self.streaming_enabled:
+                feedback = await self.stream_feedback(
+                    thinking_msg, q_info["question"], content, route
+                )
+            else:
+                feedback = await self.generate_feedback(
+                    q_info["question"], content, route
+                )
 
             # 피드백 전송
+            embed = self.build_feedback_embed(feedback)
             await thinking_msg.edit(content=None, embed=embed)
 
+            # 답변과 피드백 저장
+            self.save_answer(
+                job["question_id"],
+                q_info,
+                message,
+                content,
+                feedback,
+                job["is_first_answer"],
+            )
+
             # 질문은 스레드가 살아있는 동안 계속 유지
-            # 24시간 후 스레드가 자동 보관되면 자연스럽게 종료됨
+            # 스레드가 보관되거나 24시간 동안 활동이 없으면 저장소에서 제거됨
 
         except Exception as e:
             await thinking_msg.edit(
@@ -323,13 +850,43 @@ class Study(commands.Cog):
 
     @commands.command(name="mystats", aliases=["내점수", "stats"])
     async def show_stats(self, ctx):
-        """학습 통계 보기 (향후 구현)"""
+        """학습 통계 보기"""
+        stats = await asyncio.to_thread(self.stats.get, ctx.author.id)
+
         embed = discord.Embed(
-            title="📊 학습 통계",
-            description="통계 기능은 곧 추가될 예정입니다!",
+            title=f"📊 {ctx.author.display_name}님의 학습 통계",
             color=discord.Color.purple(),
         )
 
+        if stats is None:
+            embed.description = (
+                "아직 답변 기록이 없어요. 스레드에서 첫 답변을 남겨보세요!"
+            )
+        else:
+            embed.add_field(
+                name="📝 답변",
+                value=f"- 전체: {stats['total_answers']}개\n"
+                f"- 첫 답변: {stats['first_answers']}개",
+                inline=True,
+            )
+            embed.add_field(
+                name="🔥 연속 학습",
+                value=f"- 현재: {stats['current_streak']}일\n"
+                f"- 최고: {stats['best_streak']}일",
+                inline=True,
+            )
+            embed.add_field(
+                name="🎯 평가",
+                value=f"✅ {stats['good']} / ⚠️ {stats['partial']} / ❌ {stats['retry']}",
+                inline=True,
+            )
+
+            categories = "\n".join(
+                f"- {category}.{sub_category}: {answers}개"
+                for category, sub_category, answers in stats["categories"][:10]
+            )
+            embed.add_field(name="📚 카테고리별 답변", value=categories, inline=False)
+
         embed.add_field(
             name="🎯 목표",
             value="매일 1문제씩, 3개월이면 90문제!",
@@ -338,6 +895,26 @@ class Study(commands.Cog):
 
         await ctx.send(embed=embed)
 
+    @commands.command(name="leaderboard", aliases=["랭킹", "순위"])
+    async def show_leaderboard(self, ctx):
+        """답변 수 기준 상위 10명"""
+        ranking = await asyncio.to_thread(self.stats.leaderboard, 10)
+
+        if not ranking:
+            await ctx.send("아직 답변 기록이 없어요!")
+            return
+
+        lines = [
+            f"{rank}. <@{user_id}> - {total}개 (최고 연속 {best_streak}일)"
+            for rank, (user_id, total, best_streak) in enumerate(ranking, start=1)
+        ]
+        embed = discord.Embed(
+            title="🏆 학습 랭킹",
+            description="\n".join(lines),
+            color=discord.Color.gold(),
+        )
+        await ctx.send(embed=embed)
+
     @commands.command(name="scheduler_status", aliases=["스케줄러"])
     async def scheduler_status(self, ctx):
         """스케줄러 상태 확인"""
@@ -345,7 +922,8 @@ class Study(commands.Cog):
 
         embed = discord.Embed(
             title="⏰ 스케줄러 상태",
-            description=f"매일 오전 10시에 자동으로 질문이 게시됩니다.",
+            description=f"매일 {self.daily_hour:02d}:{self.daily_minute:02d}"
+            f" ({self.daily_tz})에 자동으로 질문이 게시됩니다.",
             color=discord.Color.blue(),
         )
 
@@ -358,48 +936,181 @@ class Study(commands.Cog):
             inline=False,
         )
 
+        jobs = "\n".join(
+            f"- <#{job['channel_id']}>: 다음 게시 "
+            f"{self.scheduler.next_run(key).astimezone(job['tz']):%Y-%m-%d %H:%M %Z}"
+            for key, job in self.scheduler.jobs.items()
+        )
         embed.add_field(
             name="🔄 스케줄러 상태",
-            value=f"실행 중: {'✅' if self.daily_question.is_running() else '❌'}",
+            value=f"실행 중: {'✅' if self.scheduler.is_running() else '❌'}\n"
+            + (jobs or "- 등록된 채널이 없습니다."),
             inline=False,
         )
 
         embed.add_field(
             name="📊 질문 게시 정보",
-            value=f"- 매일 3개의 질문 게시 (Backend, Frontend, General)\n"
-            f"- 각 카테고리는 순차적으로 진행\n"
-            f"- 모든 질문을 다 돌면 처음부터 다시 시작",
+            value="- 매일 3개의 질문 게시 (Backend, Frontend, General)\n"
+            "- 각 카테고리는 순차적으로 진행\n"
+            "- 모든 질문을 다 돌면 처음부터 다시 시작\n"
+            "- 봇이 꺼져 있어 놓친 게시는 재시작 후 보충되며, 하루에 두 번 게시되지 않음",
             inline=False,
         )
 
         await ctx.send(embed=embed)
 
+    @commands.command(name="reload_questions", aliases=["질문리로드"])
+    @commands.has_permissions(administrator=True)
+    async def reload_questions_command(self, ctx):
+        """질문 파일 다시 불러오기 (관리자 전용)"""
+        try:
+            await self.reload_grader(force=True)
+        except Exception as e:
+            await ctx.send(
+                f"⚠️ 참고 답안 파일을 불러오지 못했습니다. 기존 채점기를 유지합니다.\n{e}"
+            )
+
+        try:
+            changes = await self.reload_questions(force=True)
+        except Exception as e:
+            await ctx.send(
+                f"❌ 질문 파일을 불러오지 못했습니다. 기존 질문을 유지합니다.\n{e}"
+            )
+            return
+
+        if changes is None:
+            await ctx.send("ℹ️ 질문 파일에 변경 사항이 없습니다.")
+            return
+
+        summary = "\n".join(changes[:20]) or "순서만 변경됨"
+        await ctx.send(
+            f"✅ 질문 {len(self.question_index)}개를 다시 불러왔습니다.\n```\n{summary}\n```"
+        )
+
+    @tasks.loop(seconds=30)
+    async def watch_questions(self):
+        """질문/참고 답안 파일 변경 감지 시 자동으로 다시 로드"""
+        try:
+            await self.reload_grader()
+        except Exception as e:
+            print(f"❌ 참고 답안 다시 로드 실패 (기존 채점기 유지): {e}")
+
+        try:
+            changes = await self.reload_questions()
+        except Exception as e:
+            print(f"❌ 질문 파일 다시 로드 실패 (기존 질문 유지): {e}")
+            return
+
+        if changes:
+            print(f"📝 변경 사항: {', '.join(changes)}")
+
     @commands.command(name="post_daily", aliases=["일일질문"])
     @commands.has_permissions(administrator=True)
-    async def post_daily_question(self, ctx):
-        """수동으로 일일 질문 게시 (관리자 전용)"""
-        await self.daily_question()
+    async def post_daily_question(self, ctx, option: str = None):
+        """수동으로 일일 질문 게시 (관리자 전용, 오늘 이미 게시했으면 `force` 필요)"""
+        key = f"daily:{ctx.channel.id}"
+        job = self.scheduler.jobs.get(key, {"tz": ZoneInfo(self.daily_tz)})
+        run_date = self.scheduler.local_date(job)
+
+        # 스케줄러와 같은 실행 키를 사용해 같은 날 중복 게시 방지
+        claimed = await self.scheduler.claim(key, run_date)
+        if not claimed and option != "force":
+            await ctx.send(
+                "ℹ️ 오늘의 일일 질문이 이미 게시되었습니다. "
+                "다시 게시하려면 `!post_daily force`를 사용하세요."
+            )
+            return
+
+        await self.post_daily_questions(ctx.channel, run_date)
         await ctx.send("✅ 일일 질문이 게시되었습니다!")
 
-    @tasks.loop(hours=24)
-    async def daily_question(self):
-        """매일 오전 10시에 질문 자동 게시"""
-        if not self.allowed_channel_id:
+    @commands.command(name="schedule_here", aliases=["일일질문설정"])
+    @commands.has_permissions(administrator=True)
+    @commands.guild_only()
+    async def schedule_here(self, ctx, time: str = None, tz_name: str = None):
+        """이 채널을 서버의 일일 질문 채널로 설정 (관리자 전용)
+
+        예: !schedule_here 09:30 Asia/Seoul
+        """
+        time = time or f"{self.daily_hour:02d}:{self.daily_minute:02d}"
+        tz_name = tz_name or self.daily_tz
+        try:
+            hour, minute = (int(part) for part in time.split(":"))
+            datetime(2000, 1, 1, hour, minute, tzinfo=ZoneInfo(tz_name))
+        except (ValueError, ZoneInfoNotFoundError):
+            await ctx.send(
+                "❌ 시간은 HH:MM, 시간대는 Asia/Seoul 같은 형식으로 입력해주세요."
+            )
+            return
+
+        if ctx.channel.id == self.allowed_channel_id:
+            # 기본 일일 질문 작업과 같은 키라 덮어쓰거나 !unschedule로 지우게 됨
+            await ctx.send(
+                "ℹ️ 이 채널은 이미 기본 일일 질문 채널(ALLOWED_CHANNEL_ID)입니다."
+            )
+            return
+
+        self.remove_guild_schedule(ctx.guild.id)
+        self.add_guild_schedule(ctx.guild.id, ctx.channel.id, hour, minute, tz_name)
+        self.db.save_guild_schedule(ctx.guild.id, ctx.channel.id, hour, minute, tz_name)
+        await ctx.send(
+            f"✅ 매일 {hour:02d}:{minute:02d} ({tz_name})에 이 채널에 질문을 게시합니다."
+        )
+
+    @commands.command(name="unschedule", aliases=["일일질문해제"])
+    @commands.has_permissions(administrator=True)
+    @commands.guild_only()
+    async def unschedule(self, ctx):
+        """서버의 일일 질문 일정 해제 (관리자 전용)"""
+        if self.remove_guild_schedule(ctx.guild.id) is None:
+            await ctx.send("ℹ️ 이 서버에 설정된 일일 질문 일정이 없습니다.")
+            return
+
+        self.db.delete_guild_schedule(ctx.guild.id)
+        await ctx.send("✅ 일일 질문 일정을 해제했습니다.")
+
+    def add_guild_schedule(self, guild_id, channel_id, hour, minute, timezone):
+        """서버별 일일 질문 작업 등록 (기본 일일 질문 채널이면 등록하지 않음)"""
+        if channel_id == self.allowed_channel_id:
             print(
-                "❌ ALLOWED_CHANNEL_ID가 설정되지 않아 스케줄러를 실행할 수 없습니다."
+                f"ℹ️ 채널 {channel_id}는 기본 일일 질문 채널이라 서버 일정을 건너뜁니다."
             )
             return
+        self.scheduler.add_job(
+            f"daily:{channel_id}",
+            hour,
+            minute,
+            timezone,
+            channel_id=channel_id,
+            guild_id=guild_id,
+        )
+
+    def remove_guild_schedule(self, guild_id):
+        """서버별 일일 질문 작업 제거, 없으면 None"""
+        for key, job in list(self.scheduler.jobs.items()):
+            if job.get("guild_id") == guild_id:
+                return self.scheduler.remove_job(key)
+        return None
 
-        channel = self.bot.get_channel(self.allowed_channel_id)
+    async def run_daily_job(self, key, job, run_date):
+        """스케줄러가 호출하는 일일 질문 게시 작업"""
+        channel = self.bot.get_channel(job["channel_id"])
         if not channel:
-            print(f"❌ 채널 {self.allowed_channel_id}를 찾을 수 없습니다.")
+            print(f"❌ 채널 {job['channel_id']}를 찾을 수 없습니다.")
             return
 
+        await self.post_daily_questions(channel, run_date)
+
+    async def post_daily_questions(self, channel, run_date):
+        """run_date 기준 Day 인덱스의 질문을 카테고리별로 게시"""
+        self.bot.dispatch("daily_questions", channel, run_date)
+
         # 시작일로부터 경과한 일수 계산
-        days_passed = (datetime.now().date() - self.start_date.date()).days
+        days_passed = (run_date - self.start_date.date()).days
 
         # 세 가지 카테고리 모두 처리
         categories = ["backend", "frontend", "general"]
+        posted = []
 
         for category_type in categories:
             # 각 카테고리별로 인덱스 계산
@@ -443,69 +1154,67 @@ class Study(commands.Cog):
                 text=f"카테고리: {q_data['sub_category']} | 인덱스: {category_index} | 답변 후 자동으로 피드백을 받을 수 있습니다"
             )
 
-            # 질문 메시지 전송
+            # 질문 메시지는 카테고리 순서대로 전송
             question_msg = await channel.send(embed=embed)
+            posted.append((question_msg, q_data))
+
+        # 스레드 생성과 안내 메시지는 동시에 진행
+        # (Discord 레이트 리밋은 discord.py가 라우트별 버킷 기준으로 조절)
+        await asyncio.gather(
+            *(
+                self.open_daily_thread(question_msg, q_data, days_passed)
+                for question_msg, q_data in posted
+            )
+        )
 
-            # 자동으로 스레드 생성
-            try:
-                thread = await question_msg.create_thread(
-                    name=f"💬 Day {days_passed + 1} - {q_data['category']} 질문",
-                    auto_archive_duration=1440,  # 24시간 후 자동 보관
-                )
-
-                # 스레드에 안내 메시지
-                await thread.send(
-                    f"**📅 Day {days_passed + 1} 질문입니다!**\n"
-                    f"질문: {q_data['question']}\n\n"
-                    f"답변을 작성하시면 AI가 피드백을 제공합니다. 💡"
-                )
-
-                # 활성 질문으로 저장
-                self.active_questions[question_msg.id] = {
-                    "question": q_data["question"],
-                    "category": q_data["category"],
-                    "sub_category": q_data["sub_category"],
-                    "asked_at": datetime.now(),
-                    "author_id": self.bot.user.id,  # 봇이 질문한 것으로 표시
-                    "thread_id": thread.id,
-                    "answered": False,
-                    "scheduled": True,  # 스케줄러로 생성된 질문 표시
-                }
-
-                print(
-                    f"✅ Day {days_passed + 1} {category_type} 질문이 게시되었습니다."
-                )
-
-            except discord.errors.Forbidden:
-                print("❌ 스레드 생성 권한이 없습니다.")
-            except Exception as e:
-                print(f"❌ 스케줄러 오류: {e}")
-
-            # 질문 간 약간의 딜레이 (스팸 방지)
-            await discord.utils.sleep_until(datetime.now() + timedelta(seconds=2))
-
-    @daily_question.before_loop
-    async def before_daily_question(self):
-        """스케줄러 시작 전 봇이 준비될 때까지 대기"""
-        await self.bot.wait_until_ready()
+    async def open_daily_thread(self, question_msg, q_data, days_passed):
+        """일일 질문 메시지에 답변용 스레드를 만들고 활성 질문으로 등록"""
+        try:
+            thread = await question_msg.create_thread(
+                name=f"💬 Day {days_passed + 1} - {q_data['category']} 질문",
+                auto_archive_duration=1440,  # 24시간 후 자동 보관
+            )
 
-        # 다음 10시까지 대기
-        now = datetime.now()
-        next_run = now.replace(hour=10, minute=0, second=0, microsecond=0)
+            # 스레드에 안내 메시지
+            await thread.send(
+                f"**📅 Day {days_passed + 1} 질문입니다!**\n"
+                f"질문: {q_data['question']}\n\n"
+                f"답변을 작성하시면 AI가 피드백을 제공합니다. 💡"
+            )
 
-        # 만약 현재 시간이 10시를 지났다면 다음날 10시로 설정
-        if now.hour >= 10:
-            next_run += timedelta(days=1)
+            # 활성 질문으로 저장
+            self.active_questions[question_msg.id] = {
+                "question": q_data["question"],
+                "category": q_data["category"],
+                "sub_category": q_data["sub_category"],
+                "asked_at": datetime.now(),
+                "author_id": self.bot.user.id,  # 봇이 질문한 것으로 표시
+                "thread_id": thread.id,
+                "answered": False,
+                "scheduled": True,  # 스케줄러로 생성된 질문 표시
+            }
 
-        wait_seconds = (next_run - now).total_seconds()
-        print(f"⏰ 스케줄러가 {next_run}에 시작됩니다. ({wait_seconds:.0f}초 대기)")
+            print(
+                f"✅ Day {days_passed + 1} {q_data['category']} 질문이 "
+                f"#{question_msg.channel} 채널에 게시되었습니다."
+            )
 
-        # 대기
-        await discord.utils.sleep_until(next_run)
+        except discord.errors.Forbidden:
+            print("❌ 스레드 생성 권한이 없습니다.")
+        except Exception as e:
+            print(f"❌ 스케줄러 오류: {e}")
 
     def cog_unload(self):
         """Cog이 언로드될 때 스케줄러 중지"""
-        self.daily_question.cancel()
+        self.scheduler.stop()
+        self.watch_questions.cancel()
+        self.answer_queue.stop()
+        self.debouncer.cancel()
+        metrics.unregister(*(name for name, _, _ in self.metric_collectors()))
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+        self.feedback_engine.close()
+        self.db.close()
 
 
 async def setup(bot):
@@ -1,9 +1,25 @@
+import asyncio
+import importlib
 import os
+import subprocess
+import sys
+import time
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+from utils.metrics import LoopLagMonitor, metrics, start_http_server
+from utils.startup import StartupTimer
+from utils.traffic import TrafficRecorder
+from utils.watchdog import LoopWatchdog, format_report
+
+# 시작 단계별 소요 시간 측정
+startup = StartupTimer()
+
+# 이벤트 루프 멈춤 감시 (WATCHDOG_THRESHOLD초 이상 멈추면 스택 캡처)
+watchdog = LoopWatchdog()
+
 # 환경 변수 로드
 load_dotenv()
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
@@ -14,29 +30,85 @@ ALLOWED_CHANNEL_ID = (
     else None
 )
 
+# 메트릭 HTTP 엔드포인트 (포트가 0이면 비활성화)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# 설정하면 받은 메시지/스레드 이벤트를 익명화해 JSONL로 기록 (benchmarks/replay.py로 재생)
+RECORD_TRAFFIC_PATH = os.getenv("RECORD_TRAFFIC_PATH")
+
+# true면 게이트웨이에 먼저 연결하고 Cog는 연결과 동시에 불러옴
+LAZY_COGS = os.getenv("LAZY_COGS", "false").lower() in ("1", "true", "yes")
+
+# 샤딩 설정
+# - none: 게이트웨이 연결 하나로 실행 (기본값)
+# - auto: 한 프로세스에서 필요한 수만큼 샤드 연결 (AutoShardedBot)
+# - process: 샤드를 SHARD_PROCESSES개 그룹으로 나눠 그룹마다 프로세스 하나씩 실행
+SHARD_MODE = os.getenv("SHARD_MODE", "none").lower()
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = (
+    [int(shard_id) for shard_id in os.getenv("SHARD_IDS").split(",")]
+    if os.getenv("SHARD_IDS")
+    else None
+)
+
 # 봇 설정
 intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
 
-bot = commands.Bot(command_prefix=PREFIX, intents=intents)
+if SHARD_MODE == "none":
+    bot = commands.Bot(command_prefix=PREFIX, intents=intents)
+else:
+    bot = commands.AutoShardedBot(
+        command_prefix=PREFIX,
+        intents=intents,
+        shard_count=SHARD_COUNT,
+        shard_ids=SHARD_IDS,
+    )
+
+
+# 트래픽 기록기 (RECORD_TRAFFIC_PATH가 있을 때만)
+recorder = (
+    TrafficRecorder(RECORD_TRAFFIC_PATH, bot, PREFIX) if RECORD_TRAFFIC_PATH else None
+)
+
+# Cog 로드가 끝났는지 표시 (LAZY_COGS 모드에서 명령 처리를 잠시 대기시키는 데 사용)
+extensions_loaded = None
 
 
 # Cogs 로드
 async def load_extensions():
-    for filename in os.listdir("./cogs"):
-        if filename.endswith(".py"):
-            try:
-                await bot.load_extension(f"cogs.{filename[:-3]}")
-                print(f"✅ Loaded: {filename[:-3]}")
-            except Exception as e:
-                print(f"❌ Failed to load {filename[:-3]}: {e}")
+    names = [
+        filename[:-3] for filename in os.listdir("./cogs") if filename.endswith(".py")
+    ]
+
+    # 무거운 의존성 임포트를 워커 스레드에서 미리 해 두어 이벤트 루프를 막지 않음
+    if LAZY_COGS:
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(importlib.import_module, f"cogs.{name}")
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+
+    for name in names:
+        try:
+            with startup.phase(f"cog {name}"):
+                await bot.load_extension(f"cogs.{name}")
+            print(f"✅ Loaded: {name}")
+        except Exception as e:
+            print(f"❌ Failed to load {name}: {e}")
 
 
 @bot.event
 async def on_ready():
+    startup.mark("on_ready")
     print(f"✅ {bot.user} 온라인!")
     print(f"📋 서버: {len(bot.guilds)}개")
+    if bot.shard_count:
+        print(f"🧩 샤드: {sorted(bot.shards)} / 전체 {bot.shard_count}개")
 
     if ALLOWED_CHANNEL_ID:
         print(f"🎯 허용된 채널: {ALLOWED_CHANNEL_ID}")
@@ -57,7 +129,22 @@ async def on_message(message):
     if ALLOWED_CHANNEL_ID and message.channel.id != ALLOWED_CHANNEL_ID:
         return
 
-    await bot.process_commands(message)
+    # Cog 로드 전에 들어온 명령은 로드가 끝날 때까지 대기
+    if extensions_loaded is not None and not extensions_loaded.is_set():
+        await extensions_loaded.wait()
+
+    await process_commands(message)
+
+
+async def process_commands(message):
+    """bot.process_commands와 같지만 명령별 처리 시간을 메트릭에 기록"""
+    ctx = await bot.get_context(message)
+    if ctx.invoked_with is None:  # 명령이 아닌 일반 메시지
+        return
+
+    command = ctx.command.qualified_name if ctx.command else "unknown"
+    with metrics.timer("discord_command_seconds", command=command):
+        await bot.invoke(ctx)
 
 
 @bot.command(name="ping")
@@ -81,12 +168,49 @@ async def info(ctx):
         name="지연시간", value=f"{round(bot.latency * 1000)}ms", inline=True
     )
     embed.add_field(name="채널 ID", value=ALLOWED_CHANNEL_ID, inline=True)
+    embed.add_field(name="시작 단계", value=startup.summary(), inline=False)
     await ctx.send(embed=embed)
 
 
+@bot.command(name="metrics", aliases=["메트릭"])
+@commands.has_permissions(administrator=True)
+async def show_metrics(ctx):
+    """지연 시간 분위수와 대기열/캐시 상태 보기 (관리자 전용)"""
+    summary = metrics.summary() or "아직 기록된 메트릭이 없습니다."
+    if len(summary) > 1900:
+        summary = summary[:1900] + "\n..."
+    await ctx.send(f"📈 런타임 메트릭\n```\n{summary}\n```")
+
+
+@bot.command(name="lagreport", aliases=["지연보고"])
+@commands.is_owner()
+async def lag_report(ctx, count: int = 1):
+    """최근 이벤트 루프 멈춤 보고서 보기 (봇 소유자 전용)"""
+    if not watchdog.enabled:
+        await ctx.send("ℹ️ 워치독이 비활성화되어 있습니다. (`WATCHDOG_THRESHOLD=0`)")
+        return
+    if not watchdog.reports:
+        await ctx.send(
+            f"✅ {watchdog.threshold}초 이상 이벤트 루프가 멈춘 기록이 없습니다."
+        )
+        return
+
+    # 최신 보고서부터 count개, 메시지 길이 제한에 맞춰 자르기
+    reports = list(watchdog.reports)[-max(1, count) :][::-1]
+    for report in reports:
+        text = format_report(report)
+        if len(text) > 1900:
+            text = "...\n" + text[-1900:]
+        await ctx.send(f"🐢 이벤트 루프 멈춤 보고서\n```\n{text}\n```")
+
+
 # 에러 핸들러
 @bot.event
 async def on_command_error(ctx, error):
+    command = ctx.command.qualified_name if ctx.command else "unknown"
+    metrics.inc(
+        "discord_command_errors_total", command=command, error=type(error).__name__
+    )
     if isinstance(error, commands.CommandNotFound):
         await ctx.send("❌ 존재하지 않는 명령어입니다.")
     elif isinstance(error, commands.MissingRequiredArgument):
@@ -97,12 +221,114 @@ async def on_command_error(ctx, error):
 
 # 봇 실행
 async def main():
+    # 이벤트 루프 지연 측정/멈춤 감시와 Prometheus 엔드포인트
+    lag_monitor = LoopLagMonitor()
+    lag_monitor.start()
+    watchdog.start()
+    if recorder:
+        recorder.attach()
+    metrics_runner = None
+    if METRICS_PORT:
+        try:
+            metrics_runner = await start_http_server(METRICS_PORT, METRICS_HOST)
+            print(f"📈 메트릭: http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+        except OSError as e:
+            # 메트릭 문제로 샤드가 뜨지 못하는 일은 없도록 엔드포인트만 포기
+            print(f"⚠️ 메트릭 서버를 시작하지 못했습니다 (포트 {METRICS_PORT}): {e}")
+
+    try:
+        await run_bot()
+    finally:
+        lag_monitor.stop()
+        watchdog.stop()
+        if recorder:
+            recorder.close()
+        if metrics_runner:
+            await metrics_runner.cleanup()
+
+
+async def run_bot():
+    global extensions_loaded
+
     async with bot:
-        await load_extensions()
-        await bot.start(TOKEN)
+        if not LAZY_COGS:
+            with startup.phase("extensions"):
+                await load_extensions()
+            with startup.phase("login"):
+                await bot.login(TOKEN)
+            await bot.connect()
+            return
 
+        # 게이트웨이 연결과 Cog 로드를 동시에 진행
+        extensions_loaded = asyncio.Event()
+        with startup.phase("login"):
+            await bot.login(TOKEN)
+        connection = asyncio.create_task(bot.connect())
+        try:
+            with startup.phase("extensions"):
+                await load_extensions()
+        finally:
+            extensions_loaded.set()
+        await connection
 
-if __name__ == "__main__":
-    import asyncio
 
-    asyncio.run(main())
+async def fetch_shard_count():
+    """Discord가 권장하는 샤드 수 조회"""
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await http.static_login(TOKEN)
+        shard_count, _ = await http.get_bot_gateway()
+        return shard_count
+    finally:
+        await http.close()
+
+
+def run_shard_processes():
+    """샤드 그룹마다 자식 프로세스를 하나씩 실행하고 모두 끝날 때까지 대기
+
+    자식 프로세스는 같은 SQLite 저장소를 공유하므로(STUDY_SHARED_STORE)
+    어느 샤드에서든 스레드 답변을 처리할 수 있습니다.
+    """
+    shard_count = SHARD_COUNT or asyncio.run(fetch_shard_count())
+    processes = int(os.getenv("SHARD_PROCESSES", str(os.cpu_count() or 1)))
+    processes = max(1, min(processes, shard_count))
+    groups = [list(range(i, shard_count, processes)) for i in range(processes)]
+
+    children = []
+    try:
+        for i, shard_ids in enumerate(groups):
+            env = dict(
+                os.environ,
+                SHARD_MODE="auto",
+                SHARD_COUNT=str(shard_count),
+                SHARD_IDS=",".join(map(str, shard_ids)),
+                STUDY_SHARED_STORE="true",
+            )
+            # 같은 포트를 두고 자식끼리 경쟁하지 않도록 METRICS_PORT부터 하나씩 배정
+            if METRICS_PORT:
+                env["METRICS_PORT"] = str(METRICS_PORT + i)
+            # 기록 파일도 프로세스마다 따로 (한 파일에 섞이면 replay가 세션을 나누지 못함)
+            if RECORD_TRAFFIC_PATH:
+                root, ext = os.path.splitext(RECORD_TRAFFIC_PATH)
+                env["RECORD_TRAFFIC_PATH"] = f"{root}.shard{i}{ext}"
+            children.append(subprocess.Popen([sys.executable, __file__], env=env))
+            print(f"🧩 샤드 {shard_ids} 프로세스 시작 (pid {children[-1].pid})")
+
+            # 게이트웨이 IDENTIFY 제한(5초에 1회)을 넘지 않도록 그룹마다 간격 두기
+            time.sleep(5 * len(shard_ids))
+
+        for child in children:
+            child.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for child in children:
+            if child.poll() is None:
+                child.terminate()
+
+
+if __name__ == "__main__":
+    if SHARD_MODE == "process":
+        run_shard_processes()
+    else:
+        asyncio.run(main())
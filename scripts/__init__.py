@@ -0,0 +1 @@
+"""봇과 별도로 실행하는 운영용 배치 스크립트"""
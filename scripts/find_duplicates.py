@@ -0,0 +1,101 @@
+"""질문 파일에서 비슷한 질문 묶음을 MinHash/LSH로 찾아 보고하는 스크립트
+
+사용 예 (저장소 루트에서):
+    python -m scripts.find_duplicates
+    python -m scripts.find_duplicates --threshold 0.5 --json duplicates.json
+    python -m scripts.find_duplicates --check  # 묶음이 있으면 종료 코드 1
+
+각 묶음의 첫 질문이 원본이고, 봇을 QUESTION_DEDUP=true로 실행하면 같은 기준으로
+카테고리 안의 나머지 질문을 출제 순서에서 제외합니다. #ID는 !question <ID>의 ID입니다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from utils.dedup import MinHashLSH, find_duplicates, jaccard, shingles
+from utils.question_index import load_question_bank
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def build_report(index, clusters):
+    """묶음별 질문 정보와 원본과의 유사도"""
+    report = []
+    for members in clusters:
+        original = shingles(index.questions[members[0]])
+        report.append(
+            [
+                dict(
+                    index.get(question_id),
+                    similarity=round(
+                        jaccard(original, shingles(index.questions[question_id])), 3
+                    ),
+                )
+                for question_id in members
+            ]
+        )
+    return report
+
+
+def print_report(report, total, elapsed):
+    print(f"🔍 질문 {total}개에서 비슷한 질문 묶음 {len(report)}개 ({elapsed:.2f}초)")
+    for number, cluster in enumerate(report, 1):
+        print(f"\n[{number}]")
+        for i, q_data in enumerate(cluster):
+            mark = "원본" if i == 0 else f"{q_data['similarity']:.2f}"
+            print(
+                f"  #{q_data['key']} ({mark}) "
+                f"[{q_data['category']}/{q_data['sub_category']}] {q_data['question']}"
+            )
+    if report:
+        duplicates = sum(len(cluster) - 1 for cluster in report)
+        print(
+            f"\n🧹 QUESTION_DEDUP=true면 최대 {duplicates}개가 출제 순서에서 빠집니다."
+        )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--questions", default=str(DATA_DIR / "questions.json"), help="질문 파일"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.6,
+        help="같은 묶음으로 볼 문자 3-gram Jaccard 유사도",
+    )
+    parser.add_argument("--bands", type=int, default=32, help="LSH 밴드 수")
+    parser.add_argument("--rows", type=int, default=4, help="밴드당 해시 수")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument(
+        "--check", action="store_true", help="묶음이 있으면 종료 코드 1 (CI용)"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    _, index, _ = load_question_bank(args.questions)
+
+    started = time.perf_counter()
+    lsh = MinHashLSH(bands=args.bands, rows=args.rows)
+    clusters = []
+    # 일일 질문은 카테고리별로 돌아가므로 카테고리 안에서만 비교
+    for start, end in index.ranges.values():
+        for members in find_duplicates(index.questions[start:end], args.threshold, lsh):
+            clusters.append([start + i for i in members])
+    report = build_report(index, clusters)
+    print_report(report, len(index), time.perf_counter() - started)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if args.check and report else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
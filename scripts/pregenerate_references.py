@@ -0,0 +1,290 @@
+"""질문 은행 전체의 참고 답안/핵심 포인트/채점 기준을 Bedrock으로 미리 생성하는 배치 스크립트
+
+사용 예 (저장소 루트에서, .env의 AWS 설정 사용):
+    python -m scripts.pregenerate_references --concurrency 4
+    python -m scripts.pregenerate_references --limit 30 --days-ahead 14
+    python -m scripts.pregenerate_references --merge-only
+
+앞으로 게시될 일일 질문부터 생성하고, 결과는 질문마다 체크포인트(JSONL)에 바로 추가하므로
+중간에 멈춰도 다시 실행하면 이어서 진행합니다. 끝나면(중단해도) data/references.json에
+합쳐 쓰며, 실행 중인 봇은 파일 변경을 감지해 채점기를 다시 불러옵니다.
+손으로 작성한 핵심 포인트는 --overwrite 없이는 유지하고 참고 답안과 채점 기준만 채웁니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from utils.bedrock import DEFAULT_MODEL_ID, FeedbackEngine
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.grader import RUBRIC_GRADES, load_references
+from utils.question_index import load_question_bank
+from utils.scheduler import START_DATE
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DAILY_CATEGORIES = ("backend", "frontend", "general")
+
+
+def build_prompt(question, category):
+    """참고 답안과 채점 기준을 JSON으로 요청하는 프롬프트"""
+    return f"""당신은 개발자 기술 면접관입니다. 다음 면접 질문의 참고 답안과 채점 기준을 만들어주세요.
+
+분야: {category}
+질문: {question}
+
+다른 설명 없이 아래 형식의 JSON 객체 하나로만 답해주세요.
+{{"reference_answer": "실무 예시를 포함한 5~8문장의 모범 답안",
+ "key_points": ["좋은 답변이 반드시 다뤄야 할 핵심 포인트 (한 문장씩 3~5개)"],
+ "rubric": {{"good": "✅ 좋은 답변의 기준",
+             "partial": "⚠️ 부분적으로 맞는 답변의 기준",
+             "retry": "❌ 다시 생각해야 하는 답변의 기준"}}}}"""
+
+
+def parse_reference(text):
+    """모델 응답에서 JSON 객체를 꺼내 검증 (형식이 맞지 않으면 ValueError)"""
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError("응답에 JSON 객체가 없습니다")
+    data = json.loads(text[start : end + 1])
+
+    answer = data.get("reference_answer")
+    points = data.get("key_points")
+    rubric = data.get("rubric")
+    if not isinstance(answer, str) or not answer.strip():
+        raise ValueError("reference_answer가 비어 있습니다")
+    if not isinstance(points, list) or not all(
+        isinstance(point, str) and point.strip() for point in points
+    ):
+        raise ValueError("key_points는 문자열 목록이어야 합니다")
+    if not points:
+        raise ValueError("key_points가 비어 있습니다")
+    if not isinstance(rubric, dict) or not all(
+        isinstance(rubric.get(grade), str) for grade in RUBRIC_GRADES
+    ):
+        raise ValueError("rubric에 good/partial/retry 기준이 없습니다")
+
+    return {
+        "reference_answer": answer.strip(),
+        "key_points": [point.strip() for point in points],
+        "rubric": {grade: rubric[grade].strip() for grade in RUBRIC_GRADES},
+    }
+
+
+def upcoming_daily_questions(index, days, today=None):
+    """오늘부터 days일 동안 일일 질문으로 게시될 질문 목록 (게시 순서)"""
+    passed = ((today or date.today()) - START_DATE.date()).days
+    questions = []
+    for offset in range(days):
+        for category in DAILY_CATEGORIES:
+            q_data = index.by_index(category, passed + offset)
+            if q_data:
+                questions.append(q_data["question"])
+    return questions
+
+
+def load_checkpoint(path):
+    """체크포인트에서 생성 완료된 {질문: 항목} (같은 질문은 마지막 줄 우선)"""
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 강제 종료로 마지막 줄이 잘린 경우
+            done[entry.pop("question")] = entry
+    return done
+
+
+def merge_references(path, generated, known_questions, overwrite=False):
+    """생성 결과를 참고 답안 파일에 합쳐 원자적으로 저장하고 항목 수 반환"""
+    references = load_references(path) if os.path.exists(path) else {}
+    for question, entry in generated.items():
+        if question not in known_questions:
+            continue  # 그 사이 질문 파일에서 빠진 질문
+        existing = references.get(question)
+        if existing and not overwrite:
+            # 손으로 작성한 핵심 포인트 등 기존 값 유지, 빠진 필드만 채움
+            references[question] = {**entry, **existing}
+        else:
+            references[question] = entry
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(references, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(temp_path, path)
+    return len(references)
+
+
+async def generate_one(engine, question, category, args):
+    """질문 하나의 참고 답안 생성 (실패하면 지수 백오프로 재시도)"""
+    prompt = build_prompt(question, category)
+    for attempt in range(args.retries + 1):
+        try:
+            text = await engine.complete(
+                prompt, model_id=args.model, max_tokens=args.max_tokens
+            )
+            return parse_reference(text or "")
+        except Exception as e:
+            if attempt == args.retries:
+                raise
+            delay = min(30, 2**attempt)
+            if isinstance(e, CircuitOpenError) or engine.breaker.is_open():
+                # 서킷이 열렸으면 시험 호출이 허용될 때까지 기다렸다가 재시도
+                delay = max(delay, engine.breaker.reset_timeout)
+            print(f"⚠️ 재시도 {attempt + 1}/{args.retries}: {question[:30]}... ({e})")
+            await asyncio.sleep(delay)
+
+
+async def generate(args, pending, categories, done):
+    """pending 질문을 최대 concurrency개씩 동시에 생성해 체크포인트에 추가"""
+    # 봇의 서킷 기준(p95 15초)은 긴 생성 요청에 맞지 않으므로 지연 기준은 호출 시간 제한보다
+    # 높게 두고 오류율로만 서킷을 엶
+    breaker = CircuitBreaker(p95_latency=args.timeout * 2)
+    engine = FeedbackEngine(
+        max_concurrency=args.concurrency, timeout=args.timeout, breaker=breaker
+    )
+    stats = Counter()
+    started = time.monotonic()
+    remaining = iter(pending)
+
+    with open(args.checkpoint, "a", encoding="utf-8") as checkpoint:
+
+        async def worker():
+            for question in remaining:
+                try:
+                    entry = await generate_one(
+                        engine, question, categories[question], args
+                    )
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"❌ 생성 실패: {question[:30]}... ({e})")
+                    continue
+
+                checkpoint.write(
+                    json.dumps({"question": question, **entry}, ensure_ascii=False)
+                    + "\n"
+                )
+                checkpoint.flush()
+                done[question] = entry
+                stats["generated"] += 1
+                if stats["generated"] % 10 == 0:
+                    rate = stats["generated"] / (time.monotonic() - started)
+                    print(
+                        f"⏳ {stats['generated']}/{len(pending)}개 생성 "
+                        f"({rate * 60:.0f}개/분)"
+                    )
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        finally:
+            engine.close()
+    return stats
+
+
+async def run(args):
+    _, index, _ = load_question_bank(args.questions)
+    categories = {}  # 질문 -> 카테고리
+    for question_id, question in enumerate(index.questions):
+        categories.setdefault(question, index.get(question_id)["category"])
+    known_questions = set(categories)
+    references = load_references(args.output) if os.path.exists(args.output) else {}
+    done = load_checkpoint(args.checkpoint)
+
+    # 곧 게시될 일일 질문부터, 그다음 질문 파일 순서대로
+    ordered = upcoming_daily_questions(index, args.days_ahead) + list(index.questions)
+    pending = []
+    seen = set()
+    for question in ordered:
+        if question in seen or question in done:
+            continue
+        seen.add(question)
+        if args.category and categories[question] != args.category:
+            continue
+        if not args.overwrite and references.get(question, {}).get("rubric"):
+            continue
+        pending.append(question)
+    if args.limit is not None:
+        pending = pending[: args.limit]
+
+    print(
+        f"📝 생성할 질문 {len(pending)}개 "
+        f"(전체 {len(known_questions)}개, 체크포인트 완료 {len(done)}개)"
+    )
+
+    try:
+        if pending and not args.merge_only:
+            stats = await generate(args, pending, categories, done)
+            print(f"✅ 생성 {stats['generated']}개, 실패 {stats['failed']}개")
+    finally:
+        if done:
+            total = merge_references(
+                args.output, done, known_questions, overwrite=args.overwrite
+            )
+            print(f"💾 {args.output}에 참고 답안 {total}개를 저장했습니다.")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--questions", default=str(DATA_DIR / "questions.json"), help="질문 파일"
+    )
+    parser.add_argument(
+        "--output", default=str(DATA_DIR / "references.json"), help="참고 답안 파일"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=str(DATA_DIR / "references.checkpoint.jsonl"),
+        help="이어서 진행하기 위한 체크포인트 파일",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="동시 Bedrock 호출 수"
+    )
+    parser.add_argument(
+        "--limit", type=int, default=None, help="이번에 생성할 최대 개수"
+    )
+    parser.add_argument(
+        "--category", choices=DAILY_CATEGORIES, help="이 카테고리의 질문만 생성"
+    )
+    parser.add_argument(
+        "--days-ahead", type=int, default=7, help="먼저 생성할 일일 질문 일수"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="채점 기준이 이미 있거나 손으로 작성한 항목도 새로 생성한 값으로 교체",
+    )
+    parser.add_argument(
+        "--merge-only", action="store_true", help="생성 없이 체크포인트만 합치기"
+    )
+    parser.add_argument("--model", default=DEFAULT_MODEL_ID, help="Bedrock 모델 ID")
+    parser.add_argument("--max-tokens", type=int, default=1200, help="응답 토큰 한도")
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="호출당 시간 제한(초)"
+    )
+    parser.add_argument("--retries", type=int, default=2, help="질문당 재시도 횟수")
+    return parser
+
+
+def main(argv=None):
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
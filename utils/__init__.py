@@ -0,0 +1 @@
+"""봇 공용 유틸리티 모듈"""
@@ -0,0 +1,79 @@
+import asyncio
+import itertools
+import os
+from collections import defaultdict
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없을 때 발생"""
+
+
+class AnswerQueue:
+    """피드백 생성 작업 큐
+
+    정해진 수의 워커만 작업을 처리하고, 대기열 크기를 넘는 작업은 거절합니다.
+    우선순위는 (첫 답변 여부, 같은 사용자의 대기 작업 수, 도착 순서)이므로
+    첫 답변이 먼저 처리되고, 한 사용자가 여러 답변을 올려도 다른 사용자의
+    답변이 그 뒤로 밀리지 않습니다.
+    """
+
+    def __init__(self, handler, workers=None, max_size=None):
+        self.handler = handler
+        self.workers = workers or int(os.getenv("ANSWER_WORKERS", "4"))
+        self.max_size = max_size or int(os.getenv("ANSWER_QUEUE_MAX", "50"))
+
+        self._queue = asyncio.PriorityQueue()
+        self._pending = defaultdict(int)  # 사용자별 대기 작업 수
+        self._counter = itertools.count()
+        self._tasks = []
+        self.active = 0  # 처리 중인 작업 수
+
+    def __len__(self):
+        return self._queue.qsize()
+
+    def full(self):
+        """대기열이 가득 찼는지 여부"""
+        return self._queue.qsize() >= self.max_size
+
+    def start(self):
+        """워커 시작"""
+        for i in range(self.workers):
+            task = asyncio.create_task(self._worker(), name=f"answer-worker-{i}")
+            self._tasks.append(task)
+
+    def stop(self):
+        """워커 중지 (대기 중인 작업은 버려짐)"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def submit(self, user_id, job, first=False):
+        """작업 추가 후 앞에 있는 작업 수 반환
+
+        대기열이 가득 찼으면 QueueFullError가 발생합니다.
+        """
+        if self.full():
+            raise QueueFullError()
+
+        ahead = self._queue.qsize()
+        priority = (0 if first else 1, self._pending[user_id], next(self._counter))
+        self._pending[user_id] += 1
+        self._queue.put_nowait((priority, user_id, job))
+        return ahead
+
+    async def _worker(self):
+        while True:
+            _, user_id, job = await self._queue.get()
+
+            self._pending[user_id] -= 1
+            if self._pending[user_id] <= 0:
+                del self._pending[user_id]
+
+            self.active += 1
+            try:
+                await self.handler(job)
+            except Exception as e:
+                print(f"❌ 답변 처리 작업 오류: {e}")
+            finally:
+                self.active -= 1
+                self._queue.task_done()
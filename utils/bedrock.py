@@ -0,0 +1,242 @@
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.metrics import metrics
+
+DEFAULT_MODEL_ID = "anthropic.claude-instant-v1"
+
+# 스트리밍 종료 표시
+_STREAM_END = object()
+
+
+class FeedbackEngine:
+    """Bedrock 호출을 이벤트 루프 밖에서 실행하는 비동기 피드백 엔진
+
+    boto3 클라이언트는 동기 API만 제공하므로 전용 스레드 풀에서 호출하고,
+    동시 호출 수와 호출당 시간 제한을 설정값으로 제어합니다.
+    장애 중에는 서킷 브레이커가 호출을 즉시 거절(CircuitOpenError)합니다.
+    """
+
+    def __init__(self, max_concurrency=None, timeout=None, breaker=None):
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("BEDROCK_MAX_CONCURRENCY", "4")
+        )
+        self.timeout = timeout or float(os.getenv("BEDROCK_TIMEOUT", "20"))
+
+        # 동시 호출 수만큼만 스레드를 사용 (이벤트 루프 기본 풀과 분리)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="bedrock"
+        )
+        self._semaphore = None
+        self.breaker = breaker or CircuitBreaker()
+
+        # boto3 임포트와 클라이언트 생성은 느리므로 처음 필요할 때 워커 스레드에서 수행
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """Bedrock 런타임 클라이언트 (처음 접근할 때 생성)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        """boto3 클라이언트 생성 (boto3 임포트 포함)"""
+        import boto3
+        from botocore.config import Config
+
+        # botocore 자체 타임아웃도 설정해 취소된 호출이 스레드를 오래 잡지 않도록 함
+        return boto3.client(
+            service_name="bedrock-runtime",
+            region_name=os.getenv("AWS_REGION", "us-east-1"),
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            config=Config(
+                connect_timeout=min(self.timeout, 5),
+                read_timeout=self.timeout,
+                retries={"max_attempts": 2},
+                max_pool_connections=self.max_concurrency,
+            ),
+        )
+
+    async def warm_up(self):
+        """첫 피드백 요청이 기다리지 않도록 클라이언트를 미리 생성"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, lambda: self.client)
+
+    @property
+    def semaphore(self):
+        """실행 중인 이벤트 루프에서 세마포어 생성"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def build_body(self, prompt, max_tokens=500):
+        """Claude 텍스트 완성 요청 본문 생성"""
+        return json.dumps(
+            {
+                "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
+                "max_tokens_to_sample": max_tokens,
+                "temperature": 0.7,
+                "top_p": 0.9,
+            }
+        )
+
+    def _invoke_sync(self, body, model_id):
+        """워커 스레드에서 실행되는 동기 호출"""
+        response = self.client.invoke_model(
+            body=body,
+            modelId=model_id,
+            accept="application/json",
+            contentType="application/json",
+        )
+        response_body = json.loads(response.get("body").read())
+        return response_body.get("completion")
+
+    async def complete(self, prompt, model_id=DEFAULT_MODEL_ID, max_tokens=500):
+        """프롬프트에 대한 완성 텍스트 반환
+
+        시간 제한을 넘기면 asyncio.TimeoutError가 발생합니다.
+        """
+        if self.breaker.is_open():
+            raise CircuitOpenError()
+        body = self.build_body(prompt, max_tokens)
+        loop = asyncio.get_running_loop()
+
+        job = await self._submit(functools.partial(self._invoke_sync, body, model_id))
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(job, loop=loop), timeout=self.timeout
+            )
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception:
+            self._record("complete", model_id, False, time.monotonic() - started)
+            raise
+        self._record("complete", model_id, True, time.monotonic() - started)
+        return result
+
+    async def _submit(self, fn):
+        """세마포어 자리를 얻고 서킷 브레이커 확인 후 워커 스레드에 작업 제출
+
+        시간 초과나 취소로 기다리기를 멈춰도 워커 스레드는 botocore 타임아웃까지 막혀
+        있으므로, 자리는 스레드의 작업이 실제로 끝날 때 반환합니다 (스레드 수 = 자리 수).
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self.semaphore
+        await semaphore.acquire()
+        try:
+            # 세마포어를 기다리다 취소되어도 시험 호출 자리가 남지 않도록 획득 후 확인
+            self.breaker.before_call()
+            job = self._executor.submit(fn)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release_slot(_):
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass  # 이벤트 루프가 이미 닫힘
+
+        job.add_done_callback(release_slot)
+        return job
+
+    def _stream_sync(self, body, model_id, loop, queue, stop_event):
+        """워커 스레드에서 응답 스트림을 읽어 이벤트 루프의 큐로 전달"""
+        try:
+            response = self.client.invoke_model_with_response_stream(
+                body=body,
+                modelId=model_id,
+                accept="application/json",
+                contentType="application/json",
+            )
+            stream = response.get("body")
+            try:
+                for event in stream:
+                    if stop_event.is_set():
+                        break
+                    chunk = event.get("chunk")
+                    if not chunk:
+                        continue
+                    text = json.loads(chunk["bytes"]).get("completion")
+                    if text:
+                        loop.call_soon_threadsafe(queue.put_nowait, text)
+            finally:
+                stream.close()
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+
+    async def stream(self, prompt, model_id=DEFAULT_MODEL_ID, max_tokens=500):
+        """응답 스트림 API로 완성 텍스트를 조각 단위로 반환하는 비동기 제너레이터
+
+        전체 스트림에 대해 complete()와 같은 시간 제한이 적용됩니다.
+        모델 쪽 실패(오류, 시간 초과)만 서킷 브레이커에 기록하고, 소비자가 중간에 멈춘
+        경우(Discord 수정 실패 등)는 기록하지 않습니다.
+        """
+        if self.breaker.is_open():
+            raise CircuitOpenError()
+        body = self.build_body(prompt, max_tokens)
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stop_event = threading.Event()
+
+        await self._submit(
+            functools.partial(
+                self._stream_sync, body, model_id, loop, queue, stop_event
+            )
+        )
+        started = loop.time()
+        deadline = started + self.timeout
+        outcome = None  # True: 정상 종료, False: 모델 쪽 실패, None: 소비자 중단
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                try:
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    outcome = False
+                    raise
+                if item is _STREAM_END:
+                    outcome = True
+                    return
+                if isinstance(item, Exception):
+                    outcome = False
+                    raise item
+                yield item
+        finally:
+            # 소비자가 중간에 멈추면 워커 스레드도 읽기를 중단
+            stop_event.set()
+            if outcome is None:
+                self.breaker.release()
+            else:
+                self._record("stream", model_id, outcome, loop.time() - started)
+
+    def _record(self, mode, model_id, ok, latency):
+        """호출 결과를 서킷 브레이커와 메트릭에 기록"""
+        self.breaker.record(ok, latency)
+        metrics.observe(
+            "bedrock_call_seconds",
+            latency,
+            mode=mode,
+            model=model_id,
+            outcome="ok" if ok else "error",
+        )
+
+    def close(self):
+        """스레드 풀 정리"""
+        self._executor.shutdown(wait=False)
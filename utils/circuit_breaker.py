@@ -0,0 +1,112 @@
+import os
+import time
+from collections import deque
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출을 바로 거절할 때 발생"""
+
+
+class CircuitBreaker:
+    """최근 호출의 오류율과 p95 지연 시간을 기준으로 동작하는 서킷 브레이커
+
+    - closed: 정상. 최근 window개 호출 중 오류율이나 p95 지연이 기준을 넘으면 open
+    - open: 모든 호출을 즉시 거절. reset_timeout초가 지나면 half_open
+    - half_open: 시험 호출 하나만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window=None,
+        min_calls=None,
+        error_rate=None,
+        p95_latency=None,
+        reset_timeout=None,
+    ):
+        self.window = window or int(os.getenv("BREAKER_WINDOW", "20"))
+        self.min_calls = min_calls or int(os.getenv("BREAKER_MIN_CALLS", "5"))
+        self.error_rate_threshold = error_rate or float(
+            os.getenv("BREAKER_ERROR_RATE", "0.5")
+        )
+        self.p95_latency_threshold = p95_latency or float(
+            os.getenv("BREAKER_P95_LATENCY", "15")
+        )
+        self.reset_timeout = reset_timeout or float(
+            os.getenv("BREAKER_RESET_TIMEOUT", "30")
+        )
+
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._results = deque(maxlen=self.window)  # (성공 여부, 지연 시간)
+        self._probing = False
+
+    @property
+    def error_rate(self):
+        """최근 호출 오류율"""
+        if not self._results:
+            return 0.0
+        return sum(1 for ok, _ in self._results if not ok) / len(self._results)
+
+    @property
+    def p95_latency(self):
+        """최근 호출 p95 지연 시간(초)"""
+        if not self._results:
+            return 0.0
+        latencies = sorted(latency for _, latency in self._results)
+        return latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+
+    def is_open(self):
+        """지금 호출하면 거절되는지 여부 (상태를 바꾸지 않음)"""
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at < self.reset_timeout
+        return self.state == self.HALF_OPEN and self._probing
+
+    def before_call(self):
+        """호출 전 확인, 허용되지 않으면 CircuitOpenError 발생"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError()
+            self.state = self.HALF_OPEN
+            self._probing = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                raise CircuitOpenError()
+            self._probing = True
+
+    def release(self):
+        """결과 없이 끝난 호출(취소, 소비자 중단)의 시험 호출 자리만 반환"""
+        self._probing = False
+
+    def record(self, ok, latency):
+        """호출 결과 기록"""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+            if ok:
+                print("✅ Bedrock 서킷이 닫혔습니다.")
+                self.state = self.CLOSED
+                self._results.clear()
+            else:
+                self._open()
+            return
+
+        self._results.append((ok, latency))
+        if len(self._results) < self.min_calls:
+            return
+        if (
+            self.error_rate >= self.error_rate_threshold
+            or self.p95_latency >= self.p95_latency_threshold
+        ):
+            self._open()
+
+    def _open(self):
+        print(
+            f"⚠️ Bedrock 서킷이 열렸습니다. (오류율 {self.error_rate:.0%}, "
+            f"p95 {self.p95_latency:.1f}초) {self.reset_timeout:.0f}초 후 재시도"
+        )
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
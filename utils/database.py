@@ -0,0 +1,382 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    question_id INTEGER PRIMARY KEY,
+    thread_id INTEGER,
+    question TEXT NOT NULL,
+    category TEXT,
+    sub_category TEXT,
+    author_id INTEGER,
+    asked_at TEXT NOT NULL,
+    last_active_at TEXT NOT NULL,
+    scheduled INTEGER NOT NULL DEFAULT 0,
+    answered INTEGER NOT NULL DEFAULT 0,
+    closed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_questions_thread ON questions (thread_id);
+CREATE INDEX IF NOT EXISTS idx_questions_active
+    ON questions (closed, last_active_at);
+
+CREATE TABLE IF NOT EXISTS answers (
+    message_id INTEGER PRIMARY KEY,
+    question_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    feedback TEXT,
+    is_first INTEGER NOT NULL DEFAULT 0,
+    answered_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_answers_question ON answers (question_id);
+CREATE INDEX IF NOT EXISTS idx_answers_user ON answers (user_id);
+
+CREATE TABLE IF NOT EXISTS feedback_cache (
+    cache_key TEXT PRIMARY KEY,
+    feedback TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_cache_expires
+    ON feedback_cache (expires_at);
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id INTEGER PRIMARY KEY,
+    total_answers INTEGER NOT NULL DEFAULT 0,
+    first_answers INTEGER NOT NULL DEFAULT 0,
+    good INTEGER NOT NULL DEFAULT 0,
+    partial INTEGER NOT NULL DEFAULT 0,
+    retry INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    last_answer_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_user_stats_total ON user_stats (total_answers);
+
+CREATE TABLE IF NOT EXISTS user_category_stats (
+    user_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    sub_category TEXT NOT NULL,
+    answers INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, category, sub_category)
+);
+
+CREATE TABLE IF NOT EXISTS review_items (
+    user_id INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    category TEXT,
+    sub_category TEXT,
+    ease REAL NOT NULL,
+    interval INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (user_id, question)
+);
+
+CREATE TABLE IF NOT EXISTS scheduled_runs (
+    run_key TEXT PRIMARY KEY,
+    claimed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS guild_schedules (
+    guild_id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    hour INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    timezone TEXT NOT NULL
+);
+"""
+
+# 쓰기 스레드 종료 표시
+_CLOSE = object()
+
+
+def default_db_path():
+    """기본 데이터베이스 경로 (data/study.db)"""
+    return Path(__file__).parent.parent / "data" / "study.db"
+
+
+class StudyDatabase:
+    """질문/답변/피드백을 저장하는 SQLite(WAL) 저장소
+
+    쓰기는 큐에 넣기만 하고 전용 스레드가 모아서 한 트랜잭션으로 커밋하므로
+    이벤트 루프에서 호출해도 디스크 대기가 발생하지 않습니다.
+    읽기는 시작 시점이나 asyncio.to_thread()에서 사용합니다.
+    """
+
+    def __init__(self, path=None, flush_interval=None, batch_size=200):
+        self.path = str(path or os.getenv("STUDY_DB_PATH") or default_db_path())
+        self.flush_interval = flush_interval or float(
+            os.getenv("STUDY_DB_FLUSH_INTERVAL", "0.5")
+        )
+        self.batch_size = batch_size
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        # 스키마 생성 및 WAL 모드 설정
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="study-db-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self):
+        """현재 스레드 전용 연결 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _write_loop(self):
+        """큐에 쌓인 쓰기를 모아서 배치로 커밋"""
+        conn = self._connect()
+        closing = False
+
+        while not closing:
+            item = self._queue.get()
+            if item is _CLOSE:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            # flush()를 기다리는 중이면 배치를 더 모으지 않고 바로 커밋
+            while len(batch) < self.batch_size and not isinstance(
+                batch[-1], threading.Event
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+
+            waiters = [item for item in batch if isinstance(item, threading.Event)]
+            try:
+                with conn:
+                    for item in batch:
+                        if item not in waiters:
+                            sql, params = item
+                            conn.execute(sql, params)
+            except sqlite3.Error as e:
+                print(f"❌ DB 쓰기 오류: {e}")
+            for waiter in waiters:
+                waiter.set()
+
+        conn.close()
+
+    def execute(self, sql, params=()):
+        """쓰기 작업 예약 (즉시 반환)"""
+        self._queue.put((sql, params))
+
+    def flush(self, timeout=30):
+        """지금까지 예약한 쓰기가 커밋될 때까지 대기, 커밋되었으면 True (블로킹)"""
+        if not self._writer.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def fetchall(self, sql, params=()):
+        """읽기 쿼리 실행 (블로킹)"""
+        return self._connect().execute(sql, params).fetchall()
+
+    def fetchone(self, sql, params=()):
+        """단일 행 읽기 쿼리 실행 (블로킹)"""
+        return self._connect().execute(sql, params).fetchone()
+
+    def close(self):
+        """남은 쓰기를 모두 커밋하고 종료"""
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
+
+    # 질문/답변 저장
+
+    def save_question(self, question_id, info):
+        """활성 질문 저장"""
+        asked_at = info.get("asked_at") or datetime.now()
+        self.execute(
+            "INSERT OR REPLACE INTO questions (question_id, thread_id, question, "
+            "category, sub_category, author_id, asked_at, last_active_at, "
+            "scheduled, answered) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                question_id,
+                info.get("thread_id"),
+                info["question"],
+                info.get("category"),
+                info.get("sub_category"),
+                info.get("author_id"),
+                asked_at.isoformat(),
+                datetime.now().isoformat(),
+                int(info.get("scheduled", False)),
+                int(info.get("answered", False)),
+            ),
+        )
+
+    def close_thread(self, thread_id):
+        """스레드가 보관/삭제된 질문을 종료 처리"""
+        self.execute(
+            "UPDATE questions SET closed = 1 WHERE thread_id = ?", (thread_id,)
+        )
+
+    def record_answer(self, question_id, message, content, feedback, is_first):
+        """답변과 생성된 피드백 저장 (여러 메시지로 나뉜 답변은 마지막 메시지 기준)"""
+        now = datetime.now().isoformat()
+        self.execute(
+            "INSERT OR REPLACE INTO answers (message_id, question_id, user_id, "
+            "content, feedback, is_first, answered_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                message.id,
+                question_id,
+                message.author.id,
+                content,
+                feedback,
+                int(is_first),
+                now,
+            ),
+        )
+        self.execute(
+            "UPDATE questions SET answered = 1, last_active_at = ? "
+            "WHERE question_id = ?",
+            (now, question_id),
+        )
+
+    def load_active_questions(self, ttl, limit):
+        """만료되지 않은 활성 질문을 오래된 활동 순으로 반환
+
+        반환값: [(question_id, 질문 정보, 마지막 활동 시각), ...]
+        """
+        since = (datetime.now() - timedelta(seconds=ttl)).isoformat()
+        rows = self.fetchall(
+            "SELECT * FROM (SELECT * FROM questions "
+            "WHERE closed = 0 AND last_active_at >= ? "
+            "ORDER BY last_active_at DESC LIMIT ?) ORDER BY last_active_at",
+            (since, limit),
+        )
+
+        return [self._question_from_row(row) for row in rows]
+
+    def load_question_by_thread(self, thread_id, ttl):
+        """스레드에 연결된 만료되지 않은 활성 질문 반환, 없으면 None
+
+        여러 프로세스(샤드)가 저장소를 공유할 때 메모리에 없는 스레드를 찾는 데 사용합니다.
+        """
+        since = (datetime.now() - timedelta(seconds=ttl)).isoformat()
+        row = self.fetchone(
+            "SELECT * FROM questions WHERE thread_id = ? AND closed = 0 "
+            "AND last_active_at >= ? ORDER BY question_id DESC LIMIT 1",
+            (thread_id, since),
+        )
+        return self._question_from_row(row) if row else None
+
+    def _question_from_row(self, row):
+        """questions 행 -> (question_id, 질문 정보, 마지막 활동 시각)"""
+        info = {
+            "question": row["question"],
+            "category": row["category"],
+            "sub_category": row["sub_category"],
+            "asked_at": datetime.fromisoformat(row["asked_at"]),
+            "author_id": row["author_id"],
+            "answered": bool(row["answered"]),
+        }
+        if row["thread_id"] is not None:
+            info["thread_id"] = row["thread_id"]
+        if row["scheduled"]:
+            info["scheduled"] = True
+        last_active = datetime.fromisoformat(row["last_active_at"])
+        return row["question_id"], info, last_active
+
+    # 피드백 캐시
+
+    def save_cached_feedback(self, key, feedback, expires_at):
+        """피드백 캐시 항목 저장"""
+        self.execute(
+            "INSERT OR REPLACE INTO feedback_cache (cache_key, feedback, expires_at) "
+            "VALUES (?, ?, ?)",
+            (key, feedback, expires_at),
+        )
+
+    def load_cached_entry(self, key, now):
+        """만료되지 않은 캐시 항목 하나 반환, 없으면 None (블로킹)"""
+        return self.fetchone(
+            "SELECT feedback, expires_at FROM feedback_cache "
+            "WHERE cache_key = ? AND expires_at >= ?",
+            (key, now),
+        )
+
+    def load_cached_feedback(self, now, limit):
+        """만료되지 않은 캐시 항목을 만료가 늦은 것부터 반환하고 만료된 항목 정리"""
+        self.execute("DELETE FROM feedback_cache WHERE expires_at < ?", (now,))
+        rows = self.fetchall(
+            "SELECT cache_key, feedback, expires_at FROM feedback_cache "
+            "WHERE expires_at >= ? ORDER BY expires_at DESC LIMIT ?",
+            (now, limit),
+        )
+        # 오래된 항목이 LRU 앞쪽에 오도록 역순으로 반환
+        return [tuple(row) for row in reversed(rows)]
+
+    # 복습
+
+    def load_review_items(self, user_id=None):
+        """복습 항목 목록, user_id가 있으면 그 사용자만 (블로킹)
+
+        이 프로세스에서 예약한 쓰기를 먼저 커밋하므로 방금 기록한 항목도 포함됩니다.
+        """
+        self.flush()
+        if user_id is None:
+            rows = self.fetchall("SELECT * FROM review_items")
+        else:
+            rows = self.fetchall(
+                "SELECT * FROM review_items WHERE user_id = ?", (user_id,)
+            )
+        return [dict(row) for row in rows]
+
+    # 스케줄러
+
+    def claim_run(self, run_key):
+        """실행 키를 즉시 기록하고 처음 기록했으면 True (블로킹)
+
+        중복 실행을 막아야 하므로 배치 쓰기를 거치지 않고 바로 커밋합니다.
+        """
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO scheduled_runs (run_key, claimed_at) "
+                "VALUES (?, ?)",
+                (run_key, datetime.now().isoformat()),
+            )
+        return cursor.rowcount == 1
+
+    def save_guild_schedule(self, guild_id, channel_id, hour, minute, tz_name):
+        """서버별 일일 질문 일정 저장"""
+        self.execute(
+            "INSERT OR REPLACE INTO guild_schedules (guild_id, channel_id, hour, "
+            "minute, timezone) VALUES (?, ?, ?, ?, ?)",
+            (guild_id, channel_id, hour, minute, tz_name),
+        )
+
+    def delete_guild_schedule(self, guild_id):
+        """서버별 일일 질문 일정 삭제"""
+        self.execute("DELETE FROM guild_schedules WHERE guild_id = ?", (guild_id,))
+
+    def load_guild_schedules(self):
+        """서버별 일일 질문 일정 목록 (블로킹)"""
+        return [dict(row) for row in self.fetchall("SELECT * FROM guild_schedules")]
@@ -0,0 +1,62 @@
+import asyncio
+import os
+
+
+class AnswerDebouncer:
+    """같은 스레드에서 같은 사용자가 연달아 보낸 메시지를 하나로 모으는 디바운서
+
+    마지막 메시지 후 window초 동안 새 메시지가 없으면 callback(messages, *args)를
+    호출합니다. 계속 메시지가 이어지더라도 첫 메시지로부터 max_wait초가 지나면
+    그때까지 모인 메시지로 호출합니다.
+    """
+
+    def __init__(self, callback, window=None, max_wait=None):
+        self.callback = callback
+        self.window = (
+            window
+            if window is not None
+            else float(os.getenv("ANSWER_DEBOUNCE_SECONDS", "1.5"))
+        )
+        self.max_wait = (
+            max_wait
+            if max_wait is not None
+            else float(os.getenv("ANSWER_DEBOUNCE_MAX", "15"))
+        )
+
+        self._pending = {}  # key -> {"messages", "args", "started", "timer"}
+        self._tasks = set()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, key, message, *args):
+        """메시지 추가, 새로 모으기 시작했으면 True (window가 0이면 바로 callback 호출)"""
+        loop = asyncio.get_running_loop()
+
+        entry = self._pending.get(key)
+        started = entry is None
+        if started:
+            entry = {"messages": [], "args": args, "started": loop.time()}
+            self._pending[key] = entry
+        else:
+            entry["timer"].cancel()
+
+        entry["messages"].append(message)
+        delay = min(self.window, entry["started"] + self.max_wait - loop.time())
+        entry["timer"] = loop.call_later(max(delay, 0), self._fire, key)
+        return started
+
+    def _fire(self, key):
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return
+
+        task = asyncio.create_task(self.callback(entry["messages"], *entry["args"]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def cancel(self):
+        """대기 중인 메시지를 모두 버림"""
+        for entry in self._pending.values():
+            entry["timer"].cancel()
+        self._pending.clear()
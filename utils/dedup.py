@@ -0,0 +1,138 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+# 한글/영문/숫자만 남기고 나머지는 공백으로 (문장 부호 차이는 무시)
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+SHINGLE_SIZE = 3  # 문자 n-gram 길이
+_PRIME = (1 << 31) - 1  # 해시 순열용 메르센 소수 (곱셈이 uint64를 넘지 않음)
+
+
+def shingles(text):
+    """소문자로 바꾸고 공백을 하나로 줄인 문장의 문자 3-gram 집합"""
+    normalized = " ".join(_NON_WORD.sub(" ", text.lower()).split())
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {
+        normalized[i : i + SHINGLE_SIZE]
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashLSH:
+    """질문 문장의 MinHash 서명과 LSH 밴드 버킷으로 비슷한 질문 쌍을 찾는 색인
+
+    서명을 bands개의 밴드로 나눠 밴드가 하나라도 같은 질문끼리만 후보로 보고, 후보 쌍만
+    실제 Jaccard 유사도로 확인하므로 모든 쌍을 비교하지 않고도 질문 수에 거의 비례하는
+    시간에 끝납니다. 같은 밴드를 공유할 확률이 절반이 되는 유사도는 약
+    (1 / bands) ** (1 / rows)입니다 (기본 32 x 4에서 0.42).
+    """
+
+    def __init__(self, bands=32, rows=4, seed=1):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        size = bands * rows
+        self.a = rng.integers(1, _PRIME, size=size, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, _PRIME, size=size, dtype=np.uint64)[:, None]
+
+    def signature(self, grams):
+        """문자 n-gram 집합의 MinHash 서명 (bands * rows 길이)"""
+        hashes = np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) % _PRIME for gram in grams),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+        if not len(hashes):
+            return np.full(self.bands * self.rows, _PRIME, dtype=np.uint64)
+        return ((self.a * hashes + self.b) % _PRIME).min(axis=1)
+
+    def candidate_pairs(self, signatures):
+        """밴드가 하나라도 같은 (i, j) 질문 번호 쌍 집합 (i < j)"""
+        pairs = set()
+        for band in range(self.bands):
+            buckets = defaultdict(list)
+            start = band * self.rows
+            for i, signature in enumerate(signatures):
+                buckets[signature[start : start + self.rows].tobytes()].append(i)
+            for members in buckets.values():
+                for x, i in enumerate(members):
+                    for j in members[x + 1 :]:
+                        pairs.add((i, j))
+        return pairs
+
+
+def find_duplicates(questions, threshold=0.6, lsh=None):
+    """문자 3-gram Jaccard 유사도가 threshold 이상인 질문 묶음 목록
+
+    각 묶음은 질문 번호 오름차순 목록이며(첫 질문을 남길 원본으로 봄), 묶음은 첫 질문
+    번호 순서로 정렬합니다. 유사도는 서로 이어진 쌍 기준이라 A~B, B~C가 비슷하면 A, B, C가
+    한 묶음이 됩니다.
+    """
+    lsh = lsh or MinHashLSH()
+    grams = [shingles(question) for question in questions]
+    signatures = [lsh.signature(g) for g in grams]
+
+    parent = list(range(len(questions)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in lsh.candidate_pairs(signatures):
+        if jaccard(grams[i], grams[j]) >= threshold:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = defaultdict(list)
+    for i in range(len(questions)):
+        clusters[find(i)].append(i)
+    return sorted(
+        (members for members in clusters.values() if len(members) > 1),
+        key=lambda members: members[0],
+    )
+
+
+def remove_duplicates(bank, threshold=0.6):
+    """묶음마다 첫 질문만 남긴 (질문 데이터, 뺀 질문 목록) 반환
+
+    카테고리 안에서만 비교하므로 다른 카테고리의 비슷한 질문은 그대로 둡니다.
+    빈 서브 카테고리가 생기지 않도록 서브 카테고리의 마지막 질문은 빼지 않습니다.
+    """
+    deduped = {}
+    removed = []
+    for category, main_category in bank.items():
+        flat = [
+            (sub_category, question)
+            for sub_category, questions in main_category.items()
+            for question in questions
+        ]
+        drop = set()
+        for cluster in find_duplicates([q for _, q in flat], threshold):
+            drop.update(cluster[1:])
+
+        deduped[category] = {}
+        for sub_category, questions in main_category.items():
+            deduped[category][sub_category] = []
+        for i, (sub_category, question) in enumerate(flat):
+            if i in drop:
+                removed.append(question)
+            else:
+                deduped[category][sub_category].append(question)
+        for sub_category, questions in main_category.items():
+            if not deduped[category][sub_category]:
+                deduped[category][sub_category].append(questions[0])
+                removed.remove(questions[0])
+    return deduped, removed
@@ -0,0 +1,108 @@
+import asyncio
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_answer(answer):
+    """답변 정규화 (유니코드 정규화, 소문자, 문장부호/공백 제거)
+
+    복사해 붙여넣은 답변이 공백이나 문장부호만 달라도 같은 키가 되도록 합니다.
+    """
+    text = unicodedata.normalize("NFKC", answer).lower()
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def cache_key(question, answer):
+    """(질문, 정규화된 답변) 캐시 키"""
+    raw = f"{question}\0{normalize_answer(answer)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class FeedbackCache:
+    """답변 피드백 캐시 (LRU + TTL)
+
+    같은 질문에 내용이 같은 답변이 다시 들어오면 모델 호출 없이 피드백을 재사용합니다.
+    db(StudyDatabase)가 주어지면 캐시를 디스크에도 저장하고 시작 시 다시 불러옵니다.
+    """
+
+    def __init__(self, max_size=None, ttl=None, db=None):
+        self.max_size = max_size or int(os.getenv("FEEDBACK_CACHE_SIZE", "1000"))
+        self.ttl = ttl or float(os.getenv("FEEDBACK_CACHE_TTL", "604800"))
+        self.db = db
+
+        # key -> (만료 시각, 피드백), 최근 사용 순
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, question, answer):
+        """캐시된 피드백 반환, 없거나 만료되었으면 None"""
+        key = cache_key(question, answer)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def fetch(self, question, answer):
+        """get()과 같지만 메모리에 없으면 DB에서 조회
+
+        여러 프로세스(샤드)가 같은 DB를 공유할 때 다른 프로세스가 만든 피드백도
+        재사용하기 위해 사용합니다.
+        """
+        feedback = self.get(question, answer)
+        if feedback is not None or self.db is None:
+            return feedback
+
+        key = cache_key(question, answer)
+        row = await asyncio.to_thread(self.db.load_cached_entry, key, time.time())
+        if row is None:
+            return None
+
+        self._set(key, row["expires_at"], row["feedback"])
+        self.misses -= 1
+        self.hits += 1
+        return row["feedback"]
+
+    def put(self, question, answer, feedback):
+        """피드백 저장"""
+        key = cache_key(question, answer)
+        expires_at = time.time() + self.ttl
+        self._set(key, expires_at, feedback)
+
+        if self.db is not None:
+            self.db.save_cached_feedback(key, feedback, expires_at)
+
+    def _set(self, key, expires_at, feedback):
+        self._entries[key] = (expires_at, feedback)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def restore(self):
+        """DB에 저장된 캐시 불러오기, 불러온 개수 반환
+
+        블로킹 호출이므로 asyncio.to_thread()에서 실행합니다.
+        """
+        if self.db is None:
+            return 0
+
+        rows = self.db.load_cached_feedback(time.time(), self.max_size)
+        for key, feedback, expires_at in rows:
+            self._set(key, expires_at, feedback)
+        return len(rows)
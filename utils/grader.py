@@ -0,0 +1,255 @@
+import json
+import math
+import os
+import re
+from collections import Counter
+
+import numpy as np
+
+# 한글/영문/숫자만 남기고 나머지는 공백으로 (조사가 붙어도 겹치는 글자 n-gram은 같음)
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+_HANGUL = re.compile(r"[가-힣]")
+
+# 문자 n-gram 길이 (한국어는 2~3글자 조각이 형태소 분석 없이도 잘 맞음)
+NGRAM_SIZES = (2, 3)
+
+# 채점 기준(rubric)의 등급 키 (utils.stats.GRADES의 등급 이름과 같음)
+RUBRIC_GRADES = ("good", "partial", "retry")
+
+
+def char_ngrams(text):
+    """소문자로 바꾼 단어별 문자 n-gram 개수 (단어 앞뒤를 공백으로 표시)"""
+    counts = Counter()
+    for token in _NON_WORD.sub(" ", text.lower()).split():
+        padded = f" {token} "
+        for size in NGRAM_SIZES:
+            for i in range(len(padded) - size + 1):
+                counts[padded[i : i + size]] += 1
+    return counts
+
+
+def content_length(text):
+    """공백/문장 부호를 뺀 글자 수"""
+    return len(_NON_WORD.sub("", text.lower()))
+
+
+def load_references(path):
+    """참고 답안 파일 읽기 및 검증
+
+    형식: {질문 문자열: {"key_points": [핵심 포인트, ...],
+                        "reference_answer": 문자열,
+                        "rubric": {"good": 기준, "partial": 기준, "retry": 기준}}}
+    ("reference_answer"와 "rubric"은 선택 사항, scripts/pregenerate_references.py가 생성)
+    형식이 잘못되었으면 ValueError가 발생합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        references = json.load(f)
+
+    if not isinstance(references, dict):
+        raise ValueError("최상위 값은 객체여야 합니다.")
+    for question, entry in references.items():
+        points = entry.get("key_points") if isinstance(entry, dict) else None
+        if not isinstance(points, list) or not all(
+            isinstance(point, str) and point.strip() for point in points
+        ):
+            raise ValueError(f"{question[:30]}: key_points는 문자열 목록이어야 합니다.")
+        if not isinstance(entry.get("reference_answer", ""), str):
+            raise ValueError(
+                f"{question[:30]}: reference_answer는 문자열이어야 합니다."
+            )
+        rubric = entry.get("rubric")
+        if rubric is not None and not (
+            isinstance(rubric, dict)
+            and all(isinstance(rubric.get(grade), str) for grade in RUBRIC_GRADES)
+        ):
+            raise ValueError(
+                f"{question[:30]}: rubric에는 {', '.join(RUBRIC_GRADES)} 기준이 필요합니다."
+            )
+    return references
+
+
+class AnswerGrader:
+    """질문별 참고 핵심 포인트와 답변을 문자 n-gram TF-IDF 코사인 유사도로 비교하는 채점기
+
+    모델 호출 없이 몇 밀리초 안에 ✅/⚠️/❌ 등급을 매겨, Bedrock을 쓸 수 없을 때의
+    기본 피드백과 빈 답변/동떨어진 답변을 걸러내는 사전 검사에 사용합니다.
+    IDF는 모든 참고 문서로 계산하고, 질문마다 핵심 포인트를 그 질문의 참고 문서에 나오는
+    n-gram만으로 만든 정규화된 행렬(문서 수 x n-gram 수)로 보관해 답변 하나를 한 번의
+    행렬 곱으로 채점합니다. 생성 비용이 있으므로 워커 스레드에서 만듭니다.
+    """
+
+    # 핵심 포인트를 다 다뤘다고 볼 유사도 (이보다 낮으면 비례해서 인정)
+    FULL_CREDIT = 0.3
+    # ✅ 기준 (핵심 포인트 평균 인정 비율)
+    GOOD_COVERAGE = 0.7
+    # ⚠️ 기준
+    PARTIAL_COVERAGE = 0.25
+
+    def __init__(self, references=None, min_chars=None, off_topic=None):
+        self.min_chars = int(
+            min_chars if min_chars is not None else os.getenv("GRADER_MIN_CHARS", "10")
+        )
+        self.off_topic = float(
+            off_topic
+            if off_topic is not None
+            else os.getenv("GRADER_OFF_TOPIC", "0.05")
+        )
+        self.references = references or {}
+
+        # 질문 텍스트, 핵심 포인트, 참고 답안을 각각 하나의 문서로 보고 IDF 계산
+        documents = []
+        for question, entry in self.references.items():
+            documents.append(char_ngrams(question))
+            documents.extend(char_ngrams(point) for point in entry["key_points"])
+            if entry.get("reference_answer"):
+                documents.append(char_ngrams(entry["reference_answer"]))
+
+        frequency = Counter()
+        for document in documents:
+            frequency.update(document.keys())
+        total = len(documents)
+        self.idf = {
+            gram: math.log((1 + total) / (1 + count)) + 1
+            for gram, count in frequency.items()
+        }
+        self.default_idf = math.log(1 + total) + 1  # 참고 문서에 없는 n-gram
+
+        # 질문 -> (n-gram -> 열 번호, 정규화된 행렬, 핵심 포인트 수)
+        self._matrices = {}
+        # 참고 문서가 한글로 쓰인 질문 (한글 없는 답변은 n-gram이 거의 겹치지 않음)
+        self._hangul = set()
+        for question, entry in self.references.items():
+            texts = list(entry["key_points"])
+            if entry.get("reference_answer"):
+                texts.append(entry["reference_answer"])
+            texts.append(question)
+            self._matrices[question] = self._build_matrix(texts) + (
+                len(entry["key_points"]),
+            )
+            if any(_HANGUL.search(text) for text in texts):
+                self._hangul.add(question)
+
+    def __len__(self):
+        return len(self.references)
+
+    def _build_matrix(self, texts):
+        grams = [char_ngrams(text) for text in texts]
+        columns = {}
+        for counts in grams:
+            for gram in counts:
+                columns.setdefault(gram, len(columns))
+
+        matrix = np.zeros((len(texts), len(columns)), dtype=np.float32)
+        for row, counts in enumerate(grams):
+            for gram, count in counts.items():
+                matrix[row, columns[gram]] = count * self.idf[gram]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.maximum(norms, 1e-9)
+        return columns, matrix
+
+    def has_reference(self, question):
+        return question in self._matrices
+
+    def can_compare(self, question, answer):
+        """참고 문서와 같은 문자(한글)로 쓴 답변인지 (영어로만 쓴 답변은 비교 불가)"""
+        return question not in self._hangul or bool(_HANGUL.search(answer))
+
+    def similarities(self, question, answer):
+        """핵심 포인트별 유사도 배열과 (참고 답안/질문을 포함한) 최고 유사도, 참고 없으면 None"""
+        if question not in self._matrices:
+            return None
+        columns, matrix, point_count = self._matrices[question]
+
+        vector = np.zeros(matrix.shape[1], dtype=np.float32)
+        norm = 0.0
+        for gram, count in char_ngrams(answer).items():
+            weight = count * self.idf.get(gram, self.default_idf)
+            norm += weight * weight
+            if gram in columns:
+                vector[columns[gram]] = weight
+        if not norm:
+            return np.zeros(point_count, dtype=np.float32), 0.0
+
+        scores = matrix @ vector / math.sqrt(norm)
+        return scores[:point_count], float(scores.max())
+
+    def grade(self, question, answer):
+        """답변 채점 결과
+
+        {"grade": "good"/"partial"/"retry", "reason": "short"/"off_topic"/"coverage",
+         "coverage": 핵심 포인트 평균 인정 비율(0~1), "missing": 덜 다룬 핵심 포인트}
+        참고 답안이 없는 질문은 채점하지 않고 None을 반환합니다 (짧은 답변도 모델이 판단).
+        참고 문서와 다른 문자로 쓴 답변(한글 참고 답안에 영어로만 쓴 답변 등)도 None입니다.
+        """
+        if not self.has_reference(question):
+            return None
+        if content_length(answer) < self.min_chars:
+            return {"grade": "retry", "reason": "short", "coverage": 0.0, "missing": []}
+        if not self.can_compare(question, answer):
+            return None
+
+        scores, best = self.similarities(question, answer)
+        points = self.references[question]["key_points"]
+        credit = np.minimum(scores / self.FULL_CREDIT, 1.0)
+        coverage = float(credit.mean()) if len(points) else 0.0
+        # 절반도 다루지 않은 포인트를 덜 다룬 순서대로
+        missing = [points[i] for i in np.argsort(credit) if credit[i] < 0.5]
+
+        if best < self.off_topic:
+            reason, grade = "off_topic", "retry"
+        elif coverage >= self.GOOD_COVERAGE:
+            reason, grade = "coverage", "good"
+        elif coverage >= self.PARTIAL_COVERAGE:
+            reason, grade = "coverage", "partial"
+        else:
+            reason, grade = "coverage", "retry"
+        return {
+            "grade": grade,
+            "reason": reason,
+            "coverage": coverage,
+            "missing": missing,
+        }
+
+    def prescreen(self, question, answer):
+        """모델을 부를 필요가 없는 빈 답변이면 피드백 문구, 아니면 None
+
+        동떨어진 답변(off_topic)은 n-gram만으로는 바르게 답한 다른 표현을 놓칠 수 있어
+        걸러내지 않고 모델에 맡깁니다.
+        """
+        result = self.grade(question, answer)
+        if result is None or result["reason"] != "short":
+            return None
+        return self.format_feedback(result)
+
+    def feedback(self, question, answer):
+        """채점 결과로 만든 기본 피드백 문구 (참고 답안이 없으면 None)"""
+        result = self.grade(question, answer)
+        if result is None:
+            return None
+        return self.format_feedback(result, self.references.get(question))
+
+    def format_feedback(self, result, entry=None, hints=2):
+        if result["reason"] == "short":
+            return "❌ 답변이 너무 짧아요! 좀 더 자세히 설명해보세요."
+        if result["reason"] == "off_topic":
+            return (
+                "❌ 질문과 관련된 내용이 잘 보이지 않아요. "
+                "질문을 다시 읽고 핵심 개념을 중심으로 설명해보세요."
+            )
+
+        if result["grade"] == "good":
+            text = "✅ 핵심 포인트를 잘 짚었어요!"
+        elif result["grade"] == "partial":
+            text = "⚠️ 괜찮은 시도예요! 빠진 부분을 보완하면 더 좋아요."
+        else:
+            text = "❌ 다시 생각해보세요. 질문의 핵심 포인트를 더 다뤄 보세요."
+
+        if result["missing"]:
+            lines = "\n".join(f"- {point}" for point in result["missing"][:hints])
+            text += f"\n\n**함께 다뤄 보면 좋은 내용**\n{lines}"
+
+        # 미리 생성한 채점 기준이 있으면 ✅ 기준을 함께 안내
+        rubric = entry.get("rubric") if entry else None
+        if rubric and result["grade"] != "good":
+            text += f"\n\n**✅ 기준**: {rubric['good']}"
+        return text
@@ -0,0 +1,250 @@
+import asyncio
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# 지연 시간 히스토그램 버킷 상한(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)
+
+# 메트릭 이름별 설명 (Prometheus HELP 줄)
+HELP = {
+    "discord_command_seconds": "명령 처리 시간",
+    "discord_command_errors_total": "명령 처리 중 발생한 에러 수",
+    "study_answer_seconds": "답변 접수부터 응답(또는 대기열 등록)까지 걸린 시간",
+    "study_feedback_seconds": "피드백 생성 시간 (모드/경로/결과별)",
+    "feedback_route_total": "피드백 경로별 선택 횟수",
+    "answer_queue_wait_seconds": "답변이 대기열에서 기다린 시간",
+    "bedrock_call_seconds": "Bedrock 호출 한 번의 시간",
+    "event_loop_lag_seconds": "이벤트 루프 지연 시간",
+    "event_loop_lag_last_seconds": "마지막으로 측정한 이벤트 루프 지연 시간",
+    "event_loop_stalls_total": "워치독이 감지한 이벤트 루프 멈춤 횟수",
+    "event_loop_stall_seconds": "워치독이 감지한 이벤트 루프 멈춤 시간",
+    "study_active_questions": "추적 중인 활성 질문 수",
+    "answer_queue_depth": "피드백 생성 대기열 길이",
+    "answer_queue_active": "피드백 생성 중인 작업 수",
+    "feedback_cache_size": "피드백 캐시 항목 수",
+    "feedback_cache_hits_total": "피드백 캐시 적중 수",
+    "feedback_cache_misses_total": "피드백 캐시 미스 수",
+    "feedback_cache_hit_ratio": "피드백 캐시 적중률",
+    "bedrock_breaker_open": "Bedrock 서킷 브레이커가 열려 있으면 1",
+}
+
+
+def _label_key(labels):
+    """라벨 dict를 정렬된 튜플 키로 변환"""
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key, extra=()):
+    """Prometheus 라벨 문자열 생성 ({a="1",b="2"})"""
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """고정 버킷 누적 히스토그램 (라벨 조합 하나)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "max")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """버킷 상한으로 근사한 분위수 (+Inf 버킷이면 관측 최댓값)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """카운터/게이지/히스토그램 레지스트리
+
+    모든 기록은 이벤트 루프 스레드에서 이루어진다고 가정하므로 잠금을 쓰지 않습니다.
+    게이지는 값을 직접 설정하거나, 수집 시점에 호출할 함수를 등록할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.counters = {}  # 이름 -> {라벨 키: 값}
+        self.gauges = {}  # 이름 -> {라벨 키: 값}
+        self.histograms = {}  # 이름 -> {라벨 키: Histogram}
+        self.collectors = {}  # 이름 -> (종류, 값을 반환하는 함수)
+
+    def inc(self, name, value=1, **labels):
+        """카운터 증가"""
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        """게이지 값 설정"""
+        self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name, value, **labels):
+        """히스토그램에 관측값 추가"""
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록 실행 시간을 히스토그램에 기록
+
+        블록 안에서 돌려받은 라벨 dict를 수정하면 결과(outcome 등)를 라벨로 남길 수 있습니다.
+        """
+        started = time.perf_counter()
+        try:
+            yield labels
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def register(self, name, func, kind="gauge"):
+        """수집 시점에 func()를 호출해 값을 읽는 게이지/카운터 등록"""
+        self.collectors[name] = (kind, func)
+
+    def unregister(self, *names):
+        for name in names:
+            self.collectors.pop(name, None)
+
+    def collect(self):
+        """(이름, 종류, {라벨 키: 값}) 목록 반환 (히스토그램 제외)"""
+        result = []
+        for name, series in sorted(self.counters.items()):
+            result.append((name, "counter", series))
+        for name, series in sorted(self.gauges.items()):
+            result.append((name, "gauge", series))
+        for name, (kind, func) in sorted(self.collectors.items()):
+            try:
+                value = func()
+            except Exception as e:
+                print(f"⚠️ 메트릭 수집 실패 ({name}): {e}")
+                continue
+            result.append((name, kind, {(): value}))
+        return result
+
+    def render(self):
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = []
+        for name, kind, series in self.collect():
+            lines.append(f"# HELP {name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        for name, series in sorted(self.histograms.items()):
+            lines.append(f"# HELP {name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                bounds = [str(b) for b in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    labels = _format_labels(key, [("le", bound)])
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(key)
+                lines.append(f"{name}_sum{labels} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """사람이 읽기 쉬운 요약 (히스토그램은 횟수와 p50/p95/p99)"""
+        lines = []
+        for name, series in sorted(self.histograms.items()):
+            for key, histogram in sorted(series.items()):
+                labels = ",".join(v for _, v in key)
+                title = f"{name}[{labels}]" if labels else name
+                lines.append(
+                    f"{title} n={histogram.count} "
+                    f"p50={histogram.quantile(0.5) * 1000:.0f}ms "
+                    f"p95={histogram.quantile(0.95) * 1000:.0f}ms "
+                    f"p99={histogram.quantile(0.99) * 1000:.0f}ms"
+                )
+        for name, _, series in self.collect():
+            for key, value in series.items():
+                labels = ",".join(v for _, v in key)
+                title = f"{name}[{labels}]" if labels else name
+                lines.append(f"{title} = {round(value, 3)}")
+        return "\n".join(lines)
+
+
+# 프로세스 전체에서 공유하는 레지스트리
+metrics = Metrics()
+
+
+class LoopLagMonitor:
+    """주기적으로 잠들었다 깨어나는 시간 차이로 이벤트 루프 지연을 측정"""
+
+    def __init__(self, registry=None, interval=None):
+        self.registry = registry or metrics
+        self.interval = interval or float(os.getenv("METRICS_LAG_INTERVAL", "0.5"))
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self.registry.observe("event_loop_lag_seconds", lag)
+            self.registry.set_gauge("event_loop_lag_last_seconds", lag)
+
+
+async def start_http_server(port, host="127.0.0.1", registry=None):
+    """/metrics 경로로 Prometheus 텍스트를 제공하는 HTTP 서버 시작
+
+    종료할 때 호출할 수 있도록 aiohttp AppRunner를 반환합니다.
+    """
+    from aiohttp import web
+
+    registry = registry or metrics
+
+    async def handle(request):
+        return web.Response(
+            text=registry.render(), content_type="text/plain", charset="utf-8"
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import random
+from array import array
+
+from utils.dedup import remove_duplicates
+
+
+def validate_question_bank(bank):
+    """질문 데이터 형식 검사, 오류 메시지 목록 반환
+
+    형식: {카테고리: {서브 카테고리: [질문 문자열, ...]}}
+    """
+    if not isinstance(bank, dict) or not bank:
+        return ["최상위 값은 비어 있지 않은 객체여야 합니다."]
+
+    errors = []
+    for category, main_category in bank.items():
+        if not isinstance(main_category, dict) or not main_category:
+            errors.append(
+                f"{category}: 서브 카테고리 객체가 비어 있거나 잘못되었습니다."
+            )
+            continue
+        for sub_category, questions in main_category.items():
+            path = f"{category}.{sub_category}"
+            if not isinstance(questions, list) or not questions:
+                errors.append(f"{path}: 질문 목록이 비어 있거나 잘못되었습니다.")
+                continue
+            for i, question in enumerate(questions):
+                if not isinstance(question, str) or not question.strip():
+                    errors.append(
+                        f"{path}[{i}]: 질문은 비어 있지 않은 문자열이어야 합니다."
+                    )
+    return errors
+
+
+def diff_question_banks(old, new):
+    """서브 카테고리별 질문 추가/삭제 개수 요약 목록 반환"""
+    changes = []
+    keys = [(c, s) for c, subs in new.items() for s in subs]
+    keys += [(c, s) for c, subs in old.items() for s in subs if s not in new.get(c, {})]
+
+    for category, sub_category in keys:
+        before = set(old.get(category, {}).get(sub_category, []))
+        after = set(new.get(category, {}).get(sub_category, []))
+        added, removed = len(after - before), len(before - after)
+        if added or removed:
+            changes.append(f"{category}.{sub_category} +{added} -{removed}")
+    return changes
+
+
+def question_key(question):
+    """질문 문장으로 만든 짧은 고정 ID (!search/!question용, 파일 순서가 바뀌어도 같음)"""
+    return hashlib.sha1(question.encode("utf-8")).hexdigest()[:8]
+
+
+def load_question_bank(path, dedup_threshold=None):
+    """질문 파일을 읽고 검증한 뒤 (질문 데이터, 인덱스, 내용 해시) 반환
+
+    파일 읽기, JSON 파싱, 인덱스 생성을 모두 하므로 워커 스레드에서 실행합니다.
+    dedup_threshold를 주면 카테고리 안에서 그 이상 비슷한 질문은 첫 질문만 남깁니다.
+    형식이 잘못되었으면 ValueError가 발생합니다.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    bank = json.loads(raw.decode("utf-8"))
+    errors = validate_question_bank(bank)
+    if errors:
+        raise ValueError("\n".join(errors[:10]))
+
+    if dedup_threshold is not None:
+        bank, removed = remove_duplicates(bank, dedup_threshold)
+        if removed:
+            print(f"🧹 비슷한 질문 {len(removed)}개를 출제 순서에서 제외했습니다.")
+
+    return bank, QuestionIndex(bank), hashlib.sha1(raw).hexdigest()
+
+
+class QuestionIndex:
+    """질문 은행을 한 번만 평탄화해 두는 조회용 인덱스
+
+    모든 질문을 하나의 튜플에 카테고리 순서대로 저장하고,
+    카테고리별 (시작, 끝) 오프셋과 질문별 서브 카테고리 번호를 함께 보관합니다.
+    인덱스 조회와 무작위 선택 모두 O(1)이며 호출마다 리스트를 만들지 않습니다.
+    전체 질문 번호는 파일 순서라 다시 불러오면 바뀔 수 있으므로, 사용자에게는
+    질문 문장으로 만든 고정 ID(question_key)를 보여줍니다.
+    """
+
+    def __init__(self, question_bank):
+        questions = []
+        sub_categories = []  # (카테고리, 서브 카테고리)
+        sub_ids = array("I")  # 질문별 서브 카테고리 번호
+        ranges = {}
+
+        for category, main_category in question_bank.items():
+            start = len(questions)
+            for sub_category, sub_questions in main_category.items():
+                sub_id = len(sub_categories)
+                sub_categories.append((category, sub_category))
+                questions.extend(sub_questions)
+                sub_ids.extend([sub_id] * len(sub_questions))
+            ranges[category] = (start, len(questions))
+
+        self.questions = tuple(questions)
+        self.sub_categories = tuple(sub_categories)
+        self.sub_ids = sub_ids
+        self.ranges = ranges
+        self.categories = tuple(ranges)
+        # 고정 ID -> 전체 질문 번호 (같은 질문이 여러 번 있으면 첫 번째)
+        self.ids_by_key = {}
+        for question_id, question in enumerate(self.questions):
+            self.ids_by_key.setdefault(question_key(question), question_id)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def category_size(self, category):
+        """카테고리의 질문 개수"""
+        start, end = self.ranges.get(category, (0, 0))
+        return end - start
+
+    def get(self, question_id):
+        """전체 질문 번호로 질문 정보 반환"""
+        category, sub_category = self.sub_categories[self.sub_ids[question_id]]
+        return {
+            "id": question_id,
+            "key": question_key(self.questions[question_id]),
+            "category": category,
+            "sub_category": sub_category,
+            "question": self.questions[question_id],
+        }
+
+    def by_key(self, key):
+        """고정 ID로 질문 정보 반환 (없으면 None)"""
+        question_id = self.ids_by_key.get(key.lower())
+        return None if question_id is None else self.get(question_id)
+
+    def by_index(self, category, index):
+        """카테고리 내 index번째 질문 (범위를 넘으면 처음부터 다시)"""
+        start, end = self.ranges.get(category, (0, 0))
+        if start == end:
+            return None
+        return self.get(start + index % (end - start))
+
+    def random(self, category=None):
+        """카테고리(없으면 전체)에서 모든 질문이 같은 확률로 선택되도록 무작위 선택"""
+        start, end = self.ranges.get(category, (0, len(self.questions)))
+        if start == end:
+            return None
+        return self.get(random.randrange(start, end))
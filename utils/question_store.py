@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+
+class ActiveQuestionStore:
+    """활성 질문 저장소
+
+    질문 메시지 ID와 스레드 ID 양쪽으로 O(1) 조회가 가능하며,
+    스레드 자동 보관 시간(기본 24시간) 동안 활동이 없거나 최대 개수를 넘으면
+    가장 오래된 질문부터 제거합니다.
+
+    db(StudyDatabase)가 주어지면 질문 등록과 스레드 종료를 영구 저장하고,
+    restore()로 재시작 전의 활성 질문을 다시 불러올 수 있습니다.
+    여러 프로세스가 DB를 공유할 때는 fetch_by_thread()로 메모리에 없는 스레드를
+    DB에서 찾습니다.
+    """
+
+    def __init__(self, ttl=None, max_size=None, db=None):
+        # Discord 스레드 auto_archive_duration(1440분)과 같은 기준
+        self.ttl = ttl or float(os.getenv("ACTIVE_QUESTION_TTL", "86400"))
+        self.max_size = max_size or int(os.getenv("ACTIVE_QUESTIONS_MAX", "1000"))
+
+        # question_id -> [마지막 활동 시각, 질문 정보] (오래된 활동 순으로 정렬)
+        self._questions = OrderedDict()
+        self._by_thread = {}
+        self.db = db
+
+        # DB에도 없던 스레드 (일반 스레드의 메시지마다 DB를 조회하지 않도록)
+        self._unknown_threads = OrderedDict()
+        self.unknown_ttl = 60
+
+    def __len__(self):
+        return len(self._questions)
+
+    def __contains__(self, question_id):
+        return question_id in self._questions
+
+    def __getitem__(self, question_id):
+        return self._questions[question_id][1]
+
+    def __setitem__(self, question_id, info):
+        self.save(question_id, info)
+
+    def add(self, question_id, info, last_active=None):
+        """질문 등록 (스레드가 있으면 스레드 인덱스에도 등록)"""
+        self.remove(question_id)
+        self._questions[question_id] = [last_active or time.monotonic(), info]
+
+        thread_id = info.get("thread_id")
+        if thread_id is not None:
+            self._by_thread[thread_id] = question_id
+
+        self.evict()
+
+    def restore(self):
+        """DB에서 만료되지 않은 활성 질문을 불러와 캐시 재구성, 불러온 개수 반환
+
+        블로킹 호출이므로 asyncio.to_thread()에서 실행합니다.
+        """
+        if self.db is None:
+            return 0
+
+        rows = self.db.load_active_questions(self.ttl, self.max_size)
+        now_wall = datetime.now()
+        now_mono = time.monotonic()
+        for question_id, info, last_active in rows:
+            # 벽시계 기준 마지막 활동 시각을 monotonic 기준으로 변환
+            elapsed = (now_wall - last_active).total_seconds()
+            self.add(question_id, info, last_active=now_mono - elapsed)
+        return len(rows)
+
+    def save(self, question_id, info):
+        """질문 등록 후 DB에도 저장"""
+        self.add(question_id, info)
+        if self.db is not None:
+            self.db.save_question(question_id, info)
+
+    def get(self, question_id, default=None):
+        """질문 ID로 조회"""
+        entry = self._questions.get(question_id)
+        return entry[1] if entry else default
+
+    def get_by_thread(self, thread_id):
+        """스레드 ID로 (질문 ID, 질문 정보) 조회, 없으면 None
+
+        조회된 질문은 활동 시각이 갱신되어 만료가 연장됩니다.
+        """
+        self.evict()
+
+        question_id = self._by_thread.get(thread_id)
+        if question_id is None:
+            return None
+
+        entry = self._questions[question_id]
+        entry[0] = time.monotonic()
+        self._questions.move_to_end(question_id)
+        return question_id, entry[1]
+
+    async def fetch_by_thread(self, thread_id):
+        """get_by_thread()와 같지만 메모리에 없으면 DB에서 찾아 캐시에 추가"""
+        found = self.get_by_thread(thread_id)
+        if found is not None or self.db is None:
+            return found
+
+        now = time.monotonic()
+        checked_at = self._unknown_threads.get(thread_id)
+        if checked_at is not None and now - checked_at < self.unknown_ttl:
+            return None
+
+        row = await asyncio.to_thread(
+            self.db.load_question_by_thread, thread_id, self.ttl
+        )
+        if row is None:
+            self._unknown_threads[thread_id] = now
+            self._unknown_threads.move_to_end(thread_id)
+            while len(self._unknown_threads) > self.max_size:
+                self._unknown_threads.popitem(last=False)
+            return None
+
+        question_id, info, _ = row
+        self._unknown_threads.pop(thread_id, None)
+        self.add(question_id, info)
+        return question_id, info
+
+    def remove(self, question_id):
+        """질문 제거"""
+        entry = self._questions.pop(question_id, None)
+        if entry is None:
+            return None
+
+        thread_id = entry[1].get("thread_id")
+        if self._by_thread.get(thread_id) == question_id:
+            del self._by_thread[thread_id]
+        return entry[1]
+
+    def remove_thread(self, thread_id):
+        """스레드에 연결된 질문 제거 (스레드 보관/삭제 시)"""
+        if self.db is not None:
+            self.db.close_thread(thread_id)
+
+        question_id = self._by_thread.get(thread_id)
+        if question_id is None:
+            return None
+        return self.remove(question_id)
+
+    def evict(self):
+        """만료되었거나 최대 개수를 넘는 질문 제거, 제거한 개수 반환
+
+        활동 순으로 정렬되어 있으므로 앞쪽만 확인하면 됩니다.
+        """
+        deadline = time.monotonic() - self.ttl
+        evicted = 0
+
+        while self._questions:
+            question_id, (last_active, _) = next(iter(self._questions.items()))
+            if last_active > deadline and len(self._questions) <= self.max_size:
+                break
+            self.remove(question_id)
+            evicted += 1
+
+        return evicted
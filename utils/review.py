@@ -0,0 +1,153 @@
+import heapq
+import itertools
+import time
+
+DAY = 86400
+
+# 피드백 등급 -> SM-2 응답 품질 (0~5)
+QUALITY = {"good": 5, "partial": 3, "retry": 1}
+
+
+def sm2(quality, ease, interval, reps):
+    """SM-2 알고리즘으로 (ease, 다음 간격(일), 반복 횟수) 계산"""
+    if quality < 3:
+        reps = 0
+        interval = 1
+    else:
+        reps += 1
+        if reps == 1:
+            interval = 1
+        elif reps == 2:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+
+    ease = max(1.3, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return ease, interval, reps
+
+
+class ReviewScheduler:
+    """사용자별 간격 반복(SM-2) 복습 스케줄러
+
+    ⚠️/❌ 평가를 받은 질문을 복습 항목으로 등록하고, 이후 답변 평가에 따라
+    다음 복습 시각을 조정합니다. 사용자마다 (복습 시각, 순번, 질문) 힙을 두어
+    다음 복습 항목 조회가 O(log n)입니다. 갱신된 항목의 이전 힙 항목은
+    꺼낼 때 버립니다(lazy deletion).
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._items = {}  # (user_id, 질문) -> 항목 dict
+        self._heaps = {}  # user_id -> [(due, seq, 질문), ...]
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._items)
+
+    def restore(self):
+        """DB의 복습 항목으로 인덱스 재구성, 불러온 개수 반환 (블로킹)"""
+        rows = self.db.load_review_items()
+        for row in rows:
+            self._put(row)
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+        return len(rows)
+
+    def load_user(self, user_id, rows):
+        """한 사용자의 복습 항목을 DB 행으로 갱신
+
+        여러 프로세스(샤드)가 DB를 공유할 때 다른 프로세스에서 갱신된 항목을
+        반영하기 위해 사용합니다. 복습 항목은 지우지 않으므로 DB에 아직 없는 항목은
+        커밋 전의 새 항목으로 보고 메모리의 값을 유지합니다.
+        """
+        items = {key: item for key, item in self._items.items() if key[0] == user_id}
+        for row in rows:
+            items[(user_id, row["question"])] = dict(row)
+
+        for key in [key for key in self._items if key[0] == user_id]:
+            del self._items[key]
+        self._heaps[user_id] = []
+        for item in items.values():
+            self._put(item)
+        heapq.heapify(self._heaps[user_id])
+
+    def _put(self, item, push=False):
+        self._items[(item["user_id"], item["question"])] = item
+        heap = self._heaps.setdefault(item["user_id"], [])
+        entry = (item["due"], next(self._seq), item["question"])
+        if push:
+            heapq.heappush(heap, entry)
+        else:
+            heap.append(entry)
+
+    def record(self, user_id, q_info, grade, now=None):
+        """답변 평가 반영, 등록/갱신된 항목 반환
+
+        처음 보는 질문은 ⚠️/❌ 평가일 때만 복습 항목으로 등록합니다.
+        """
+        if grade not in QUALITY:
+            return None
+
+        question = q_info["question"]
+        item = self._items.get((user_id, question))
+        if item is None:
+            if grade == "good":
+                return None
+            item = {
+                "user_id": user_id,
+                "question": question,
+                "category": q_info.get("category"),
+                "sub_category": q_info.get("sub_category"),
+                "ease": 2.5,
+                "interval": 0,
+                "reps": 0,
+            }
+
+        item["ease"], item["interval"], item["reps"] = sm2(
+            QUALITY[grade], item["ease"], item["interval"], item["reps"]
+        )
+        item["due"] = (now or time.time()) + item["interval"] * DAY
+        self._put(item, push=True)
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO review_items (user_id, question, category, "
+            "sub_category, ease, interval, reps, due) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                user_id,
+                question,
+                item["category"],
+                item["sub_category"],
+                item["ease"],
+                item["interval"],
+                item["reps"],
+                item["due"],
+            ),
+        )
+        return item
+
+    def peek(self, user_id):
+        """사용자의 가장 이른 복습 항목 반환 (아직 때가 안 됐어도), 없으면 None"""
+        heap = self._heaps.get(user_id)
+        while heap:
+            due, _, question = heap[0]
+            item = self._items.get((user_id, question))
+            if item is not None and item["due"] == due:
+                return item
+            heapq.heappop(heap)  # 갱신되어 무효가 된 항목
+        return None
+
+    def next_due(self, user_id, now=None):
+        """지금 복습할 항목 반환, 없으면 None"""
+        item = self.peek(user_id)
+        if item is None or item["due"] > (now or time.time()):
+            return None
+        return item
+
+    def due_count(self, user_id, now=None):
+        """지금 복습할 항목 수"""
+        now = now or time.time()
+        return sum(
+            1
+            for due, _, question in self._heaps.get(user_id, [])
+            if due <= now and self._items.get((user_id, question), {}).get("due") == due
+        )
@@ -0,0 +1,138 @@
+import json
+import os
+
+from utils.bedrock import DEFAULT_MODEL_ID
+from utils.metrics import metrics
+
+# 프롬프트 템플릿 (Study.build_feedback_prompt가 해석)
+TEMPLATES = ("full", "rubric", "short")
+
+# 경로 조건: 답변 글자 수 범위, 대기열에 쌓인 답변 수, 카테고리, 채점 기준 유무
+CONDITIONS = ("min_chars", "max_chars", "min_queue", "categories", "rubric")
+
+
+def default_routes():
+    """기본 경로 표 (위에서부터 처음 맞는 경로 사용, 마지막은 조건 없는 기본 경로)
+
+    FEEDBACK_MODEL_ID / FEEDBACK_FAST_MODEL_ID로 두 등급의 모델을 바꿀 수 있습니다.
+    """
+    model = os.getenv("FEEDBACK_MODEL_ID") or DEFAULT_MODEL_ID
+    fast_model = os.getenv("FEEDBACK_FAST_MODEL_ID") or DEFAULT_MODEL_ID
+    return [
+        # 대기열이 밀리면 품질보다 지연을 우선 (짧은 응답)
+        {
+            "name": "busy",
+            "when": {"min_queue": 20},
+            "model": fast_model,
+            "max_tokens": 200,
+            "template": "short",
+        },
+        # 한두 줄짜리 답변에는 긴 피드백이 필요 없음
+        {
+            "name": "short_answer",
+            "when": {"max_chars": 80},
+            "model": fast_model,
+            "max_tokens": 250,
+            "template": "short",
+        },
+        # 미리 생성한 채점 기준이 있으면 평가만 요청
+        {
+            "name": "rubric",
+            "when": {"rubric": True},
+            "model": model,
+            "max_tokens": 300,
+            "template": "rubric",
+        },
+        {"name": "default", "model": model, "max_tokens": 500, "template": "full"},
+    ]
+
+
+def validate_routes(routes):
+    """경로 표 형식 검사, 오류 메시지 목록 반환"""
+    if not isinstance(routes, list) or not routes:
+        return ["경로 표는 비어 있지 않은 목록이어야 합니다."]
+
+    errors = []
+    for i, route in enumerate(routes):
+        name = route.get("name", f"#{i}") if isinstance(route, dict) else f"#{i}"
+        if not isinstance(route, dict):
+            errors.append(f"{name}: 경로는 객체여야 합니다.")
+            continue
+        if not isinstance(route.get("name"), str) or not route["name"]:
+            errors.append(f"{name}: name이 필요합니다.")
+        if not isinstance(route.get("model"), str) or not route["model"]:
+            errors.append(f"{name}: model이 필요합니다.")
+        if not isinstance(route.get("max_tokens"), int) or route["max_tokens"] <= 0:
+            errors.append(f"{name}: max_tokens는 양의 정수여야 합니다.")
+        if route.get("template", "full") not in TEMPLATES:
+            errors.append(
+                f"{name}: template은 {', '.join(TEMPLATES)} 중 하나여야 합니다."
+            )
+        unknown = set(route.get("when", {})) - set(CONDITIONS)
+        if unknown:
+            errors.append(f"{name}: 알 수 없는 조건 {', '.join(sorted(unknown))}")
+
+    if isinstance(routes[-1], dict) and routes[-1].get("when"):
+        errors.append("마지막 경로는 조건 없는 기본 경로여야 합니다.")
+    return errors
+
+
+def load_routes(path):
+    """JSON 파일에서 경로 표 읽기 (형식이 잘못되었으면 ValueError)"""
+    with open(path, encoding="utf-8") as f:
+        routes = json.load(f)
+    errors = validate_routes(routes)
+    if errors:
+        raise ValueError("\n".join(errors))
+    return routes
+
+
+class ModelRouter:
+    """답변 길이/카테고리/대기열 길이에 따라 피드백 모델, 응답 토큰 한도, 템플릿 선택
+
+    경로 표는 FEEDBACK_ROUTES에 지정한 JSON 파일(없으면 default_routes())에서 읽고,
+    위에서부터 조건이 모두 맞는 첫 경로를 사용합니다. 경로별 선택 횟수는
+    feedback_route_total 메트릭으로, 지연 시간은 study_feedback_seconds의 route 라벨로
+    기록되므로 부하에 따라 품질과 지연을 조정할 근거로 쓸 수 있습니다.
+    """
+
+    def __init__(self, routes=None):
+        if routes is None:
+            path = os.getenv("FEEDBACK_ROUTES")
+            routes = load_routes(path) if path else default_routes()
+        else:
+            errors = validate_routes(routes)
+            if errors:
+                raise ValueError("\n".join(errors))
+        self.routes = routes
+
+    def matches(self, route, chars, category, queue_depth, has_rubric):
+        when = route.get("when", {})
+        if chars < when.get("min_chars", 0):
+            return False
+        if "max_chars" in when and chars > when["max_chars"]:
+            return False
+        if queue_depth < when.get("min_queue", 0):
+            return False
+        if "categories" in when and category not in when["categories"]:
+            return False
+        if "rubric" in when and has_rubric != when["rubric"]:
+            return False
+        return True
+
+    def cacheable(self, route):
+        """이 경로의 피드백을 캐시해도 되는지
+
+        대기열 길이(min_queue)로 고른 경로는 부하 때문에 줄인 피드백이므로, 한가할 때
+        같은 답변에 다시 쓰이지 않도록 캐시하지 않습니다.
+        """
+        return "min_queue" not in route.get("when", {})
+
+    def select(self, answer, category=None, queue_depth=0, has_rubric=False):
+        """조건이 맞는 첫 경로 (마지막 기본 경로는 항상 맞음)"""
+        chars = len(answer.strip())
+        for route in self.routes:
+            if self.matches(route, chars, category, queue_depth, has_rubric):
+                break
+        metrics.inc("feedback_route_total", route=route["name"])
+        return route
@@ -0,0 +1,191 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# 일일 질문 Day 1 날짜 (경과 일수가 카테고리별 질문 인덱스)
+START_DATE = datetime(2025, 7, 20)
+
+
+class DailyScheduler:
+    """벽시계 기준으로 매일 정해진 시각에 작업을 실행하는 스케줄러
+
+    - 시간대(DST 포함)를 반영해 매번 다음 실행 시각을 새로 계산하므로 지연이 누적되지 않음
+    - 실행 키(작업 키 + 현지 날짜)를 DB에 먼저 기록한 뒤 실행하므로
+      재시작이나 수동 실행과 겹쳐도 하루에 한 번만 실행됨
+    - 봇이 꺼져 있어 놓친 실행은 catch_up 시간 안이면 시작 직후 보충 실행
+    - 가장 가까운 실행 시각까지만 대기하고, 일정이 바뀌면 바로 깨어나 다시 계산
+    - 같은 시각에 실행할 작업들은 최대 concurrency개씩 동시에 실행
+    - can_run이 거절한 작업(재연결 직후 채널 캐시 전 등)은 catch_up 시간 동안
+      retry_interval초마다 다시 확인
+    """
+
+    def __init__(
+        self,
+        db,
+        callback,
+        catch_up=None,
+        concurrency=None,
+        can_run=None,
+        retry_interval=60,
+    ):
+        self.db = db
+        self.callback = callback  # async callback(key, job, run_date)
+        # 이 프로세스가 실행할 수 있는 작업인지 (샤드 모드에서 다른 샤드의 채널 제외)
+        self.can_run = can_run
+        self.catch_up = timedelta(
+            hours=catch_up or float(os.getenv("DAILY_CATCH_UP_HOURS", "12"))
+        )
+
+        self.concurrency = concurrency or int(
+            os.getenv("DAILY_FANOUT_CONCURRENCY", "10")
+        )
+        self.retry_interval = retry_interval
+
+        self.jobs = {}  # key -> {"hour", "minute", "tz", ...}
+        self._claimed = set()  # 이 프로세스에서 이미 처리한 실행 키
+        self._wakeup = None
+        self._task = None
+
+    def add_job(self, key, hour, minute, tz_name, **payload):
+        """작업 등록 (같은 키가 있으면 교체)"""
+        self.jobs[key] = {
+            "hour": hour,
+            "minute": minute,
+            "tz": ZoneInfo(tz_name),
+            **payload,
+        }
+        self._wake()
+
+    def remove_job(self, key):
+        """작업 제거"""
+        job = self.jobs.pop(key, None)
+        self._wake()
+        return job
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def local_date(self, job, now=None):
+        """작업 시간대 기준 오늘 날짜"""
+        now = now or datetime.now(timezone.utc)
+        return now.astimezone(job["tz"]).date()
+
+    def occurrence(self, job, day):
+        """작업 시간대 기준 해당 날짜의 실행 시각"""
+        return datetime(
+            day.year, day.month, day.day, job["hour"], job["minute"], tzinfo=job["tz"]
+        )
+
+    def next_run(self, key, now=None):
+        """다음 실행 시각"""
+        job = self.jobs[key]
+        now = now or datetime.now(timezone.utc)
+        day = self.local_date(job, now)
+        run_at = self.occurrence(job, day)
+        if run_at <= now:
+            run_at = self.occurrence(job, day + timedelta(days=1))
+        return run_at
+
+    def run_key(self, key, day):
+        """하루 한 번 실행을 보장하는 실행 키"""
+        return f"{key}:{day.isoformat()}"
+
+    async def claim(self, key, day):
+        """실행 키 선점, 이미 실행되었으면 False"""
+        run_key = self.run_key(key, day)
+        if run_key in self._claimed:
+            return False
+
+        claimed = await asyncio.to_thread(self.db.claim_run, run_key)
+        self._claimed.add(run_key)
+        return claimed
+
+    def pending_runs(self, now):
+        """catch_up 시간 안에 있고 아직 처리하지 않은 (작업 키, 현지 날짜) 목록
+
+        자정 직후에는 전날 늦은 시각의 실행도 catch_up 시간 안일 수 있으므로, 오늘과
+        어제 중 이미 지난 가장 최근 실행 시각을 확인합니다.
+        """
+        pending = []
+        for key, job in self.jobs.items():
+            today = self.local_date(job, now)
+            for day in (today, today - timedelta(days=1)):
+                run_at = self.occurrence(job, day)
+                if run_at > now:
+                    continue
+                if now < run_at + self.catch_up:
+                    if self.run_key(key, day) not in self._claimed:
+                        pending.append((key, day))
+                break
+        return pending
+
+    def due_runs(self, now):
+        """지금 실행해야 하는 (작업 키, 현지 날짜) 목록"""
+        return [
+            (key, day)
+            for key, day in self.pending_runs(now)
+            if self.can_run is None or self.can_run(self.jobs[key])
+        ]
+
+    async def run_job(self, key, day, semaphore=None):
+        """실행 키를 선점한 경우에만 작업 실행"""
+        if not await self.claim(key, day):
+            return False
+
+        try:
+            if semaphore is None:
+                await self.callback(key, self.jobs[key], day)
+            else:
+                async with semaphore:
+                    await self.callback(key, self.jobs[key], day)
+        except Exception as e:
+            print(f"❌ 스케줄 작업 오류 ({key}): {e}")
+        return True
+
+    def start(self, wait_ready=None):
+        """스케줄러 시작 (wait_ready가 있으면 먼저 기다림)"""
+        self._task = asyncio.create_task(self._run(wait_ready))
+
+    def stop(self):
+        """스케줄러 중지"""
+        if self._task is not None:
+            self._task.cancel()
+
+    def is_running(self):
+        return self._task is not None and not self._task.done()
+
+    async def _run(self, wait_ready):
+        self._wakeup = asyncio.Event()
+        if wait_ready is not None:
+            await wait_ready()
+
+        while True:
+            # 실행할 작업들을 동시에 실행 (채널이 많아도 한꺼번에 끝나도록)
+            now = datetime.now(timezone.utc)
+            due = self.due_runs(now)
+            if due:
+                semaphore = asyncio.Semaphore(self.concurrency)
+                await asyncio.gather(
+                    *(self.run_job(key, day, semaphore) for key, day in due)
+                )
+
+            # 가장 가까운 실행 시각까지 대기 (일정이 바뀌면 즉시 깨어남)
+            self._wakeup.clear()
+            now = datetime.now(timezone.utc)
+            timeout = None
+            if self.jobs:
+                next_at = min(self.next_run(key, now) for key in self.jobs)
+                timeout = max((next_at - now).total_seconds(), 0)
+            if self.pending_runs(now):
+                # 지금은 실행할 수 없던 작업을 catch_up 시간 안에 다시 확인
+                timeout = (
+                    self.retry_interval
+                    if timeout is None
+                    else min(timeout, self.retry_interval)
+                )
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
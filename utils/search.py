@@ -0,0 +1,91 @@
+import heapq
+import math
+import re
+from array import array
+from collections import defaultdict
+
+# 한글 연속 구간과 영문/숫자 연속 구간 (조사가 붙은 "React에서"도 둘로 나뉨)
+_TERM_RUNS = re.compile(r"[가-힣]+|[0-9a-z]+")
+
+
+def search_terms(text):
+    """검색어 목록 (한글은 글자 bigram, 영문/숫자는 단어, 중복 제거·등장 순서 유지)
+
+    한글은 형태소 분석 없이 두 글자 조각으로 나눠 "인덱스를"과 "인덱스"가 같은 조각으로
+    맞도록 하고, 한 글자짜리 한글 구간은 그대로 사용합니다.
+    """
+    terms = {}
+    for run in _TERM_RUNS.findall(text.lower()):
+        if "가" <= run[0] <= "힣" and len(run) > 1:
+            for i in range(len(run) - 1):
+                terms.setdefault(run[i : i + 2], None)
+        else:
+            terms.setdefault(run, None)
+    return list(terms)
+
+
+class QuestionSearch:
+    """질문 은행 전체에 대한 역색인 (검색어 -> 질문 번호 배열)
+
+    QuestionIndex의 전체 질문 번호를 그대로 쓰므로 검색 결과 번호로 바로 질문을 꺼낼 수
+    있습니다. 질문 파일을 읽을 때 한 번만 만들고, 검색은 검색어별 게시 목록만 훑어
+    IDF 가중치 합으로 순위를 매깁니다.
+    """
+
+    # 검색어 IDF 가중치 합의 이 비율 이상이 맞아야 결과에 포함
+    MIN_MATCH = 0.5
+
+    def __init__(self, index):
+        self.index = index
+        postings = defaultdict(lambda: array("I"))
+        for question_id, question in enumerate(index.questions):
+            for term in search_terms(question):
+                postings[term].append(question_id)  # 질문 번호 순서로 추가됨
+
+        total = len(index.questions)
+        self.postings = dict(postings)
+        self.idf = {
+            term: math.log((1 + total) / (1 + len(ids))) + 1
+            for term, ids in self.postings.items()
+        }
+
+    def __len__(self):
+        return len(self.postings)
+
+    def search(self, query, category=None, limit=10):
+        """검색어가 많이 맞는 순서대로 질문 정보 목록 반환 (같은 점수면 짧은 질문 먼저)"""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        start, end = self.index.ranges.get(category, (0, len(self.index)))
+
+        # 질문에 없는 검색어도 분모에 넣어 엉뚱한 결과가 올라오지 않게 함
+        total_weight = sum(self.idf.get(term, 1.0) for term in terms)
+        scores = defaultdict(float)
+        for term in terms:
+            weight = self.idf.get(term)
+            if weight is None:
+                continue
+            for question_id in self.postings[term]:
+                if start <= question_id < end:
+                    scores[question_id] += weight
+
+        threshold = total_weight * self.MIN_MATCH
+        questions = self.index.questions
+        ranked = heapq.nsmallest(
+            limit,
+            (
+                question_id
+                for question_id, score in scores.items()
+                if score >= threshold
+            ),
+            key=lambda question_id: (
+                -scores[question_id],
+                len(questions[question_id]),
+                question_id,
+            ),
+        )
+        return [
+            dict(self.index.get(question_id), score=scores[question_id] / total_weight)
+            for question_id in ranked
+        ]
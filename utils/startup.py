@@ -0,0 +1,47 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """봇 시작 단계별 소요 시간 기록
+
+    단계마다 걸린 시간과 시작 후 경과 시간을 출력하고,
+    summary()로 전체 단계 요약을 돌려줍니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []
+
+    def elapsed(self):
+        """시작 후 경과 시간(초)"""
+        return time.perf_counter() - self.started
+
+    def record(self, name, duration):
+        """단계 소요 시간 기록 및 출력"""
+        self.phases.append((name, duration))
+        print(f"⏱️ {name}: {duration * 1000:.0f}ms (시작 후 {self.elapsed():.2f}s)")
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록 실행 시간을 한 단계로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def mark(self, name):
+        """시작 시점부터 지금까지를 한 단계로 기록
+
+        재연결 때마다 다시 불리는 on_ready 등을 위해 같은 이름은 한 번만 기록합니다.
+        """
+        if any(phase == name for phase, _ in self.phases):
+            return
+        self.record(name, self.elapsed())
+
+    def summary(self):
+        """단계별 소요 시간 요약 문자열"""
+        lines = [f"{name}: {duration * 1000:.0f}ms" for name, duration in self.phases]
+        lines.append(f"전체: {self.elapsed():.2f}s")
+        return "\n".join(lines)
@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+# 피드백 평가 이모지 -> 통계 컬럼
+GRADES = {"✅": "good", "⚠️": "partial", "❌": "retry"}
+
+
+def parse_grade(feedback):
+    """피드백에서 가장 먼저 나오는 평가 이모지의 등급 반환, 없으면 None"""
+    found = [(feedback.find(emoji), grade) for emoji, grade in GRADES.items()]
+    found = [(pos, grade) for pos, grade in found if pos >= 0]
+    return min(found)[1] if found else None
+
+
+class StudyStats:
+    """답변할 때마다 증분 갱신되는 사용자별 학습 통계
+
+    전체 답변 이력을 다시 읽지 않고 사용자별 집계 행만 갱신/조회하므로
+    답변이 아무리 쌓여도 조회 비용이 일정합니다.
+    갱신은 StudyDatabase의 배치 쓰기로, 조회는 asyncio.to_thread()에서 실행합니다.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def record(self, user_id, category, sub_category, feedback, is_first, day=None):
+        """답변 하나를 집계에 반영"""
+        day = day or date.today()
+        grade = parse_grade(feedback)
+        yesterday = (day - timedelta(days=1)).isoformat()
+
+        # 같은 날 답변은 연속 일수 유지, 어제 답변했으면 +1, 아니면 1부터 다시
+        streak = (
+            "CASE WHEN last_answer_date = excluded.last_answer_date "
+            "THEN current_streak WHEN last_answer_date = ? "
+            "THEN current_streak + 1 ELSE 1 END"
+        )
+        self.db.execute(
+            "INSERT INTO user_stats (user_id, total_answers, first_answers, "
+            "good, partial, retry, current_streak, best_streak, last_answer_date) "
+            "VALUES (?, 1, ?, ?, ?, ?, 1, 1, ?) "
+            "ON CONFLICT (user_id) DO UPDATE SET "
+            "total_answers = total_answers + 1, "
+            "first_answers = first_answers + excluded.first_answers, "
+            "good = good + excluded.good, "
+            "partial = partial + excluded.partial, "
+            "retry = retry + excluded.retry, "
+            f"best_streak = MAX(best_streak, {streak}), "
+            f"current_streak = {streak}, "
+            "last_answer_date = excluded.last_answer_date",
+            (
+                user_id,
+                int(is_first),
+                int(grade == "good"),
+                int(grade == "partial"),
+                int(grade == "retry"),
+                day.isoformat(),
+                yesterday,
+                yesterday,
+            ),
+        )
+        self.db.execute(
+            "INSERT INTO user_category_stats (user_id, category, sub_category, "
+            "answers) VALUES (?, ?, ?, 1) "
+            "ON CONFLICT (user_id, category, sub_category) DO UPDATE SET "
+            "answers = answers + 1",
+            (user_id, category or "unknown", sub_category or "unknown"),
+        )
+
+    def get(self, user_id):
+        """사용자 통계 반환, 기록이 없으면 None (블로킹)"""
+        row = self.db.fetchone("SELECT * FROM user_stats WHERE user_id = ?", (user_id,))
+        if row is None:
+            return None
+
+        stats = dict(row)
+        # 어제 이후로 답변이 없으면 연속 기록은 끊긴 것
+        last = date.fromisoformat(stats["last_answer_date"])
+        if last < date.today() - timedelta(days=1):
+            stats["current_streak"] = 0
+
+        stats["categories"] = [
+            tuple(r)
+            for r in self.db.fetchall(
+                "SELECT category, sub_category, answers FROM user_category_stats "
+                "WHERE user_id = ? ORDER BY answers DESC",
+                (user_id,),
+            )
+        ]
+        return stats
+
+    def leaderboard(self, limit=10):
+        """답변 수 기준 상위 사용자 [(user_id, 답변 수, 최고 연속 일수), ...] (블로킹)"""
+        rows = self.db.fetchall(
+            "SELECT user_id, total_answers, best_streak FROM user_stats "
+            "ORDER BY total_answers DESC LIMIT ?",
+            (limit,),
+        )
+        return [tuple(r) for r in rows]
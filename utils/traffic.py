@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import discord
+
+# 그대로 남겨도 되는 명령 인자 (카테고리, 시각, 시간대, 숫자 등)
+_SAFE_TOKEN = re.compile(r"^[A-Za-z0-9:/_+-]{1,20}$")
+
+# 익명화한 본문을 채울 글자 (한글 답변이 많으므로 한글 음절 위주)
+_FILLER = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+
+def anonymize_text(text, salt):
+    """같은 원문은 같은 결과가 되도록, 길이와 공백 위치만 남기고 내용을 바꿈
+
+    피드백 캐시 적중이나 답변 길이에 따른 동작은 재현되지만 원문은 복원할 수 없습니다.
+    """
+    digest = hashlib.sha256(salt + text.encode("utf-8")).digest()
+    result = []
+    for i, char in enumerate(text):
+        if char.isspace():
+            result.append(char)
+        else:
+            result.append(_FILLER[(digest[i % len(digest)] + i) % len(_FILLER)])
+    return "".join(result)
+
+
+def anonymize_command(content, salt):
+    """명령 이름과 안전한 인자는 그대로 두고 나머지 인자만 익명화"""
+    name, _, rest = content.partition(" ")
+    tokens = [
+        token if _SAFE_TOKEN.match(token) else anonymize_text(token, salt)
+        for token in rest.split(" ")
+        if token
+    ]
+    return " ".join([name] + tokens)
+
+
+class TrafficRecorder:
+    """봇이 받은 메시지/스레드 이벤트를 익명화해 JSONL로 기록
+
+    사용자/채널/스레드 ID는 기록마다 새로 매기는 번호로 바꾸고, 메시지 본문은
+    anonymize_text()로 바꿔서 저장합니다. 각 줄은 기록 시작 후 경과 시간(t, 초)을 가집니다.
+    benchmarks/replay.py로 같은 흐름을 가짜 Discord/Bedrock 위에서 재생할 수 있습니다.
+    이벤트 루프에서는 버퍼에 모으기만 하고, flush_interval초마다 워커 스레드에서 씁니다.
+    """
+
+    def __init__(self, path, bot, prefix="!", flush_interval=1.0):
+        self.path = path
+        self.bot = bot
+        self.prefix = prefix
+        self.flush_interval = flush_interval
+        self.started = time.monotonic()
+        self._salt = os.urandom(16)  # 저장하지 않으므로 원래 ID/본문을 되돌릴 수 없음
+        self._aliases = {"user": {}, "channel": {}}
+        self._file = None
+        self._buffer = []
+        self._file_lock = threading.Lock()
+        self._task = None
+
+    def alias(self, kind, object_id):
+        """실제 ID 대신 기록에 쓸 번호"""
+        aliases = self._aliases[kind]
+        if object_id not in aliases:
+            aliases[object_id] = len(aliases) + 1
+        return aliases[object_id]
+
+    def attach(self):
+        """봇 이벤트 리스너 등록 및 기록 파일 열기"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.started = time.monotonic()
+        self.write({"type": "start", "prefix": self.prefix})
+        self._task = asyncio.create_task(self._flush_loop())
+
+        self.bot.add_listener(self.on_message, "on_message")
+        self.bot.add_listener(self.on_thread_create, "on_thread_create")
+        self.bot.add_listener(self.on_thread_update, "on_thread_update")
+        self.bot.add_listener(self.on_thread_delete, "on_thread_delete")
+        self.bot.add_listener(self.on_daily_questions, "on_daily_questions")
+        print(f"🎙️ 트래픽을 기록합니다: {self.path}")
+
+    def close(self):
+        """남은 이벤트를 모두 쓰고 파일 닫기"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._write_lines(self._take_buffer())
+        with self._file_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def write(self, event):
+        if self._file is None:
+            return
+        event["t"] = round(time.monotonic() - self.started, 3)
+        self._buffer.append(
+            json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+        )
+
+    def _take_buffer(self):
+        lines, self._buffer = self._buffer, []
+        return lines
+
+    def _write_lines(self, lines):
+        with self._file_lock:
+            if self._file is None or not lines:
+                return
+            self._file.writelines(lines)
+            self._file.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            lines = self._take_buffer()
+            if lines:
+                await asyncio.to_thread(self._write_lines, lines)
+
+    def _is_bot_thread(self, channel):
+        return (
+            isinstance(channel, discord.Thread) and channel.owner_id == self.bot.user.id
+        )
+
+    async def on_message(self, message):
+        if message.author.bot or message.guild is None:
+            return
+
+        # 봇이 만든 질문 스레드와 일반 채널의 메시지만 기록
+        channel = message.channel
+        in_thread = isinstance(channel, discord.Thread)
+        if in_thread and not self._is_bot_thread(channel):
+            return
+
+        content = message.content
+        if content.startswith(self.prefix):
+            content = anonymize_command(content, self._salt)
+        else:
+            content = anonymize_text(content, self._salt)
+
+        self.write(
+            {
+                "type": "message",
+                "user": self.alias("user", message.author.id),
+                "channel": self.alias("channel", channel.id),
+                "thread": in_thread,
+                "content": content,
+            }
+        )
+
+    async def on_thread_create(self, thread):
+        if not self._is_bot_thread(thread):
+            return
+        self.write(
+            {
+                "type": "thread",
+                "thread": self.alias("channel", thread.id),
+                "parent": self.alias("channel", thread.parent_id),
+            }
+        )
+
+    async def on_thread_update(self, before, after):
+        if after.archived and not before.archived and self._is_bot_thread(after):
+            self.write(
+                {"type": "thread_archive", "thread": self.alias("channel", after.id)}
+            )
+
+    async def on_thread_delete(self, thread):
+        if self._is_bot_thread(thread):
+            self.write(
+                {"type": "thread_delete", "thread": self.alias("channel", thread.id)}
+            )
+
+    async def on_daily_questions(self, channel, run_date):
+        """Study Cog이 일일 질문을 게시하기 시작할 때 발생하는 이벤트"""
+        self.write(
+            {
+                "type": "daily",
+                "channel": self.alias("channel", channel.id),
+                "date": run_date.isoformat(),
+            }
+        )
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from utils.metrics import metrics
+
+_ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+
+
+class LoopWatchdog:
+    """이벤트 루프 멈춤 감시
+
+    루프 스레드에서 interval초마다 하트비트를 갱신하고, 별도 감시 스레드가
+    하트비트가 threshold초 넘게 늦어지면 그 순간 루프 스레드의 스택을 캡처합니다.
+    루프가 다시 돌아오면 멈춘 시간과 스택을 보고서로 남기고 출력합니다.
+    """
+
+    def __init__(self, threshold=None, interval=None, max_reports=None):
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else float(os.getenv("WATCHDOG_THRESHOLD", "0.5"))
+        )
+        self.interval = interval or float(os.getenv("WATCHDOG_INTERVAL", "0.1"))
+        self.reports = deque(
+            maxlen=max_reports or int(os.getenv("WATCHDOG_MAX_REPORTS", "20"))
+        )
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._loop = None
+        self._loop_thread_id = None
+        self._last_beat = 0.0
+        self._stall = None  # 진행 중인 멈춤 (스택 캡처 완료, 아직 끝나지 않음)
+        self._handle = None
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return self.threshold > 0
+
+    def start(self, loop=None):
+        """현재 스레드의 이벤트 루프 감시 시작 (루프 스레드에서 호출)"""
+        if not self.enabled or self._thread is not None:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._beat()
+
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+        self._thread = None
+
+    def _beat(self):
+        """루프 스레드에서 실행되는 하트비트 (멈춤이 끝났으면 보고서 기록)"""
+        now = time.monotonic()
+        with self._lock:
+            stall, self._stall = self._stall, None
+            last_beat, self._last_beat = self._last_beat, now
+
+        if stall is not None:
+            stall["duration"] = max(0.0, now - last_beat - self.interval)
+            self._report(stall)
+
+        if not self._stop.is_set():
+            self._handle = self._loop.call_later(self.interval, self._beat)
+
+    def _watch(self):
+        """감시 스레드: 하트비트가 늦어지면 루프 스레드의 스택 캡처"""
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                lag = time.monotonic() - self._last_beat - self.interval
+                if lag < self.threshold or self._stall is not None:
+                    continue
+                self._stall = self._capture()
+
+    def _capture(self):
+        """루프 스레드가 지금 실행 중인 코드의 스택과 현재 작업 이름"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        summary = traceback.extract_stack(frame) if frame is not None else []
+
+        # 이벤트 루프 내부 프레임은 빼고 봇 코드 위주로 남김
+        stack = traceback.format_list(
+            [entry for entry in summary if not entry.filename.startswith(_ASYNCIO_DIR)]
+        )
+
+        task_name = None
+        try:
+            task = asyncio.current_task(self._loop)
+            if task is not None:
+                coro = task.get_coro()
+                task_name = getattr(coro, "__qualname__", None) or repr(coro)
+        except Exception:
+            pass
+
+        return {
+            "at": datetime.now(),
+            "task": task_name,
+            "stack": stack,
+        }
+
+    def _report(self, stall):
+        self.reports.append(stall)
+        metrics.inc("event_loop_stalls_total")
+        metrics.observe("event_loop_stall_seconds", stall["duration"])
+        print(
+            f"🐢 이벤트 루프가 {stall['duration']:.2f}초 동안 멈췄습니다 "
+            f"(작업: {stall['task'] or '없음'})\n" + "".join(stall["stack"][-8:])
+        )
+
+
+def format_report(report, max_frames=8):
+    """보고서 하나를 사람이 읽기 쉬운 문자열로 변환 (스택은 안쪽 프레임만)"""
+    header = (
+        f"{report['at']:%Y-%m-%d %H:%M:%S} | {report['duration']:.2f}초 | "
+        f"작업: {report['task'] or '없음'}"
+    )
+    return header + "\n" + "".join(report["stack"][-max_frames:])